@@ -6,7 +6,7 @@
 
 # Python modules
 import numpy as np
-from numpy import inf, mean, copy, concatenate, empty, float64, dot
+from numpy import inf, mean, copy, concatenate, empty, ones, float64, dot
 from numpy.linalg import norm, pinv
 
 # Tensor Fox modules
@@ -84,9 +84,13 @@ def als(T, factors, R, options):
     gradients = empty(maxiter)
     best_factors = [copy(factors[l]) for l in range(L)]
 
-    # Compute unfoldings.
-    Tl = [cnv.unfold(T, l+1) for l in range(L)]
-    T1_approx = empty(Tl[0].shape, dtype=float64)
+    # Compute unfoldings. In the low memory mode only one copy of T is kept, and all contractions are made with it.
+    if options.low_memory:
+        Tl = np.ascontiguousarray(T)
+        T1_approx = []
+    else:
+        Tl = [cnv.unfold(T, l+1) for l in range(L)]
+        T1_approx = empty(Tl[0].shape, dtype=float64)
 
     if display > 1:
         if display == 4:
@@ -124,8 +128,11 @@ def als(T, factors, R, options):
                     factors[l] = copy(orig_factors[l])
                                           
         # Compute error.
-        T1_approx = cnv.cpd2unfold1(T1_approx, factors)
-        error = crt.fastnorm(Tl[0], T1_approx) / Tsize
+        if type(Tl) == list:
+            T1_approx = cnv.cpd2unfold1(T1_approx, factors)
+            error = crt.fastnorm(Tl[0], T1_approx) / Tsize
+        else:
+            error = cnv.residual_norm(Tl, factors) / Tsize
 
         # Update best solution.
         if error < best_error:
@@ -211,6 +218,20 @@ def als_iteration(Tl, factors, fix_mode):
     L = len(factors)
     R = factors[0].shape[1]
     dims = [factors[l].shape[0] for l in range(L)]
+
+    # Low memory mode, where Tl is the tensor itself. We use the identity pinv(M.T) = M * pinv(M.T * M), where M.T * M
+    # is the Hadamard product of the Gramians of the factors, so the Khatri-Rao products are never formed.
+    if type(Tl) != list:
+        for l in range(L):
+            if l == fix_mode:
+                continue
+            Gr = ones((R, R), dtype=float64)
+            for ll in range(L):
+                if ll != l:
+                    Gr *= dot(factors[ll].T, factors[ll])
+            factors[l] = dot(mlinalg.mttkrp(Tl, factors, l), pinv(Gr))
+
+        return factors
     
     # Main computations for the general case.
     if fix_mode == -1:
@@ -6,13 +6,16 @@
 """ 
 
 # Python modules
-from numpy import prod, diag, dot, argsort, array, size, inf, moveaxis, arange, ndarray
-from numpy.linalg import norm, pinv
+import numpy as np
+from numpy import prod, dot, argsort, array, size, inf, moveaxis, arange, ndarray, int64, float64
+from numpy.linalg import norm, pinv, eigh
 from numpy.random import randn
 import sys
+import os
+import tempfile
 import warnings
-import scipy.io
-from sklearn.utils.extmath import randomized_svd as rand_svd
+from copy import copy
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Tensor Fox modules
 import TensorFox.Critical as crt
@@ -26,10 +29,6 @@ def consistency(R, dims, options):
 
     L = len(dims)
 
-    # Check if order is not higher than 12.
-    if L > 12:
-        sys.exit('Tensor Fox does not work with tensors of order higher than 12.')
-
     # If some dimension is equal to 1, the user may just use classical SVD with numpy.
     # We won't address this situation here.
     for l in range(L):
@@ -67,6 +66,10 @@ def consistency(R, dims, options):
     if options.method != 'dGN' and options.method != 'als' and options.method != 'ttcpd':
         msg = "Wrong method name. Must be 'dGN', 'als' or 'ttcpd'."
         sys.exit(msg)
+
+    if options.tt_method != 'chain' and options.tt_method != 'parallel':
+        msg = "Wrong tt_method name. Must be 'chain' or 'parallel'."
+        sys.exit(msg)
         
     return
 
@@ -76,6 +79,8 @@ def tens2matlab(T, filename):
     This function creates a matlab file containing the tensor T. The parameter filename should be a string.
     """
     
+    import scipy.io
+
     # Save the tensor in matlab format.
     scipy.io.savemat(filename + '.mat', {filename: T})
     
@@ -98,6 +103,11 @@ def sort_dims(T):
             idxs[i, :] = idxs[i, ordering]
         T_sorted = [data, idxs, dims]
     
+    # Out-of-core tensor (np.memmap or HDF5 dataset). The axes are kept, so the blocks can be read contiguously.
+    elif is_ooc(T):
+        ordering = arange(len(T.shape))
+        T_sorted = T
+
     # Dense tensor.
     else:    
         dims = array(T.shape)
@@ -108,6 +118,46 @@ def sort_dims(T):
     return T_sorted, ordering
         
 
+def is_ooc(T):
+    """
+    Returns True if T is an out-of-core tensor, that is, a np.memmap, a HDF5 dataset or any other array-like object
+    which is not a ndarray. Dense tensors (ndarray and its subclasses other than np.memmap) and sparse tensors (lists)
+    return False.
+    """
+
+    if type(T) == list:
+        return False
+
+    return isinstance(T, np.memmap) or not isinstance(T, ndarray)
+
+
+def ooc_slabs(dims, mode, max_bytes):
+    """
+    Generator of the indexes of the slabs T[:, ..., :, k0:k1, :, ..., :] along the given mode (0 <= mode < L) of a 
+    tensor T with shape dims. Each slab has at most (about) max_bytes bytes, but at least one slice is given at each 
+    step. This is used to stream out-of-core tensors (np.memmap or HDF5 datasets) block by block.
+    """
+
+    slice_size = prod(dims, dtype=int64) // dims[mode]
+    step = max(1, int(max_bytes // (8*slice_size)))
+
+    for k in range(0, dims[mode], step):
+        yield tuple(slice(None) for l in range(mode)) + (slice(k, k+step),)
+
+
+def ooc_norm(T, max_bytes):
+    """
+    Computes the Frobenius norm of an out-of-core tensor T (np.memmap or HDF5 dataset), reading one slab at a time.
+    """
+
+    s = 0.0
+    for idx in ooc_slabs(T.shape, 0, max_bytes):
+        block = np.asarray(T[idx], dtype=float64)
+        s += np.sum(block**2)
+
+    return np.sqrt(s)
+
+
 def unsort_dims(factors, ordering):
     """
     Put the CPD factors to their original dimension ordering.
@@ -138,16 +188,21 @@ def output_info(T1, Tsize, T1_approx,
     else:
         num_steps = size(step_sizes_main)
 
-    if type(T1) == ndarray:
+    if isinstance(T1, ndarray) and not is_ooc(T1):
         rel_error = crt.fastnorm(T1, T1_approx)/Tsize
 
     # In the sparse case, the variable T1 is the triple T = [data, idxs, dims] and T1_approx is the variable factors.
     # We keep the original variable names used for the dense case but this distinction is important to know.
-    else:
+    elif type(T1) == list:
         data, idxs, dims = T1
         factors = T1_approx
         rel_error = crt.sparse_fastnorm(data, idxs, dims, factors)/Tsize
 
+    # In the out-of-core case, the variable T1 is the tensor T itself and T1_approx is the variable factors.
+    else:
+        factors = T1_approx
+        rel_error = tfx.cnv.residual_norm(T1, factors, options.max_bytes)/Tsize
+
     class output:
         def __init__(self):
             self.num_steps = num_steps
@@ -269,6 +324,15 @@ def make_options(options, L):
             self.display = 0
             self.epochs = 1
             self.gpu = False
+            self.low_memory = False
+            self.max_bytes = 2**27
+            self.mlsvd_max_bytes = inf
+            self.hooi_maxiter = 0
+            self.tucker = False
+            self.mixed_precision = False
+            self.tt_method = 'chain'
+            self.tt_refine_maxiter = 0
+            self.random_state = None
 
     temp_options = temp_options()
 
@@ -337,6 +401,29 @@ def make_options(options, L):
         temp_options.epochs = options.epochs
     if 'gpu' in dir(options):
         temp_options.gpu = options.gpu
+    if 'low_memory' in dir(options):
+        temp_options.low_memory = options.low_memory
+    if 'max_bytes' in dir(options):
+        temp_options.max_bytes = options.max_bytes
+    if 'mlsvd_max_bytes' in dir(options):
+        temp_options.mlsvd_max_bytes = options.mlsvd_max_bytes
+    if 'hooi_maxiter' in dir(options):
+        temp_options.hooi_maxiter = options.hooi_maxiter
+    if 'tucker' in dir(options):
+        temp_options.tucker = options.tucker
+    if 'mixed_precision' in dir(options):
+        temp_options.mixed_precision = options.mixed_precision
+    if 'tt_method' in dir(options):
+        temp_options.tt_method = options.tt_method
+    if 'tt_refine_maxiter' in dir(options):
+        temp_options.tt_refine_maxiter = options.tt_refine_maxiter
+    if 'random_state' in dir(options):
+        temp_options.random_state = options.random_state
+
+    # The random choices of the initialization and of the iterations are made with a generator. If random_state is
+    # None, the global generator of NumPy is used (see the functions which make the random choices).
+    if temp_options.random_state is not None and not isinstance(temp_options.random_state, np.random.RandomState):
+        temp_options.random_state = np.random.RandomState(temp_options.random_state)
 
     # If gpu is True, the variable mlsvd_method is set to 'gpu', which is a special strategy aiming to minimize the
     # memory size of the data passed to the GPU. This strategy is based on the classic MLSVD method. In the case the
@@ -348,18 +435,22 @@ def make_options(options, L):
     return temp_options
 
 
-def tt_core(V, dims, r1, r2, l):
+def tt_core(V, dims, r1, r2, l, mixed_precision=False, n_iter=2, tol=0):
     """
-    Computation of one core of the CPD Tensor Train function (cpdtt).
+    Computation of one core of the CPD Tensor Train function (cpdtt). Only the r2 dominant singular triplets of the 
+    reshaped V are needed, so they are computed with a truncated randomized SVD instead of a full SVD. The range
+    finder is made in a single block of r2 + 10 basis vectors, improved with n_iter power iterations, so V is read 
+    2*n_iter + 2 times. The singular values are then truncated with the same energy
+    criterion of the MLSVD with tolerance tol (see Compression.clean_compression), so the rank of the core can be
+    smaller than r2. The scaling of the rows of V by the singular values is made in place. If mixed_precision is True,
+    the range of V is computed with a float32 copy of V and only the projection onto this range is computed in float64
+    (see Compression.adaptive_rand_svd).
     """
 
     V = V.reshape(r1*dims[l], prod(dims[l+1:]), order='F')
-    low_rank = min(V.shape[0], V.shape[1])
-    U, S, V = rand_svd(V, low_rank, n_iter=0)
-    U = U[:, :r2]
-    S = diag(S)
-    V = dot(S, V)
-    V = V[:r2, :]
+    U, S, V = tfx.cmpr.adaptive_rand_svd(V, r2, 0, block_size=r2 + 10, n_iter=n_iter, mixed_precision=mixed_precision)
+    U, S, V, r2 = tfx.cmpr.clean_compression(U, S, V, tol, len(dims))
+    V *= S[:, None]
     if r1 == 1:
         g = U.reshape(dims[l], r2, order='F') 
     else:
@@ -367,50 +458,159 @@ def tt_core(V, dims, r1, r2, l):
     return V, g
 
 
-def tt_error(T, G, dims, L):
+def ooc_tt_core(V, dims, r1, r2, l, max_bytes, tol=0):
+    """
+    Out-of-core version of tt_core. V is a tensor with shape r1 x dims[l] x ... x dims[L-1] (just dims when r1 = 1),
+    given as a np.memmap or HDF5 dataset, and it is read in slabs along the mode of dims[l+1]. The first pass 
+    accumulates the Gram matrix of the r1*dims[l] x prod(dims[l+1:]) reshaping of V, whose r2 dominant eigenvectors 
+    give the core. The second pass projects each slab onto these vectors, which gives the next V with shape 
+    r2 x dims[l+1] x ... x dims[L-1]. The next V is kept in memory if it has at most max_bytes bytes, otherwise it is 
+    written to a temporary np.memmap. Since the Gram matrix squares the singular values, singular values smaller than
+    about 1e-8 times the largest one are not resolved. The rank r2 is truncated as in tt_core. When tol > 0, the
+    tolerance is at least the rounding error of the eigenvalues of the Gram matrix.
+    """
+
+    m = r1*dims[l]
+    mode = len(V.shape) - len(dims[l+1:])
+
+    # First pass: Gram matrix of the reshaped V.
+    gram = np.zeros((m, m), dtype=float64)
+    for idx in ooc_slabs(V.shape, mode, max_bytes):
+        block = np.asarray(V[idx], dtype=float64)
+        Vl = block.reshape(m, -1, order='F')
+        gram += dot(Vl, Vl.T)
+    eigvals, U = eigh(gram)
+    U = U[:, ::-1][:, :r2]
+    sigmas = np.sqrt(np.maximum(eigvals[::-1][:r2], 0))
+    if tol > 0:
+        tol = max(tol, len(dims) * m * np.finfo(float64).eps)
+    U, sigmas, Ut, r2 = tfx.cmpr.clean_compression(U, sigmas, U.T, tol, len(dims))
+
+    # Second pass: next V = U^T * V, computed slab by slab.
+    new_shape = (r2,) + tuple(dims[l+1:])
+    if 8*prod(new_shape, dtype=int64) <= max_bytes:
+        V_new = np.empty(new_shape, dtype=float64)
+    else:
+        V_new = np.memmap(tempfile.TemporaryFile(), dtype=float64, mode='w+', shape=new_shape)
+    for idx in ooc_slabs(V.shape, mode, max_bytes):
+        block = np.asarray(V[idx], dtype=float64)
+        Vl = block.reshape(m, -1, order='F')
+        V_new[:, idx[-1]] = dot(U.T, Vl).reshape((r2,) + block.shape[mode:], order='F')
+
+    if r1 == 1:
+        g = U.reshape(dims[l], r2, order='F')
+    else:
+        g = U.reshape(r1, dims[l], r2, order='F')
+    return V_new, g
+
+
+def tt_error(T, G, dims, L, max_bytes=2**27):
     """
     Given a tensor T and a computed CPD Tensor Train G = (G1,...,GL), this function computes the error between T and the 
-    tensor associated to G.
+    tensor associated to G. No tensor with the size of T is formed: the tensor of G is formed in slabs along the first
+    mode, and the intermediate contractions of each slab have at most (about) max_bytes bytes. Each slab is subtracted
+    from the corresponding slab of T, so the error is computed directly, with no cancellation between |T| and 
+    |T_approx|, and small errors are resolved up to the machine precision.
     """
 
-    if L == 3:
-        G0, G1, G2 = G
-        T_approx = crt.tt_error_order3(T, G0, G1, G2, dims, L)
-    if L == 4:
-        G0, G1, G2, G3 = G
-        T_approx = crt.tt_error_order4(T, G0, G1, G2, G3, dims, L)
-    if L == 5:
-        G0, G1, G2, G3, G4 = G
-        T_approx = crt.tt_error_order5(T, G0, G1, G2, G3, G4, dims, L)
-    if L == 6:
-        G0, G1, G2, G3, G4, G5 = G
-        T_approx = crt.tt_error_order6(T, G0, G1, G2, G3, G4, G5, dims, L)
-    if L == 7:
-        G0, G1, G2, G3, G4, G5, G6 = G
-        T_approx = crt.tt_error_order7(T, G0, G1, G2, G3, G4, G5, G6, dims, L)
-    if L == 8:
-        G0, G1, G2, G3, G4, G5, G6, G7 = G
-        T_approx = crt.tt_error_order8(T, G0, G1, G2, G3, G4, G5, G6, G7, dims, L)
-    if L == 9:
-        G0, G1, G2, G3, G4, G5, G6, G7, G8 = G
-        T_approx = crt.tt_error_order9(T, G0, G1, G2, G3, G4, G5, G6, G7, G8, dims, L)
-    if L == 10:
-        G0, G1, G2, G3, G4, G5, G6, G7, G8, G9 = G
-        T_approx = crt.tt_error_order10(T, G0, G1, G2, G3, G4, G5, G6, G7, G8, G9, dims, L)
-    if L == 11:
-        G0, G1, G2, G3, G4, G5, G6, G7, G8, G9, G10 = G
-        T_approx = crt.tt_error_order11(T, G0, G1, G2, G3, G4, G5, G6, G7, G8, G9, G10, dims, L)
-    if L == 12:
-        G0, G1, G2, G3, G4, G5, G6, G7, G8, G9, G10, G11 = G
-        T_approx = crt.tt_error_order12(T, G0, G1, G2, G3, G4, G5, G6, G7, G8, G9, G10, G11, dims, L)
-
-    error = norm(T - T_approx)/norm(T)
-    return error
+    # The intermediate arrays of a slab are larger than the slab by a factor of at most the maximum rank.
+    max_rank = max([1] + [g.shape[-1] for g in G[:-1]])
+    error = 0.0
+    for idx in ooc_slabs(dims, 0, max(max_bytes // max_rank, 1)):
+        A = G[0][idx[0], :]
+        for l in range(1, L-1):
+            A = np.tensordot(A, G[l], axes=(-1, 0))
+        A = np.tensordot(A, G[L-1], axes=(-1, 0))
+        error += norm(np.asarray(T[idx], dtype=float64) - A)**2
+
+    Tsize = ooc_norm(T, max_bytes)
+    return np.sqrt(error) / Tsize
+
+
+def trial_workers(max_trials, display):
+    """
+    Number of threads used to run the trials of each core of cpd_cores concurrently. The Numba kernels release the GIL,
+    but they can only be called from several threads at the same time with the threading layers 'tbb' and 'omp' of
+    Numba. When the threading layer is not known yet, or when the trials print information (display > 0), the trials
+    are run sequentially.
+    """
+
+    from numba import threading_layer
+
+    try:
+        layer = threading_layer()
+    except ValueError:
+        return 1
+    if layer not in ['tbb', 'omp'] or display > 0:
+        return 1
+
+    return min(max_trials, os.cpu_count() or 1)
+
+
+def race_trials(trial, max_trials, num_workers, options, tol=1e-4):
+    """
+    Runs trial(options_t) for t = 0, ..., max_trials-1 and returns the result with the smallest relative error, among
+    the trials up to the first one which reaches an error smaller than tol. The function trial must return a pair 
+    (result, output), where output.rel_error is the relative error of the result. Each options_t is a copy of options 
+    whose random_state is a generator derived from the index t (and from a seed drawn from options.random_state), so 
+    the result of each trial does not depend on the order in which the trials are run. When num_workers > 1, the 
+    trials are run concurrently on a pool of threads, with the BLAS threads partitioned among the workers. As soon as 
+    some trial reaches the tolerance, the trials not started yet are cancelled. The trials already running cannot be 
+    interrupted, so they are waited for before the BLAS threads are restored. Then the results are processed in the 
+    order of the trials, as in the sequential case, which gives the same result in both cases.
+    """
+
+    rng = np.random if options.random_state is None else options.random_state
+    seed = rng.randint(2**31)
+
+    def trial_options(t):
+        options_t = copy(options)
+        options_t.random_state = np.random.RandomState([seed, t])
+        return options_t
+
+    results = [None for t in range(max_trials)]
+
+    if num_workers == 1:
+        for t in range(max_trials):
+            results[t] = trial(trial_options(t))
+            if results[t][1].rel_error < tol:
+                break
+
+    else:
+        from threadpoolctl import threadpool_limits
+
+        with threadpool_limits(limits=max(1, (os.cpu_count() or 1) // num_workers), user_api='blas'):
+            executor = ThreadPoolExecutor(max_workers=num_workers)
+            futures = {executor.submit(trial, trial_options(t)): t for t in range(max_trials)}
+            for future in as_completed(futures):
+                if future.result()[1].rel_error < tol:
+                    break
+            executor.shutdown(wait=True, cancel_futures=True)
+        for future, t in futures.items():
+            if not future.cancelled():
+                results[t] = future.result()
+
+    best_error = inf
+    best_result, best_output = None, None
+    for t in range(max_trials):
+        if results[t] is None:
+            break
+        result, output = results[t]
+        if output.rel_error < best_error:
+            best_result, best_output = result, output
+            best_error = output.rel_error
+        if output.rel_error < tol:
+            break
+
+    return best_result, best_output
 
 
 def cpd_cores(G, max_trials, epochs, R, display, options):
     """
-    Routines to compute the cores of the CPD tensor train.
+    Routines to compute the cores of the CPD tensor train. The trials of each core are independent, so they are run
+    concurrently when possible (see the function race_trials). When epochs > 1, the CPD of a core already computed in
+    a previous epoch is warm started from its previous factors (projected onto the compressed space by bicpd), with a
+    single trial, so the extra epochs are refinement sweeps instead of restarts.
     """
     
     L = len(G)
@@ -425,26 +625,33 @@ def cpd_cores(G, max_trials, epochs, R, display, options):
     # Outputs is a list containing the output class of each CPD.
     outputs = [l for l in range(L-2)]
     
+    # Factors of the last CPD computed for each core, used to warm start the CPD's of the next epochs.
+    last_factors = [None for l in range(L-2)]
+
+    def warm_start(l):
+        if last_factors[l-1] is None:
+            return options, max_trials
+        options_l = copy(options)
+        options_l.initialization = last_factors[l-1]
+        return options_l, 1
+
     if display < 0 and epochs > 1:
         print('Epoch ', 1)
         
     # Compute cpd of second core.
-    best_error = inf
-    for trial in range(max_trials):
+    def trial(options_t):
         if display > 0:
             print()
             print('CPD 1')
-        factors, output = tfx.tricpd(G[1], R, options)
-        X, Y, Z = factors
-        if output.rel_error < best_error:
-            best_output = output
-            best_error = output.rel_error
-            best_X, best_Y, best_Z = X, Y, Z
-            if best_error < 1e-4:
-                break
+        return tfx.tricpd(G[1], R, options_t)
+
+    [best_X, best_Y, best_Z], best_output = \
+        race_trials(trial, max_trials, trial_workers(max_trials, display), options)
+    best_error = best_output.rel_error
                 
     outputs[0] = best_output
     cpd_list[0] = [best_X, best_Y, best_Z]
+    last_factors[0] = [best_X, best_Y, best_Z]
         
     if display < 0:
         print('CPD 1 error =', best_error)
@@ -461,19 +668,20 @@ def cpd_cores(G, max_trials, epochs, R, display, options):
         # Following the tensor train from G[1] to G[L-2].
         if epoch % 2 == 0:
             for l in range(low, L-1):
-                best_error = inf
                 fixed_X = pinv(best_Z.T)
-                for trial in range(max_trials):
+                options_l, trials_l = warm_start(l)
+
+                def trial(options_t):
                     if display > 0:
                         print()
                         print('CPD', l)
-                    X, Y, Z, output = tfx.bicpd(G[l], R, [fixed_X, 0], options)
-                    if output.rel_error < best_error:
-                        best_output = output
-                        best_error = output.rel_error
-                        best_X, best_Y, best_Z = fixed_X, Y, Z
-                        if best_error < 1e-4:
-                            break
+                    X, Y, Z, output = tfx.bicpd(G[l], R, [fixed_X, 0], options_t)
+                    return [fixed_X, Y, Z], output
+
+                [best_X, best_Y, best_Z], best_output = \
+                    race_trials(trial, trials_l, trial_workers(trials_l, display), options_l)
+                best_error = best_output.rel_error
+                last_factors[l-1] = [best_X, best_Y, best_Z]
                 
                 if epoch == epochs-1:
                     outputs[l-1] = best_output
@@ -489,19 +697,20 @@ def cpd_cores(G, max_trials, epochs, R, display, options):
                 low = 1
                 upp = L - 1
             for l in reversed(range(1, upp)):
-                best_error = inf
                 fixed_Z = pinv(best_X.T)
-                for trial in range(max_trials):
+                options_l, trials_l = warm_start(l)
+
+                def trial(options_t):
                     if display > 0:
                         print()
                         print('CPD', l)
-                    X, Y, Z, output = tfx.bicpd(G[l], R, [fixed_Z, 2], options)
-                    if output.rel_error < best_error:
-                        best_output = output
-                        best_error = output.rel_error
-                        best_X, best_Y, best_Z = X, Y, fixed_Z
-                        if best_error < 1e-4:
-                            break
+                    X, Y, Z, output = tfx.bicpd(G[l], R, [fixed_Z, 2], options_t)
+                    return [X, Y, fixed_Z], output
+
+                [best_X, best_Y, best_Z], best_output = \
+                    race_trials(trial, trials_l, trial_workers(trials_l, display), options_l)
+                best_error = best_output.rel_error
+                last_factors[l-1] = [best_X, best_Y, best_Z]
                             
                 if epoch == epochs-2:
                     outputs[l-1] = best_output
@@ -513,7 +722,101 @@ def cpd_cores(G, max_trials, epochs, R, display, options):
     return cpd_list, outputs, best_Z
 
 
-def gen_rand_tensor(dims, R, noise=0):
+def parallel_cpd_cores(G, max_trials, R, display, options):
+    """
+    Alternative to cpd_cores where the CPD's of the cores G[1], ..., G[L-2] are computed independently, with no fixed
+    factor, so they are run concurrently when possible (see the function trial_workers). The CPD of each core is unique
+    up to permutation and scaling of its rank one terms, so the factors shared by consecutive cores are reconciled 
+    afterwards: the columns of each CPD are permuted to match the CPD of the previous core, and then scaled so that 
+    Z_{l-1}^T * X_l has unit diagonal, as Z_{l-1}^T * X_l = I in the chain of cpd_cores. The outputs have the same 
+    format as the outputs of cpd_cores.
+    When R is larger than some dimensions of the tensor, the cores at the ends of the train are smaller and their CPD's
+    may not be unique (Kruskal's condition fails). These CPD's are computed after the others, fixing the factor shared
+    with a neighbor core, as in cpd_cores.
+    """
+
+    from scipy.optimize import linear_sum_assignment
+
+    L = len(G)
+
+    # Cores satisfying Kruskal's condition for generic factors. If the first core is not one of them, it is computed 
+    # independently anyway when the second core is not one of them too, since it starts the chain of fixed factors.
+    independent = []
+    for l in range(1, L-1):
+        r1, d, r2 = G[l].shape
+        if min(r1, R) + min(d, R) + min(r2, R) >= 2*R + 2:
+            independent.append(l)
+    if 1 not in independent and 2 not in independent:
+        independent.append(1)
+
+    # The generators of the cores are created before the threads start, so they do not depend on the scheduling.
+    rng = np.random if options.random_state is None else options.random_state
+    core_options = dict()
+    for l in independent:
+        core_options[l] = copy(options)
+        core_options[l].random_state = np.random.RandomState(rng.randint(2**31))
+
+    def core_cpd(l):
+        def trial(options_t):
+            if display > 0:
+                print()
+                print('CPD', l)
+            return tfx.tricpd(G[l], R, options_t)
+        return race_trials(trial, max_trials, 1, core_options[l])
+
+    num_workers = trial_workers(len(independent), display)
+    if num_workers == 1:
+        results = [core_cpd(l) for l in independent]
+    else:
+        from threadpoolctl import threadpool_limits
+        with threadpool_limits(limits=max(1, (os.cpu_count() or 1) // num_workers), user_api='blas'):
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                results = list(executor.map(core_cpd, independent))
+
+    cpd_list = [None for l in range(L-2)]
+    outputs = [None for l in range(L-2)]
+    for l, result in zip(independent, results):
+        cpd_list[l-1], outputs[l-1] = result
+
+    # Reconcile the factors shared by consecutive cores, from left to right. The rank one terms of independent CPD's
+    # are matched by the largest normalized entries of Z_{l-1}^T * X_l. The remaining CPD's fix the factor shared with
+    # the previous core (or with the next one, for the first core).
+    for l in range(1, L-1):
+        if l in independent:
+            if l > 1:
+                Z = cpd_list[l-2][2]
+                X, Y, W = cpd_list[l-1]
+                M = dot(Z.T, X)
+                cost = -np.abs(M) / np.outer(norm(Z, axis=0), norm(X, axis=0))
+                rows, cols = linear_sum_assignment(cost)
+                m = M[rows, cols]
+                cpd_list[l-1] = [X[:, cols] / m, Y[:, cols] * m, W[:, cols]]
+            continue
+
+        if l == 1:
+            fixed_factor = [pinv(cpd_list[1][0].T), 2]
+        else:
+            fixed_factor = [pinv(cpd_list[l-2][2].T), 0]
+
+        def trial(options_t):
+            if display > 0:
+                print()
+                print('CPD', l)
+            X, Y, Z, output = tfx.bicpd(G[l], R, fixed_factor, options_t)
+            if fixed_factor[1] == 0:
+                return [fixed_factor[0], Y, Z], output
+            return [X, Y, fixed_factor[0]], output
+
+        cpd_list[l-1], outputs[l-1] = race_trials(trial, max_trials, trial_workers(max_trials, display), options)
+
+    if display < 0:
+        for l in range(1, L-1):
+            print('CPD', l, 'error =', outputs[l-1].rel_error)
+
+    return cpd_list, outputs, cpd_list[-1][2]
+
+
+def gen_rand_tensor(dims, R, noise=0, out=None):
     """
     This function generates a random rank-R tensor T of shape (dims[0], dims[1], ..., dims[L-1]), where L is the order
     of T. Each factor matrix of T is a matrix of shape (dims[l], R) with its entries drawn from the standard Gaussian
@@ -529,6 +832,9 @@ def gen_rand_tensor(dims, R, noise=0):
         The rank of the tensor (must satisfy R < min(dims))
     noise: float
         Size of the noise added to the original tensor. Default is without noise.
+    out: float L-D array or None
+        If given (for instance a np.memmap), T is written into out block by block, without forming it in memory. The
+        noisy tensor, if requested, is still formed in memory. Default is None.
 
     Output
     ------
@@ -547,7 +853,7 @@ def gen_rand_tensor(dims, R, noise=0):
         M = randn(dims[l], R)
         orig_factors.append(M)
 
-    T = tfx.cnv.cpd2tens(orig_factors)
+    T = tfx.cnv.cpd2tens(orig_factors, out=out)
     
     if noise != 0:
         E = noise * randn(*dims)
@@ -24,10 +24,12 @@
 
 # Python modules
 import numpy as np
-from numpy import identity, ones, empty, array, prod, float32, float64, copy, sqrt, dot
-from numpy.linalg import norm
-from sklearn.utils.extmath import randomized_svd as rand_svd
+from numpy import identity, ones, empty, zeros, array, prod, float32, float64, sqrt, dot, inf
+from numpy.linalg import norm, svd, qr
+from itertools import permutations
 import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Tensor Fox modules
 import TensorFox.Auxiliar as aux
@@ -41,6 +43,8 @@ def mlsvd(T, Tsize, R, options):
     UT is the list of the transposes of U.
     The parameter n_iter of the randomized SVD is set to 2. It is only good to increase this value when the tensor has
     much noise. Still this issue is addressed by the low rank CPD approximation, so n_iter=2 is enough.
+    If T is out-of-core (np.memmap or HDF5 dataset), the Gram matrices of the unfoldings and the core tensor are
+    computed by streaming passes over blocks of T, so T is never loaded in memory.
 
     Inputs
     ------
@@ -59,7 +63,7 @@ def mlsvd(T, Tsize, R, options):
     U: list of float 2-D arrays
         List with truncated matrices of the original U.
     T1: float 2-D arrays
-        First unfolding of T.
+        First unfolding of T. If T is out-of-core, T itself is returned.
     sigmas: list of float 1-D arrays
         List with truncated arrays of the original sigmas.
     """
@@ -95,7 +99,11 @@ def mlsvd(T, Tsize, R, options):
 
     # tol_mlsvd = -1 means no truncation and no compression, that is, the original tensor.
     if tol_mlsvd == -1:
-        T1 = cnv.unfold(T, 1)
+        # An out-of-core T is not unfolded, so it is never loaded in memory.
+        if aux.is_ooc(T):
+            T1 = T
+        else:
+            T1 = cnv.unfold(T, 1)
         U = [identity(dims[l]) for l in range(L)]
         sigmas = [ones(dims[l]) for l in range(L)]
         if display > 2 or display < -1:
@@ -117,29 +125,52 @@ def mlsvd(T, Tsize, R, options):
         UT = [U[l].T for l in range(L)]
         S = mlinalg.sparse_multilin_mult(UT, data, idxs, new_dims)
 
-    # Compute MLSVD base on sequentially truncated method.
+    # T is out-of-core. The SVD's are computed from the Gram matrices of the unfoldings, as in the sparse case.
+    elif aux.is_ooc(T):
+        T1 = T
+        grams = ooc_gram_matrices(T, options.max_bytes)
+        for l in range(L):
+            U, sigmas, Vlt, dim = compute_svd(grams[l], U, sigmas, dims, R, 'gram', tol_mlsvd, False, L, l)
+
+        # Compute (U_1^T,...,U_L^T)*T = S.
+        UT = [U[l].T for l in range(L)]
+        S = mlinalg.ooc_multilin_mult(UT, T, options.max_bytes)
+
+    # Compute MLSVD base on sequentially truncated method. The modes are processed in the cheapest order.
     elif mlsvd_method == 'seq':
-        S_dims = copy(dims)
+        T1 = cnv.unfold_C(T, 1)
+        U = [0 for l in range(L)]
+        sigmas = [0 for l in range(L)]
+        S_dims = list(dims)
         S = T
-        for l in range(L):
+        for l in seq_ordering(T, R, tol_mlsvd):
             Sl = cnv.unfold(S, l+1)
-            if l == 0:
-                T1 = cnv.unfold_C(S, l+1)
-            U, sigmas, Vlt, dim = compute_svd(Sl, U, sigmas, dims, R, mlsvd_method, tol_mlsvd, gpu, L, l)
+            Ul, sigma_l, Vlt, dim = compute_svd(Sl, [], [], dims, R, mlsvd_method, tol_mlsvd, gpu, L, l,
+                                                options.mixed_precision)
+            U[l] = Ul[0]
+            sigmas[l] = sigma_l[0]
 
-            # Compute l-th unfolding of S truncated at the l-th mode.
-            Sl = (Vlt.T * sigmas[-1]).T
+            # Compute l-th unfolding of S truncated at the l-th mode. The new S is a view of this unfolding.
+            Sl = (Vlt.T * sigmas[l]).T
             S_dims[l] = dim
-            S = empty(S_dims, dtype=float64)
-            S = cnv.foldback(S, Sl, l+1)
+            S = cnv.fold(Sl, l+1, S_dims)
+        S = np.ascontiguousarray(S)
 
-    # Compute MLSVD based on classic method.
+    # Compute MLSVD based on classic method. The SVD's of the unfoldings are independent, so they are computed 
+    # concurrently.
     elif mlsvd_method == 'classic':
-        for l in range(L):
-            Tl = cnv.unfold(T, l+1)
-            if l == 0:
-                T1 = cnv.unfold_C(T, l+1)
-            U, sigmas, Vlt, dim = compute_svd(Tl, U, sigmas, dims, R, mlsvd_method, tol_mlsvd, gpu, L, l)
+        T1 = cnv.unfold_C(T, 1)
+
+        def svd_mode(Tl, l):
+            return compute_svd(Tl, [], [], dims, R, mlsvd_method, tol_mlsvd, gpu, L, l, options.mixed_precision)
+
+        if gpu:
+            results = [svd_mode(cnv.unfold(T, l+1), l) for l in range(L)]
+        else:
+            results = parallel_mode_svds(T, svd_mode, options.mlsvd_max_bytes)
+        for Ul, sigma_l, Vlt, dim in results:
+            U += Ul
+            sigmas += sigma_l
 
         # Compute (U_1^T,...,U_L^T)*T = S.
         UT = [U[l].T for l in range(L)]
@@ -156,19 +187,362 @@ def mlsvd(T, Tsize, R, options):
             U[l] = U[l][:, :trunc_dims[l]]
         S = S[tuple(slices)]
 
-    # Compute error of compressed tensor.
+    # Refine the truncated MLSVD with HOOI sweeps. The sigmas are updated to the singular values of the new core.
+    if options.hooi_maxiter > 0:
+        S, U = hooi(T, S, U, options.hooi_maxiter, max_bytes=options.max_bytes)
+        sigmas = [svd(cnv.unfold(S, l+1), compute_uv=False) for l in range(L)]
+
+    # Compute error of compressed tensor. Since S is the projection of T, no reconstruction of T is necessary.
     if display > 2 or display < -1:
-        if type(T) == list:
-            best_error = mlinalg.compute_error(T, Tsize, S, U, dims)
-        else:
-            S1 = cnv.unfold(S, 1)
-            best_error = mlinalg.compute_error(T, Tsize, S1, U, S.shape)
+        best_error = mlinalg.compressed_error(Tsize, S, dims=dims)
         return S, U, T1, sigmas, best_error
 
     return S, U, T1, sigmas
 
 
-def compute_svd(Tl, U, sigmas, dims, R, mlsvd_method, tol_mlsvd, gpu, L, l):
+def hooi(T, S, U, maxiter, tol=1e-10, max_bytes=2**27):
+    """
+    Higher-order orthogonal iteration (HOOI). Starting from a truncated MLSVD T ~ (U_1,...,U_L)*S, each U_l is replaced
+    by the dominant left singular vectors of the l-th unfolding of (U_1^T,...,I,...,U_L^T)*T, with the other U's fixed.
+    Since the U_l have orthonormal columns, we have |T - (U_1,...,U_L)*S|^2 = |T|^2 - |S|^2, so each update can only
+    decrease the error, and the sweeps stop when the relative increase of |S|^2 is smaller than tol.
+
+    Inputs
+    ------
+    T: float array or list
+        Objective tensor (dense, sparse or out-of-core).
+    S: float array
+        Core tensor of the truncated MLSVD.
+    U: list of float 2-D arrays
+        Matrices of the truncated MLSVD.
+    maxiter: int
+        Maximum number of sweeps over all modes.
+    tol: float
+        Tolerance for the relative increase of |S|^2.
+    max_bytes: int
+        Memory bound for the blocks of sparse and out-of-core tensors.
+
+    Outputs
+    -------
+    S: float array
+        Core tensor after the HOOI sweeps.
+    U: list of float 2-D arrays
+        Matrices with orthonormal columns after the HOOI sweeps.
+    """
+
+    L = len(U)
+    ranks = [U[l].shape[1] for l in range(L)]
+    UT = [U[l].T for l in range(L)]
+    S_energy = norm(S)**2
+
+    for it in range(maxiter):
+        for l in range(L):
+            Y = mlinalg.partial_multilin_mult(UT, T, l, max_bytes)
+            Ul, sigma_l, Vlt = svd(cnv.unfold(Y, l+1), full_matrices=False)
+            UT[l] = Ul[:, :ranks[l]].T
+        # The core tensor is obtained from the last partial multiplication.
+        S = mlinalg.mode_mult(Y, UT[L-1], L-1)
+        new_energy = norm(S)**2
+        if new_energy - S_energy < tol * new_energy:
+            break
+        S_energy = new_energy
+
+    U = [UT[l].T for l in range(L)]
+    S = np.ascontiguousarray(S)
+
+    return S, U
+
+
+def tucker_compression(T, Tsize, S, U, ordering):
+    """
+    Prepares a Tucker decomposition T ~ (U_1, ..., U_L)*S given by the user (e.g., computed by the function tucker) to
+    be used in the place of the MLSVD in the compression stage of the cpd function. T is the tensor with its dimensions
+    sorted by the given ordering (see Auxiliar.sort_dims), which is also applied to S and U. The columns of the U_l must
+    be orthonormal.
+
+    Inputs
+    ------
+    T: float array or list
+        Tensor with sorted dimensions (dense, sparse or out-of-core).
+    Tsize: float
+        Norm of T.
+    S: float array
+        Core tensor of the Tucker decomposition, in the original dimension ordering.
+    U: list of float 2-D arrays
+        Factor matrices of the Tucker decomposition, in the original dimension ordering.
+    ordering: int 1-D array
+
+    Outputs
+    -------
+    S, U, T1, sigmas: 
+        Same as the outputs of mlsvd.
+    error: float
+        Relative error |T - (U_1, ..., U_L)*S| / |T|.
+    """
+
+    L = len(ordering)
+    if type(T) == list:
+        data, idxs, dims = T
+    else:
+        dims = T.shape
+
+    S = np.ascontiguousarray(np.transpose(S, ordering))
+    U = [U[ordering[l]] for l in range(L)]
+    if S.ndim != L or [U[l].shape for l in range(L)] != [(dims[l], S.shape[l]) for l in range(L)]:
+        msg = 'The Tucker decomposition given in options.tucker is not compatible with the tensor.'
+        sys.exit(msg)
+
+    if type(T) == list:
+        T1 = cnv.sparse_unfold(data, idxs, dims, 1)
+    elif aux.is_ooc(T):
+        T1 = T
+    else:
+        T1 = cnv.unfold_C(T, 1)
+    sigmas = [svd(cnv.unfold(S, l+1), compute_uv=False) for l in range(L)]
+    error = mlinalg.compressed_error(Tsize, S, dims=dims)
+
+    return S, U, T1, sigmas, error
+
+
+def mlsvd_update(T_new, mode, S, U, Tsize, R, options, error=None, T=None, max_error=inf):
+    """
+    Updates the truncated MLSVD T ~ (U_1,...,U_L)*S of a tensor T when a block T_new of slices is appended to T along
+    the given mode, without revisiting T. For each other mode l, the l-th unfolding of the new tensor is approximated by
+    [U_l * S_(l) * W^T, T_new_(l)], where W has orthonormal columns, so its dominant left singular vectors are the ones
+    of [U_l * S_(l), T_new_(l)], a matrix whose size depends only on the core and on the new block. After that, the
+    approximation and the new block are projected onto the new bases of the other modes, and the basis of the growing
+    mode is obtained from the SVD of this small projected tensor.
+    Each update adds at most the norm of the discarded part of the new data to the error, so the errors accumulate
+    over the updates. An upper bound for the relative error is returned, and when it exceeds max_error and the full
+    tensor T (with the new slices) is given, the MLSVD is recomputed from scratch.
+
+    Inputs
+    ------
+    T_new: float array
+        Block of new slices, with the same dimensions of T except at the mode.
+    mode: int
+        Mode along which the slices are appended (1 <= mode <= L).
+    S: float array
+        Core tensor of the current MLSVD.
+    U: list of float 2-D arrays
+        Matrices of the current MLSVD.
+    Tsize: float
+        Frobenius norm of T before the update.
+    R: int
+        An upper bound for the multilinear rank, as in the function mlsvd.
+    options: class with the parameters previously defined.
+    error: float
+        Relative error of the current MLSVD, as returned by a previous update. If error is None, the MLSVD is assumed
+        to be computed by the function mlsvd, in which case S is the projection of T and the error is 
+        sqrt(|T|^2 - |S|^2)/|T|.
+    T: float array, list or None
+        Full tensor with the new slices (dense, sparse or out-of-core), used only to recompute the MLSVD.
+    max_error: float
+        The MLSVD is recomputed when the bound for the relative error is bigger than max_error.
+
+    Outputs
+    -------
+    S: float array
+        Core tensor of the updated MLSVD.
+    U: list of float 2-D arrays
+        Matrices of the updated MLSVD.
+    sigmas: list of float 1-D arrays
+        Singular values of the unfoldings of S.
+    Tsize: float
+        Frobenius norm of the new tensor.
+    error: float
+        Upper bound for the relative error of the updated MLSVD (the exact error if it was recomputed).
+    """
+
+    L = len(U)
+    m = mode - 1
+    T_new = np.asarray(T_new, dtype=float64)
+    dims = [U[l].shape[0] for l in range(L)]
+    dims[m] += T_new.shape[m]
+
+    # Set options.
+    options = aux.make_options(options, L)
+    options.display = 0
+    trunc_dims = options.trunc_dims
+    tol_mlsvd = options.tol_mlsvd
+    if type(tol_mlsvd) == list:
+        if L > 3:
+            tol_mlsvd = tol_mlsvd[0]
+        else:
+            tol_mlsvd = tol_mlsvd[1]
+    tol_mlsvd = max(tol_mlsvd, 0)
+
+    S_size = norm(S)
+    if error is None:
+        error = sqrt(max(Tsize**2 - S_size**2, 0)) / Tsize
+    new_size = norm(T_new)
+
+    # Update the bases of the modes which don't grow.
+    U_new = [0 for l in range(L)]
+    for l in range(L):
+        if l != m:
+            M = np.hstack([dot(U[l], cnv.unfold(S, l+1)), cnv.unfold(T_new, l+1)])
+            Ul, sigma_l, Vlt, dim = compute_svd(M, [], [], dims, R, 'classic', tol_mlsvd, False, L, l)
+            U_new[l] = Ul[0]
+            if type(trunc_dims) == list:
+                U_new[l] = U_new[l][:, :trunc_dims[l]]
+
+    # Project the current approximation and the new block onto the new bases, and stack them along the mode.
+    Y_old = S
+    for l in range(L):
+        if l != m:
+            Y_old = mlinalg.mode_mult(Y_old, dot(U_new[l].T, U[l]), l)
+        else:
+            Y_old = mlinalg.mode_mult(Y_old, U[l], l)
+    UT = [U_new[l].T if l != m else None for l in range(L)]
+    Y_new = mlinalg.partial_multilin_mult(UT, T_new, m)
+    Y = np.concatenate([Y_old, Y_new], axis=m)
+
+    # Update the basis of the growing mode and the core.
+    Ul, sigma_l, Vlt, dim = compute_svd(cnv.unfold(Y, m+1), [], [], dims, R, 'classic', tol_mlsvd, False, L, m)
+    U_new[m] = Ul[0]
+    if type(trunc_dims) == list:
+        U_new[m] = U_new[m][:, :trunc_dims[m]]
+    S_new = np.ascontiguousarray(mlinalg.mode_mult(Y, U_new[m].T, m))
+
+    # The stacked tensor has norm sqrt(|S|^2 + |T_new|^2), and its approximation error is obtained by orthogonality.
+    # The error of the current MLSVD is added to obtain a bound for the error with respect to the new tensor.
+    Tsize_new = sqrt(Tsize**2 + new_size**2)
+    update_error = sqrt(max(S_size**2 + new_size**2 - norm(S_new)**2, 0))
+    error = (update_error + error*Tsize) / Tsize_new
+
+    # Drift check: recompute the MLSVD from scratch when the accumulated error is too big.
+    if error > max_error and T is not None:
+        S_new, U_new, T1, sigmas = mlsvd(T, Tsize_new, R, options)
+        error = sqrt(max(Tsize_new**2 - norm(S_new)**2, 0)) / Tsize_new
+    else:
+        sigmas = [svd(cnv.unfold(S_new, l+1), compute_uv=False) for l in range(L)]
+
+    return S_new, U_new, sigmas, Tsize_new, error
+
+
+def seq_ordering(T, R, tol_mlsvd):
+    """
+    Chooses the order in which the modes are processed by the sequentially truncated MLSVD. Processing the mode l of
+    the current core costs about prod(current dims) * (r_l + 10) flops, where r_l is the truncated rank of this mode, 
+    and after that the l-th dimension of the core is reduced from dims[l] to r_l. Therefore modes which compress a lot
+    should be processed first. The ranks r_l are estimated from the singular values of a few random fibers of T. For
+    L <= 7 all orderings are compared, otherwise the modes are sorted by the ratios r_l/dims[l].
+
+    Inputs
+    ------
+    T: float L-D array
+    R: int
+    tol_mlsvd: float
+
+    Outputs
+    -------
+    ordering: list of ints
+        The modes (0 <= l < L) in the order they should be processed.
+    """
+
+    dims = T.shape
+    L = len(dims)
+    num_cols = prod(dims, dtype=np.int64)
+
+    # Estimate the truncated ranks. A local random generator is used so the random state of the user (used by the
+    # initialization, for instance) is not changed.
+    rng = np.random.RandomState(0)
+    ranks = []
+    for l in range(L):
+        low_rank = min(R, dims[l])
+        num_samples = int(min(num_cols // dims[l], 2*low_rank + 10))
+        idx = [rng.randint(0, dims[m], num_samples).reshape(1, -1) for m in range(L)]
+        idx[l] = np.arange(dims[l]).reshape(-1, 1)
+        sigma = svd(T[tuple(idx)], compute_uv=False)[:low_rank]
+        if np.sum(sigma**2) == 0:
+            ranks.append(1)
+        else:
+            ranks.append(clean_compression(empty((0, sigma.size)), sigma, empty((sigma.size, 0)), tol_mlsvd, L)[3])
+
+    def cost(ordering):
+        current_dims = list(dims)
+        c = 0
+        for l in ordering:
+            c += prod(current_dims, dtype=float64) * (ranks[l] + 10)
+            current_dims[l] = ranks[l]
+        return c
+
+    if L <= 7:
+        best_cost = inf
+        for ordering in permutations(range(L)):
+            current_cost = cost(ordering)
+            if current_cost < best_cost:
+                best_cost = current_cost
+                best_ordering = list(ordering)
+    else:
+        best_ordering = list(np.argsort([ranks[l]/dims[l] for l in range(L)], kind='stable'))
+
+    return best_ordering
+
+
+def parallel_mode_svds(T, svd_mode, max_bytes=inf):
+    """
+    Computes svd_mode(Tl, l) for all unfoldings Tl = T_(l+1), l = 0...L-1, of T concurrently on a pool of threads. The
+    BLAS threads are partitioned among the workers to avoid oversubscription, that is, with n workers each BLAS call 
+    uses cpu_count/n threads. The unfoldings are computed one at a time by the calling thread (Numba kernels may not be
+    called concurrently from several threads, depending on the threading layer) while the workers are computing their
+    SVD's. An unfolding which is not a view of T (see Conversion.unfold) is a full copy of T, so when max_bytes is 
+    given, the number of workers is limited such that these copies have at most max_bytes bytes together.
+
+    Inputs
+    ------
+    T: float L-D array
+    svd_mode: function
+        Function of the form svd_mode(Tl, l), where Tl is the l-th unfolding of T.
+    max_bytes: int or inf
+        Memory bound for the unfoldings kept at the same time. With max_bytes = 0 the SVD's are computed sequentially.
+        Default is inf (one worker per mode, up to the number of CPU's).
+
+    Outputs
+    -------
+    results: list
+        results[l] is the output of svd_mode(T_(l+1), l).
+    """
+
+    L = T.ndim
+    num_cpus = os.cpu_count() or 1
+    num_workers = min(L, num_cpus)
+
+    # Only the unfoldings which are not views of T take extra memory.
+    num_copies = 0
+    for l in range(L):
+        axes = [m for m in reversed(range(L)) if m != l] + [l]
+        if not T.transpose(axes).flags.c_contiguous:
+            num_copies += 1
+    if max_bytes <= 0:
+        num_workers = 1
+    elif num_copies > 0 and max_bytes < inf:
+        num_workers = min(num_workers, max(1, int(max_bytes // T.nbytes)))
+
+    if num_workers == 1:
+        return [svd_mode(cnv.unfold(T, l+1), l) for l in range(L)]
+
+    from threadpoolctl import threadpool_limits
+
+    # The unfoldings are computed by the calling thread, since the parallel Numba kernels may hang when they are first
+    # launched from a worker thread. Before a new unfolding is computed, the SVD submitted num_workers unfoldings 
+    # before must be finished, so at most num_workers unfoldings are in flight.
+    with threadpool_limits(limits=max(1, num_cpus // num_workers), user_api='blas'):
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = []
+            for l in range(L):
+                if l >= num_workers:
+                    futures[l - num_workers].result()
+                futures.append(executor.submit(svd_mode, cnv.unfold(T, l+1), l))
+            results = [future.result() for future in futures]
+
+    return results
+
+
+def compute_svd(Tl, U, sigmas, dims, R, mlsvd_method, tol_mlsvd, gpu, L, l, mixed_precision=False):
+    from sklearn.utils.extmath import randomized_svd as rand_svd
+
     low_rank = min(R, dims[l])
 
     if gpu:
@@ -183,12 +557,14 @@ def compute_svd(Tl, U, sigmas, dims, R, mlsvd_method, tol_mlsvd, gpu, L, l):
             Ul, sigma_l, Vlt = rlinalg.rsvd(Tl_gpu, k=low_rank, p=10, q=2, method='standard')
 
     else:
-        if mlsvd_method == 'sparse':
-            Tl = Tl.dot(Tl.T)
+        if mlsvd_method == 'sparse' or mlsvd_method == 'gram':
+            # With mlsvd_method = 'gram', Tl is already the Gram matrix of the unfolding.
+            if mlsvd_method == 'sparse':
+                Tl = Tl.dot(Tl.T)
             Ul, sigma_l, Vlt = rand_svd(Tl, low_rank, n_oversamples=10, n_iter=2, power_iteration_normalizer='none')
             sigma_l = sqrt(sigma_l)
         else:
-            Ul, sigma_l, Vlt = rand_svd(Tl, low_rank, n_oversamples=10, n_iter=2, power_iteration_normalizer='none')
+            Ul, sigma_l, Vlt = adaptive_rand_svd(Tl, low_rank, tol_mlsvd/L, mixed_precision=mixed_precision)
 
     # Truncate more based on energy.
     Ul, sigma_l, Vlt, dim = clean_compression(Ul, sigma_l, Vlt, tol_mlsvd, L)
@@ -198,6 +574,164 @@ def compute_svd(Tl, U, sigmas, dims, R, mlsvd_method, tol_mlsvd, gpu, L, l):
     return U, sigmas, Vlt, dim
 
 
+def ooc_gram_matrices(T, max_bytes):
+    """
+    Computes the Gram matrices T_(l) * T_(l)^T of all unfoldings of an out-of-core tensor T (np.memmap or HDF5 dataset),
+    reading T block by block. The Gram matrices of the modes 2, ..., L are accumulated over slabs along the first mode,
+    and the Gram matrix of the first mode is accumulated over slabs along the second mode. Therefore T is read twice.
+
+    Inputs
+    ------
+    T: float L-D array
+        Out-of-core tensor.
+    max_bytes: int
+        Memory bound for each block of T.
+
+    Outputs
+    -------
+    grams: list of float 2-D arrays
+        grams[l] is the Gram matrix of the (l+1)-th unfolding of T.
+    """
+
+    dims = T.shape
+    L = len(dims)
+    grams = [zeros((dims[l], dims[l]), dtype=float64) for l in range(L)]
+
+    for idx in aux.ooc_slabs(dims, 0, max_bytes):
+        block = np.asarray(T[idx], dtype=float64)
+        for l in range(1, L):
+            Bl = cnv.unfold(block, l+1)
+            grams[l] += dot(Bl, Bl.T)
+
+    for idx in aux.ooc_slabs(dims, 1, max_bytes):
+        block = np.asarray(T[idx], dtype=float64)
+        B1 = block.reshape(dims[0], -1)
+        grams[0] += dot(B1, B1.T)
+
+    return grams
+
+
+def adaptive_rand_svd(A, max_rank, eps, block_size=None, n_oversamples=10, n_iter=2, mixed_precision=False,
+                      random_state=0):
+    """
+    Computes a truncated SVD of A with a randomized range finder which grows its basis in blocks, starting with
+    block_size vectors and doubling the size of the basis at each step.
+    After each block the energy captured by the basis Q is |Q^T A|^2, so the iterations stop as soon as the relative
+    energy left out, (|A|^2 - |Q^T A|^2)/|A|^2, is smaller than eps, or when the basis has max_rank + n_oversamples 
+    vectors. When the rank of A is much smaller than max_rank, this avoids computing many unneeded singular vectors.
+    Each block is improved with n_iter power iterations and orthogonalized against the previous blocks. The first 
+    block has half of the maximum size by default, so at most two blocks are computed when A is not low rank.
+    The energy test is made in floating point arithmetic, so it can not verify values of eps smaller than about 1e-12.
+    In this case the whole basis is computed in one block and the energy of A is not computed, which is the usual
+    one-shot randomized range finder.
+    If mixed_precision is True, all the passes of the range finder (sketches, power iterations and the energy test) are
+    computed with a float32 copy of A, which costs half of the memory of A. Only the small basis Q is orthogonalized
+    in float64, and a single float64 pass over A computes the projection B = Q^T A at the end, whose SVD (Rayleigh-Ritz
+    step) is also computed in float64. The basis is accurate to single precision, so in this case the energy test is
+    only made for eps larger than about 1e-6.
+
+    Inputs
+    ------
+    A: float 2-D array
+    max_rank: int
+        Maximum number of singular triplets to compute.
+    eps: float
+        Tolerance for the relative energy of A left out of the basis.
+    block_size: int or None
+        Size of the first block. Default is None, which means half of max_rank + n_oversamples.
+    n_oversamples, n_iter: int
+        Parameters of the randomized range finder.
+    mixed_precision: bool
+        If True, the range finder works with a float32 copy of A. Default is False.
+    random_state: int or np.random.RandomState
+        Seed or generator of the random sketches. A local generator is used, so the global random state of NumPy (used
+        by the initialization, for instance) is not changed. Default is 0.
+
+    Outputs
+    -------
+    U, sigma, Vt: float arrays
+        Truncated SVD of A, with at most max_rank singular triplets.
+    """
+
+    m, n = A.shape
+    if isinstance(random_state, np.random.RandomState):
+        rng = random_state
+    else:
+        rng = np.random.RandomState(random_state)
+
+    max_basis = min(max_rank + n_oversamples, m, n)
+    Q = empty((m, 0))
+
+    # Matrix used by the range finder. With mixed precision, A is only read in float64 by the final projection.
+    if mixed_precision:
+        A_sketch = array(A, dtype=float32)
+    else:
+        A_sketch = A
+    Q_sketch = Q
+
+    # Smallest tolerance which can be verified with the precision of A_sketch. Below it the basis is computed in a
+    # single block, with no energy test.
+    min_eps = 1e-6 if mixed_precision else 1e-12
+    adaptive = eps >= min_eps
+    if adaptive:
+        A_energy = float(norm(A_sketch))**2
+        B_energy = 0.0
+        if block_size is None:
+            block_size = max(1, max_basis // 2)
+    else:
+        block_size = max_basis
+
+    # With full precision and the energy test, the projections of the blocks are kept to form B = Q^T A.
+    B = empty((0, n))
+    keep_B = adaptive and not mixed_precision
+
+    while Q.shape[1] < max_basis:
+        # The blocks grow geometrically, so few iterations are needed when the rank is large.
+        k = min(max(block_size, Q.shape[1]), max_basis - Q.shape[1])
+        Y = dot(A_sketch, array(rng.randn(n, k), dtype=A_sketch.dtype))
+        for it in range(n_iter):
+            Y, _ = qr(Y - dot(Q_sketch, dot(Q_sketch.T, Y)))
+            if mixed_precision:
+                # Products with A^T A square the singular values, which would lose the small ones in float32.
+                Z, _ = qr(dot(A_sketch.T, Y))
+                Y = dot(A_sketch, Z)
+            else:
+                Y = dot(A_sketch, dot(A_sketch.T, Y))
+        Y = array(Y, dtype=float64)
+        # Orthogonalize against the previous blocks before and after the normalization of the block. When A has
+        # numerical rank smaller than the basis, some columns of Y are only rounding errors, and the second pass is
+        # necessary to keep Q orthogonal in floating point arithmetic.
+        Y = Y - dot(Q, dot(Q.T, Y))
+        Qk, _ = qr(Y)
+        Qk = Qk - dot(Q, dot(Q.T, Qk))
+        Qk, _ = qr(Qk)
+        Q = np.hstack((Q, Qk))
+        Q_sketch = array(Q, dtype=float32) if mixed_precision else Q
+        if not adaptive:
+            continue
+        Bk = dot(Q_sketch[:, -Qk.shape[1]:].T, A_sketch)
+        if keep_B:
+            B = np.vstack((B, Bk))
+        B_energy += float(norm(Bk))**2
+        if A_energy - B_energy < eps * A_energy:
+            break
+
+    # Otherwise, the projection of the final basis is computed in float64 with a single pass over A.
+    if not keep_B:
+        B = dot(Q.T, A)
+
+    # SVD of the short and wide matrix B = Ub * diag(sigma) * Vt. It is computed from the triangular factor of the QR
+    # decomposition of B^T, which is much cheaper than a direct SVD of B.
+    Rb = qr(B.T, mode='r')
+    Ub, sigma, Wt = svd(Rb.T)
+    U = dot(Q, Ub)
+    Vt = dot(Ub.T, B)
+    nonzero = sigma > 0
+    Vt[nonzero, :] = (Vt[nonzero, :].T / sigma[nonzero]).T
+
+    return U[:, :max_rank], sigma[:max_rank], Vt[:max_rank, :]
+
+
 def clean_compression(U, sigma, Vt, tol_mlsvd, L):
     """
     This function try different threshold values to truncate the mlsvd. The conditions to accept a truncation are
@@ -226,14 +760,14 @@ def clean_compression(U, sigma, Vt, tol_mlsvd, L):
     eps = tol_mlsvd/L
 
     # COMPUTE TRUNCATION.
-    sigma_len = len(sigma)
-    for i in range(1, sigma_len):
-        Tl_trunc_error = np.sum(sigma[i:]**2)/np.sum(sigma**2)
-        if Tl_trunc_error < eps:
-            sigma = sigma[:i]
-            U = U[:, :i]
-            Vt = Vt[:i, :]
-            break
+    # tail_energy[i] is the sum of sigma[i:]**2. The sums are accumulated from the smallest values for accuracy.
+    tail_energy = np.cumsum(sigma[::-1]**2)[::-1]
+    candidates = np.nonzero(tail_energy[1:] < eps * tail_energy[0])[0]
+    if candidates.size > 0:
+        i = candidates[0] + 1
+        sigma = sigma[:i]
+        U = U[:, :i]
+        Vt = Vt[:i, :]
             
     # Size of truncation.
     dim = sigma.size
@@ -241,54 +775,75 @@ def clean_compression(U, sigma, Vt, tol_mlsvd, L):
     return U, sigma, Vt, dim
 
 
-def test_truncation(T, trunc_list, display=True, n_iter=2, power_iteration_normalizer='none'):
+def test_truncation(T, trunc_list, display=True, n_iter=2, power_iteration_normalizer='none', grid=False):
     """
     This function test one or several possible truncations for the MLSVD of T, showing the  error of the truncations. It
     is possible to accomplish the same results calling the function mlsvd with display=3 but this is not advisable since
     each call recomputes the same unfolding SVD's.
     The variable trunc_list must be a list of truncations. Even if it is only one truncation, it must be a list with one
     truncation only.
+    The core tensor S is computed only once, for the largest truncation of each mode. Since the columns of the U_l are
+    orthonormal, the core of a smaller truncation is a slice of S and its error is given by 
+    sqrt(|T|^2 - |S_trunc|^2)/|T|, so no reconstruction of T is necessary. The energies of all slices are obtained at
+    once with cumulative sums of S^2 along each mode. Errors smaller than about 1e-8 are not resolved by this formula.
+    If grid=True, trunc_list must be a list [d_1, ..., d_L], where d_l is the list of candidate dimensions for the l-th
+    mode, and the output is the error surface over the grid, i.e., an array with shape (len(d_1), ..., len(d_L)) whose 
+    entry (i_1, ..., i_L) is the error of the truncation (d_1[i_1], ..., d_L[i_L]).
     """
 
+    from sklearn.utils.extmath import randomized_svd as rand_svd
+
     # Set the main variables about T.
     dims = T.shape
     L = len(dims)
     Tsize = norm(T)
 
-    # Transform list into array and get the maximum for each dimension.
-    max_trunc_dims = np.max(array(trunc_list), axis=0)
+    # Get the maximum truncation for each dimension.
+    if grid:
+        max_trunc_dims = [max(trunc_list[l]) for l in range(L)]
+    else:
+        max_trunc_dims = np.max(array(trunc_list), axis=0)
 
     # Compute truncated SVD of all unfoldings of T.
-    sigmas = []
     U = []
-    T1 = empty((dims[0], prod(dims) // dims[0]), dtype=float64)
-    for l in range(L):
-        Tl = cnv.unfold(T, l+1)
-        if l == 0:
-            T1 = cnv.unfold_C(T, l+1)
+    T1 = cnv.unfold_C(T, 1)
+
+    def svd_mode(Tl, l):
         low_rank = min(dims[l], max_trunc_dims[l])
-        Ul, sigma_l, Vlt = rand_svd(Tl, low_rank, n_iter=n_iter, power_iteration_normalizer=power_iteration_normalizer)
-        sigmas.append(sigma_l)
+        return rand_svd(Tl, low_rank, n_iter=n_iter, power_iteration_normalizer=power_iteration_normalizer)
+
+    for Ul, sigma_l, Vlt in parallel_mode_svds(T, svd_mode):
         U.append(Ul)
 
+    # Compute the core tensor of the largest truncation and the energies of all its leading slices. We have that 
+    # energies[i_1-1, ..., i_L-1] = |S[:i_1, ..., :i_L]|^2.
+    UT = [U[l].T for l in range(L)]
+    S = mlinalg.multilin_mult(UT, T1, dims)
+    energies = S**2
+    for l in range(L):
+        energies = np.cumsum(energies, axis=l)
+    errors = np.sqrt(np.maximum(Tsize**2 - energies, 0)) / Tsize
+    # The truncation with the dimensions of T discards nothing, so its error is exactly zero.
+    if S.shape == dims:
+        errors[tuple(d - 1 for d in dims)] = 0
+
+    # Error surface over the grid of truncations.
+    if grid:
+        trunc_error = errors[np.ix_(*[array(trunc_list[l]) - 1 for l in range(L)])]
+        if display:
+            for trunc in np.ndindex(trunc_error.shape):
+                print('Truncation:', tuple(trunc_list[l][trunc[l]] for l in range(L)))
+                print('Error:', trunc_error[trunc])
+                print()
+        return trunc_error
+
     # Save errors in a list.
     trunc_error = []
 
     # Truncated MLSVD.
     for trunc in trunc_list:
-        # S, U and UT truncated.
         current_dims = trunc
-        current_U = []
-        current_sigmas = []
-        for l in range(L):
-            current_U.append(U[l][:, :current_dims[l]])
-            current_sigmas.append(sigmas[l][:current_dims[l]])
-        current_UT = [current_U[l].T for l in range(L)]
-        S = mlinalg.multilin_mult(current_UT, T1, dims)
-
-        # Error of truncation.
-        S1 = cnv.unfold(S, 1)
-        current_error = mlinalg.compute_error(T, Tsize, S1, current_U, current_dims)
+        current_error = errors[tuple(current_dims[l] - 1 for l in range(L))]
         trunc_error.append(current_error)
 
         # Display results.
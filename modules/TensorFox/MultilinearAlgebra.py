@@ -17,11 +17,9 @@
 
 # Python modules
 import numpy as np
-from numpy import dot, zeros, empty, float64, array, sort, ceil, prod, identity, argmax, inf, sqrt, arange
+from numpy import dot, zeros, ones, empty, float64, int64, array, sort, ceil, prod, identity, argmax, inf, sqrt, arange
 from numpy.linalg import norm, svd
 from numpy.random import permutation
-import numpy.matlib
-import scipy as scp
 from numba import njit, prange
 
 # Tensor Fox modules
@@ -97,6 +95,38 @@ def multilin_mult(U, T1, dims):
             return S
 
 
+def ooc_multilin_mult(U, T, max_bytes):
+    """
+    Performs the multilinear multiplication (U[0]^T,...,U[L-1]^T)*T, where T is out-of-core (np.memmap or HDF5 dataset).
+    T is read by slabs along the first mode, and the contributions of all slabs are summed. Only one slab of T is kept
+    in memory at each step.
+
+    Inputs
+    ------
+    U: list of 2-D arrays
+    T: float L-D array
+        Out-of-core tensor.
+    max_bytes: int
+        Memory bound for each slab of T.
+
+    Outputs
+    -------
+    S: float array
+        S is the resulting multidimensional of the multilinear multiplication (U[0]^T,...,U[L-1]^T)*T.
+    """
+
+    L = len(U)
+    dims_out = [U[l].shape[0] for l in range(L)]
+    S = zeros(dims_out, dtype=float64)
+
+    for idx in aux.ooc_slabs(T.shape, 0, max_bytes):
+        block = np.asarray(T[idx], dtype=float64)
+        U_block = [U[0][:, idx[0]]] + U[1:]
+        S += multilin_mult(U_block, cnv.unfold(block, 1), block.shape)
+
+    return S
+
+
 def sparse_multilin_mult(U, data, idxs, dims):
     """
     Performs the multilinear multiplication (U[0]^T,...,U[L-1]^T)*T, where dims = T.shape and T is sparse. The first
@@ -123,12 +153,97 @@ def sparse_multilin_mult(U, data, idxs, dims):
     # dims_out are the dimensions of the output tensor S.
     dims_out = [U[l].shape[0] for l in range(L)]
     S = np.empty(dims_out, dtype=float64)
-    func_name = "sparse_multilin_mult_order" + str(L)
-    S = getattr(crt, func_name)(U, data, idxs, S, dims_out)
+    # There are specialized kernels for orders up to 9 and a generic kernel for higher orders.
+    if L <= 9:
+        func_name = "sparse_multilin_mult_order" + str(L)
+        S = getattr(crt, func_name)(U, data, idxs, S, dims_out)
+    else:
+        S = crt.sparse_multilin_mult_orderL(U, data, idxs, S.reshape(-1), array(dims_out, dtype=int64))
+        S = S.reshape(dims_out)
 
     return S
 
 
+def mode_mult(T, M, mode):
+    """
+    Computes the product of the tensor T by the matrix M at the given mode (0 <= mode < L), i.e., the tensor with the 
+    same dimensions of T, except at the mode, which has dimension M.shape[0]. We must have M.shape[1] = T.shape[mode].
+    """
+
+    return np.moveaxis(np.tensordot(M, T, axes=(1, mode)), 0, mode)
+
+
+def partial_multilin_mult(U, T, skip, max_bytes=2**27):
+    """
+    Performs the multilinear multiplication (U[0],...,U[skip-1],I,U[skip+1],...,U[L-1])*T, that is, the multiplication
+    at all modes except the mode skip. T can be dense, sparse (in the form [data, idxs, dims]) or out-of-core. In the
+    dense case the modes are multiplied in order of decreasing reduction of the dimensions, so the intermediate tensors
+    are as small as possible. In the sparse case the contribution of each nonzero entry is a row of the Khatri-Rao 
+    product of the rows of the U[l], and these rows are computed in chunks of at most (about) max_bytes bytes. In the 
+    out-of-core case T is read by slabs along the first mode.
+
+    Inputs
+    ------
+    U: list of 2-D arrays
+        U[l] has shape (r_l, dims[l]). The matrix U[skip] is not used.
+    T: float array or list
+    skip: int
+        Mode (0 <= skip < L) which is not multiplied.
+    max_bytes: int
+        Memory bound for the intermediate blocks in the sparse and out-of-core cases.
+
+    Outputs
+    -------
+    Y: float array
+        Y has shape (r_0, ..., dims[skip], ..., r_{L-1}).
+    """
+
+    L = len(U)
+
+    # T is sparse.
+    if type(T) == list:
+        from scipy.sparse import coo_matrix
+        data, idxs, dims = T
+        modes = [l for l in range(L) if l != skip]
+        ranks = [U[l].shape[0] for l in modes]
+        Y = zeros((dims[skip], int(prod(ranks))), dtype=float64)
+        step = max(1, int(max_bytes // (8 * prod(ranks))))
+        for k in range(0, data.size, step):
+            chunk = slice(k, k+step)
+            n = data[chunk].size
+            # Row-wise Khatri-Rao product of the rows of the U[l]^T associated to the nonzero entries.
+            K = ones((n, 1))
+            for l in modes:
+                K = (K[:, :, None] * U[l][:, idxs[chunk, l]].T[:, None, :]).reshape(n, -1)
+            M = coo_matrix((data[chunk], (idxs[chunk, skip], arange(n))), shape=(dims[skip], n)).tocsr()
+            Y += M.dot(K)
+        Y = Y.reshape([dims[skip]] + ranks)
+        return np.moveaxis(Y, 0, skip)
+
+    # T is out-of-core.
+    elif aux.is_ooc(T):
+        dims_out = [U[l].shape[0] for l in range(L)]
+        dims_out[skip] = T.shape[skip]
+        Y = zeros(dims_out, dtype=float64)
+        for idx in aux.ooc_slabs(T.shape, 0, max_bytes):
+            block = np.asarray(T[idx], dtype=float64)
+            U_block = [U[0][:, idx[0]]] + U[1:]
+            if skip == 0:
+                Y[idx[0]] = partial_multilin_mult(U_block, block, skip)
+            else:
+                Y += partial_multilin_mult(U_block, block, skip)
+        return Y
+
+    # T is dense.
+    dims = T.shape
+    modes = sorted([l for l in range(L) if l != skip], key=lambda l: U[l].shape[0] / dims[l])
+    Y = T
+    for l in modes:
+        Y = mode_mult(Y, U[l], l)
+
+    return Y
+
+
 def multirank_approx(T, multi_rank, options):
     """
     This function computes an approximation of T with multilinear rank = multi_rank. Truncation the core tensor of the
@@ -166,7 +281,7 @@ def multirank_approx(T, multi_rank, options):
     return T_approx
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def kronecker(A, B):
     """
     Computes the Kronecker product between A and B. We must have M.shape = (a1*b1, a2*b2), where A.shape = (a1, a2) and 
@@ -184,7 +299,7 @@ def kronecker(A, B):
     return M
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def khatri_rao(A, B, M):
     """
     Computes the Khatri-Rao product between A and B. We must have M.shape = (a1*b1, a2), where A.shape = (a1, a2) and 
@@ -200,7 +315,7 @@ def khatri_rao(A, B, M):
     return M 
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def khatri_rao_inner_computations(A, B, M, i, b1, b2):
     """
     Computes A[i, :]*B.
@@ -213,7 +328,7 @@ def khatri_rao_inner_computations(A, B, M, i, b1, b2):
     return M[i*b1: (i+1)*b1, :]
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def hadamard(A, B, M):
     """
     Computes M = A * B, where * is the Hadamard product. Since all Hadamard products in this context are between R x R
@@ -235,6 +350,10 @@ def cond(factors):
     Warning: this function requires a lot of memory.
     """
 
+    import numpy.matlib
+    import scipy as scp
+    import scipy.linalg
+
     def trd_jacobian(A):
         """
         Computes the derivative of the map S^r -> s_r(S).
@@ -311,13 +430,64 @@ def khatri_rao_factors(factors):
         B = khatri_rao(A, factors[l], B)
         A = B
 
-    return B
+    return A
+
+
+def mttkrp(T, factors, l):
+    """
+    Computes the product T_(l) * (W^(L) ⊙ ... ⊙ W^(l+1) ⊙ W^(l-1) ⊙ ... ⊙ W^(1)) directly from T, where T_(l) is the
+    unfolding of T at mode l+1 (0 <= l < L) and W^(1), ..., W^(L) are the factors. Neither T_(l) nor the Khatri-Rao
+    product of all the other factors is formed. T must be in C order, so it can be seen as a 3-D array of shape (A, I, B),
+    where A and B are the products of the dimensions at the left and at the right of the mode. The smaller side is
+    contracted last, so the intermediate array has R*I*min(A, B) entries.
+
+    Inputs
+    ------
+    T: float L-D array in C order
+    factors: list of float 2-D arrays
+    l: int
+        The mode, with 0 <= l < L.
+
+    Outputs
+    -------
+    N: float 2-D array
+        Array of shape (dims[l], R).
+    """
+
+    dims = T.shape
+    R = factors[0].shape[1]
+    I = dims[l]
+    A = int(prod(dims[:l]))
+    B = int(prod(dims[l+1:]))
+    N = empty((I, R), dtype=float64)
+
+    if A >= B:
+        # Contract the modes at the left with a single matrix multiplication, then the modes at the right.
+        M_left = khatri_rao_factors(factors[:l])
+        Z = dot(M_left.T, T.reshape(A, I*B))
+        if B == 1:
+            N[:] = Z.T
+        else:
+            M_right = khatri_rao_factors(factors[l+1:])
+            N = crt.mttkrp_right(Z.reshape(R, I, B), M_right.T.copy(), N)
+    else:
+        # Contract the modes at the right with a single matrix multiplication, then the modes at the left.
+        M_right = khatri_rao_factors(factors[l+1:])
+        Y = dot(T.reshape(A*I, B), M_right)
+        if A == 1:
+            N[:] = Y
+        else:
+            M_left = khatri_rao_factors(factors[:l])
+            N = crt.mttkrp_left(Y.reshape(A, I, R), M_left, N)
+
+    return N
 
 
-def compute_error(T, Tsize, S1, U, dims):
+def compute_error(T, Tsize, S1, U, dims, max_bytes=2**27):
     """
     Compute relative error between T and (U_1,...,U_L)*S, where dims is the shape of S. In the case T is sparse, we 
-    should pass S instead of the unfolding S1.
+    should pass S instead of the unfolding S1. If T is out-of-core, it is read in slabs of at most (about) max_bytes 
+    bytes.
     """
 
     # T is sparse.
@@ -328,6 +498,16 @@ def compute_error(T, Tsize, S1, U, dims):
         data, idxs, Tdims = T
         T_compress = sparse_multilin_mult(UT, data, idxs, Tdims)
         error = norm(T_compress - S) / Tsize
+    # T is out-of-core. The approximation is computed by slabs along the first mode, together with the slabs of T.
+    elif aux.is_ooc(T):
+        error = 0.0
+        for idx in aux.ooc_slabs(T.shape, 0, max_bytes):
+            block = np.asarray(T[idx], dtype=float64)
+            U_block = [U[0][idx[0], :]] + U[1:]
+            T_compress = multilin_mult(U_block, S1, dims)
+            error += norm(block - T_compress)**2
+        error = sqrt(error)/Tsize
+
     # T is dense.
     else:
         T_compress = multilin_mult(U, S1, dims)
@@ -336,6 +516,29 @@ def compute_error(T, Tsize, S1, U, dims):
     return error
 
 
+def compressed_error(Tsize, S, S_approx=None, dims=None):
+    """
+    Computes the relative error |T - (U_1,...,U_L)*S_approx| / |T| without constructing any tensor with the dimensions
+    of T. Here S = (U_1^T,...,U_L^T)*T is the core tensor of a truncated MLSVD of T, where the U_l have orthonormal 
+    columns, and S_approx is any tensor with the same shape of S. By orthogonality we have that
+    |T - (U_1,...,U_L)*S_approx|^2 = |T|^2 - |S|^2 + |S - S_approx|^2. If S_approx is None, the error of the MLSVD 
+    itself is computed. Note that the term |T|^2 - |S|^2 is only accurate to about 1e-8 relative to |T|. When the 
+    dimensions dims of T are given and S has the same shape, nothing was truncated, so |T| = |S| and this term is 
+    not computed.
+    """
+
+    if dims is not None and tuple(dims) == S.shape:
+        if S_approx is None:
+            return 0.0
+        return norm(S - S_approx) / Tsize
+
+    error = max(Tsize**2 - norm(S)**2, 0)
+    if S_approx is not None:
+        error += norm(S - S_approx)**2
+
+    return sqrt(error) / Tsize
+
+
 def rank1_terms_list(factors):
     """
     Compute each rank 1 term, as a multidimensional array, of the CPD. Let T be the corresponding the tensor, in
@@ -369,7 +572,7 @@ def rank1_terms_list(factors):
     return rank1_terms
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def rank1(X, Y, Z, m, n, R, k):
     """
     Computes the k-th slice of each rank 1 term of the CPD given by X, Y, Z.  By doing this for all R terms we have a
@@ -19,6 +19,8 @@
  
  - CPD tensor train
  
+ - Tensor train decomposition with adaptive ranks
+ 
  - High performance with parallelism
 
  References
@@ -35,13 +37,13 @@
 
 # Python modules
 import numpy as np
-from numpy import inf, dot, empty, array, nanargmin, log10, arange, prod, ndarray
+from numpy import inf, dot, empty, zeros, array, nanargmin, log10, arange, prod, ndarray
 from numpy.linalg import norm
 import sys
 import time
-from copy import deepcopy
+from copy import copy, deepcopy
+from collections import OrderedDict
 from decimal import Decimal
-import matplotlib.pyplot as plt
 from numba.errors import NumbaDeprecationWarning, NumbaPendingDeprecationWarning, NumbaPerformanceWarning
 import warnings
 
@@ -55,10 +57,10 @@ import TensorFox.Auxiliar as aux
 import TensorFox.Compression as cmpr
 import TensorFox.Conversion as cnv
 import TensorFox.Critical as crt
-import TensorFox.Display as disp
 import TensorFox.GaussNewton as gn
 import TensorFox.Initialization as init
 import TensorFox.MultilinearAlgebra as mlinalg
+import TensorFox.TensorTrain as tt
 
 
 def cpd(T, R, options=False):
@@ -69,8 +71,9 @@ def cpd(T, R, options=False):
 
     Inputs
     ------
-    T: float array
-        Objective tensor in coordinates.
+    T: float array or Tensor
+        Objective tensor in coordinates. It can also be given as a Tensor handle, in which case the norm, the sorted
+        dimensions and the MLSVD's of T computed in previous calls are reused.
     R: int
         The desired rank of the approximating tensor.
     options: class with the following parameters
@@ -87,7 +90,10 @@ def cpd(T, R, options=False):
         tol_mlsvd: float
             Tolerance criterion for the truncation. The idea is to obtain a truncation (U_1,...,U_L)*S such that
             |T - (U_1,...,U_L)*S| / |T| < tol_mlsvd. Default is 1e-16. If tol_mlsvd = -1 the program uses the original 
-        tensor, so the computation of the MLSVD is not performed.
+        tensor, so the computation of the MLSVD is not performed. When tol_mlsvd is not given and method='ttcpd', 
+            the ranks of the tensor train are also truncated at the numerical rank of T, so when R is larger than the
+            rank of T the CPD is computed with this rank and padded with zero columns up to R. When tol_mlsvd is given,
+            the ranks of the tensor train are not truncated.
         trunc_dims: int or list of ints
             Consider a third order tensor T. If trunc_dims is not 0, then it should be a list with three integers
             [R1,R2,R3] such that 1 <= R1 <= m, 1 <= R2 <= n, 1 <= R3 <= p. The compressed tensor will have dimensions
@@ -108,6 +114,11 @@ def cpd(T, R, options=False):
             CPD'd and keep the best, for third order tensor. The parameter trials defines the maximum number of
             times we repeat the computation of each third order CPD. These trials stops when the relative error is
             less than 1e-4 or when the maximum number of trials is reached. Default is trials=1.
+        random_state: int, np.random.RandomState or None
+            Seed or generator of the random choices made by the initialization and by the dGN iterations. Each trial
+            of the tensor train CPD draws its choices from its own generator, derived from random_state and from the
+            index of the trial, so the results do not depend on whether the trials run concurrently. Default is None
+            (the global generator of NumPy).
         display: -2, -1, 0, 1, 2, 3 or 4
             This options is used to control how information about the computations are displayed on the screen. The 
             possible values are -1, 0, 1 (default), 2, 3, 4. Notice that display=3 makes the overall running time large
@@ -124,6 +135,47 @@ def cpd(T, R, options=False):
                 "cleaner" version of display = 4, with less information).
         epochs: int
             Number of Tensor Train CPD cycles. Use only for tensor with order higher than 3. Default is epochs=1.
+        tt_method: str
+            Strategy to compute the third order CPD's of the tensor train cores (method='ttcpd'). With 'chain', each
+            CPD fixes one factor computed from the previous CPD, so the CPD's are computed one after the other. With
+            'parallel', the CPD's are independent and computed concurrently, and their shared factors are matched 
+            afterwards by permutation and scaling. The option epochs is ignored in this case. Default is 'chain'.
+        tt_refine_maxiter: int
+            Maximum number of iterations of a global refinement made after the tensor train CPD (method='ttcpd'). The
+            CPD obtained from the tensor train is used as starting point for dGN (or ALS, if bi_method='als') over
+            the compressed full order tensor, which corrects the errors accumulated along the third order CPD's. 
+            Default is 0 (no global refinement).
+        low_memory: bool
+            If True, the dGN and ALS iterations keep a single copy of the tensor and compute the contractions with it
+            directly, instead of keeping all its unfoldings in memory. This reduces the memory footprint of the
+            iterations from (L+1) times to about one time the size of the tensor, at the cost of some speed. Default
+            is False.
+        max_bytes: int
+            Memory bound, in bytes, for the blocks read from out-of-core tensors (np.memmap or HDF5 datasets). These
+            tensors are compressed by streaming passes over blocks of at most (about) max_bytes bytes, so only one
+            block plus the small matrices of the MLSVD are kept in memory. With tol_mlsvd=-1 and method='ttcpd', the
+            tensor train cores are computed by the same kind of streaming passes. Default is 2**27 (128 MB).
+        mlsvd_max_bytes: int or inf
+            Memory bound, in bytes, for the unfoldings kept at the same time by the concurrent SVD's of the classic 
+            MLSVD (mlsvd_method='classic'). Each unfolding which is not a view of T costs one copy of T, and the number
+            of concurrent SVD's is reduced to respect this bound. Set it to 0 to compute the SVD's sequentially. 
+            Default is inf (one SVD per CPU).
+        hooi_maxiter: int
+            Maximum number of HOOI (higher-order orthogonal iteration) sweeps used to refine the truncated MLSVD in
+            the compression stage. Each sweep can only decrease the compression error, which gives a better
+            compressed tensor for the same size. Default is 0 (no refinement).
+        tucker: list or bool
+            A Tucker decomposition [S, U] of T, with orthonormal U, to be used in the place of the MLSVD in the 
+            compression stage, e.g., the output of the function tucker, which refines the MLSVD with HOOI. The options
+            of the MLSVD are ignored in this case. Default is False (the MLSVD of T is computed).
+        mixed_precision: bool
+            If True, the randomized SVD's of the compression stage (and of the tensor train cores when 
+            method='ttcpd') make all their passes over the unfoldings in float32, which halves the memory traffic,
+            except for a single float64 pass which projects the unfolding onto the final basis. A float32 copy of
+            each unfolding is needed, i.e., half of its memory. The basis is accurate to single precision, so the
+            energy test of the truncation does not verify values of tol_mlsvd smaller than about 1e-6 (the compression
+            error printed with display > 2 is always computed in float64). Only valid for dense tensors. Default is
+            False.
 
     It is not necessary to create 'options' with all parameters described above. Any missing parameter is assigned to
     its default value automatically. For more information about the options, check the Tensor Fox tutorial at
@@ -141,16 +193,24 @@ def cpd(T, R, options=False):
 
     # INITIAL PREPARATIONS
 
+    # The quantities derived from T (norm, sorted dimensions, MLSVD) are obtained from a Tensor handle, which caches them
+    # between calls.
+    if type(T) == Tensor:
+        T_handle = T
+    else:
+        T_handle = Tensor(T)
+    T = T_handle.tensor
+
     # Verify if T is sparse, in which case it will be given as a list with the data.
     if type(T) == list:
-        T_orig = deepcopy(T)
-        T = deepcopy(T_orig)
-        data_orig, idxs_orig, dims_orig = T_orig
+        data_orig, idxs_orig, dims_orig = T
     else:
         dims_orig = T.shape
     L = len(dims_orig)
     
-    # Set options.
+    # Set options. The ranks of the tensor train are truncated at the numerical rank of T only when tol_mlsvd is not
+    # given by the user (see highcpd).
+    tt_tol = 1e-16 if 'tol_mlsvd' not in dir(options) else 0
     options = aux.make_options(options, L)
     method = options.method
     display = options.display
@@ -166,13 +226,13 @@ def cpd(T, R, options=False):
         
     # Verify method.
     if method == 'dGN' or method == 'als':
-        factors, output = tricpd(T, R, options)
+        factors, output = tricpd(T_handle, R, options)
         return factors, output 
     
     # Change ordering of indexes to improve performance if possible.
-    T, ordering = aux.sort_dims(T)
+    T, ordering = T_handle.sort_dims()
+    Tsize = T_handle.norm(options.max_bytes)
     if type(T) == list:
-        Tsize = norm(T[0])
         dims = T[2]
         # If T is sparse, we must use the classic method, and tol_mlsvd is set to the default 1e-16 in the case the
         # user requested -1 or 0.
@@ -180,7 +240,6 @@ def cpd(T, R, options=False):
             options.tol_mlsvd = 1e-16
             tol_mlsvd = 1e-16
     else:
-        Tsize = norm(T)
         dims = T.shape   
 
     # COMPRESSION STAGE
@@ -191,9 +250,9 @@ def cpd(T, R, options=False):
 
     # Compute compressed version of T with the MLSVD. We have that T = (U_1,...,U_L)*S.
     if display > 2 or display < -1:
-        S, U, T1, sigmas, best_error = cmpr.mlsvd(T, Tsize, R, options)
+        S, U, T1, sigmas, best_error = T_handle.mlsvd(R, options)
     else: 
-        S, U, T1, sigmas = cmpr.mlsvd(T, Tsize, R, options)
+        S, U, T1, sigmas = T_handle.mlsvd(R, options)
 
     if display != 0:
         if prod(array(S.shape) == array(dims)):
@@ -210,21 +269,26 @@ def cpd(T, R, options=False):
             print('    Compression relative error = {:7e}'.format(best_error))
         print()
 
-    # Increase dimensions if r > min(S.shape).
-    S_orig_dims = S.shape
-    if R > min(S_orig_dims):
-        inflate_status = True
-        S = cnv.inflate(S, R, S_orig_dims)
-    else:
-        inflate_status = False
-
-    # For higher order tensors the trunc_dims options is only valid for the original tensor and its MLSVD.
+    # For higher order tensors the trunc_dims and tucker options are only valid for the original tensor and its MLSVD.
     options.trunc_dims = 0
+    options.tucker = False
 
     # TENSOR TRAIN AND DAMPED GAUSS-NEWTON STAGE
 
-    factors, outputs = highcpd(S, R, options)
-    factors = cnv.deflate(factors, S_orig_dims, inflate_status)
+    factors, outputs = highcpd(S, R, options, tt_tol)
+
+    # GLOBAL REFINEMENT STAGE
+
+    # The CPD obtained from the tensor train is used as starting point for a few iterations over the full order core S.
+    if options.tt_refine_maxiter > 0 and not aux.is_ooc(S):
+        if display != 0:
+            print()
+            print('===============================================================================================')
+            print('Computing global refinement of solution')
+        factors, refine_output = global_refine(S, factors, R, options)
+        outputs.append(refine_output)
+        if display < 0:
+            print('Global refinement error =', refine_output.rel_error)
 
     # Use the orthogonal transformations to work in the original space.
     for l in range(L):
@@ -233,7 +297,7 @@ def cpd(T, R, options=False):
     # FINAL WORKS
 
     # Compute error.
-    if type(T1) == ndarray:
+    if isinstance(T1, ndarray) and not aux.is_ooc(T1):
         T1_approx = empty(T1.shape)
         T1_approx = cnv.cpd2unfold1(T1_approx, factors)
         rel_error = crt.fastnorm(T1, T1_approx)/Tsize
@@ -241,12 +305,16 @@ def cpd(T, R, options=False):
         # Go back to the original dimension ordering.
         factors = aux.unsort_dims(factors, ordering)
 
-    else:
+    elif type(T) == list:
         # Go back to the original dimension ordering.
         factors = aux.unsort_dims(factors, ordering)
 
         rel_error = crt.sparse_fastnorm(data_orig, idxs_orig, dims_orig, factors)/Tsize
 
+    # T is out-of-core, in which case its dimensions were not sorted.
+    else:
+        rel_error = cnv.residual_norm(T, factors, options.max_bytes)/Tsize
+
     num_steps = 0
     for output in outputs:
         num_steps += output.num_steps
@@ -267,11 +335,17 @@ def cpd(T, R, options=False):
     return factors, final_outputs
 
 
-def highcpd(T, R, options):
+def highcpd(T, R, options, tol=1e-16):
     """
     This function makes the calls in order to compute the tensor train of T and obtain the final CPD from it. It is 
     important to realize that this function is limited to tensor where each one of its factors is a full rank matrix. 
-    In particular, the rank R must be smaller than all dimensions of T.
+    When R is larger than some dimensions of T, the ranks of the tensor train near the ends are smaller than R, and the
+    third order CPD's of these cores have rank deficient factors, which is handled without padding T. 
+    The ranks of the tensor train are truncated with tolerance tol (see cpdtt). The default 1e-16 only discards 
+    singular values at the level of rounding errors, and tol = 0 keeps all the ranks at their maximum. When all the 
+    ranks of the tensor train are smaller than they would be for a generic tensor of rank R, R is larger than the rank
+    of T. In this case the third order CPD's are computed with the largest rank of the tensor train, and the factors 
+    are padded with zero columns afterwards, so a CPD with R terms is still returned (see Conversion.normalize).
     """     
 
     # Create relevant values.
@@ -283,7 +357,17 @@ def highcpd(T, R, options):
     epochs = options.epochs
 
     # Compute cores of the tensor train of T.
-    G = cpdtt(T, R)
+    G = cpdtt(T, R, options.mixed_precision, options.max_bytes, tol)
+
+    # Ranks of the tensor train of T and of a generic tensor of rank R with the same dimensions.
+    tt_ranks = [g.shape[-1] for g in G[:-1]]
+    generic_ranks = [min(R, prod(dims[:l+1]), prod(dims[l+1:])) for l in range(L-1)]
+    R_full = R
+    if max(tt_ranks) < max(generic_ranks):
+        R = max(tt_ranks)
+        if display != 0:
+            print('Rank of the tensor train is smaller than R, the third order CPDs are computed with rank', R)
+            print()
     if display > 2 or display < -1:
         print('===============================================================================================')
         print('SVD Tensor train error = ', aux.tt_error(T, G, dims, L))
@@ -294,7 +378,10 @@ def highcpd(T, R, options):
         print('Total of', L-2, 'third order CPDs to be computed:')
         print('===============================================================================================')
    
-    cpd_list, outputs, best_Z = aux.cpd_cores(G, max_trials, epochs, R, display, options)
+    if options.tt_method == 'parallel':
+        cpd_list, outputs, best_Z = aux.parallel_cpd_cores(G, max_trials, R, display, options)
+    else:
+        cpd_list, outputs, best_Z = aux.cpd_cores(G, max_trials, epochs, R, display, options)
                 
     # Compute of factors of T.
 
@@ -306,6 +393,8 @@ def highcpd(T, R, options):
     B = dot(G[-1].T, best_Z)
     factors.append(B)
     factors = cnv.equalize(factors, R)
+    if R < R_full:
+        factors = [np.hstack((factors[l], zeros((dims[l], R_full - R)))) for l in range(L)]
 
     if display > 2 or display < -1:
         G_approx = [G[0]]
@@ -323,6 +412,53 @@ def highcpd(T, R, options):
     return factors, outputs
 
 
+def global_refine(S, factors, R, options):
+    """
+    Refinement of the CPD computed by highcpd. The factors are used as starting point for options.tt_refine_maxiter 
+    iterations of dGN (or ALS, if bi_method = 'als') over the full order core S, which corrects the errors accumulated
+    along the chain of third order CPD's. The dGN iterations use the memory efficient contractions when 
+    options.low_memory is True.
+
+    Inputs
+    ------
+    S: float array
+        Core tensor of the MLSVD.
+    factors: list of float 2-D arrays
+        Factor matrices computed by highcpd, in the coordinates of S.
+    R: int
+    options: class
+
+    Outputs
+    -------
+    factors: list of float 2-D arrays
+        Refined factor matrices, in the coordinates of S.
+    output: class
+        Output class of the refinement (see Auxiliar.output_info), with the relative error with respect to S.
+    """
+
+    refine_options = copy(options)
+    refine_options.maxiter = options.tt_refine_maxiter
+    refine_options.refine = False
+
+    if options.bi_method_parameters[0] == 'als':
+        factors, step_sizes, errors, improv, gradients, stop = als.als(S, factors, R, refine_options)
+    else:
+        factors, step_sizes, errors, improv, gradients, stop = gn.dGN(S, factors, R, refine_options)
+
+    S1 = cnv.unfold(S, 1)
+    S1_approx = empty(S1.shape)
+    S1_approx = cnv.cpd2unfold1(S1_approx, factors)
+    output = aux.output_info(S1, norm(S), S1_approx,
+                             step_sizes, array([0]),
+                             errors, array([0]),
+                             improv, array([0]),
+                             gradients, array([0]),
+                             stop, 8,
+                             refine_options)
+
+    return factors, output
+
+
 def tricpd(T, R, options):
     """
     Given a tensor T and a rank R, this function computes an approximated CPD of T with rank R. This function is called
@@ -355,10 +491,15 @@ def tricpd(T, R, options):
 
     # INITIALIZE RELEVANT VARIABLES 
 
+    if type(T) == Tensor:
+        T_handle = T
+    else:
+        T_handle = Tensor(T)
+    T = T_handle.tensor
+
     # Verify if T is sparse, in which case it will be given as a list with the data.
     if type(T) == list:
-        T_orig = deepcopy(T)
-        T = deepcopy(T_orig)
+        T_orig = T
         dims_orig = T_orig[2]
     else:
         dims_orig = T.shape
@@ -375,9 +516,9 @@ def tricpd(T, R, options):
         tol_mlsvd = tol_mlsvd[0]
         
     # Change ordering of indexes to improve performance if possible.
-    T, ordering = aux.sort_dims(T)
+    T, ordering = T_handle.sort_dims()
+    Tsize = T_handle.norm(options.max_bytes)
     if type(T) == list:
-        Tsize = norm(T[0])
         dims = T[2]
         # If T is sparse, we must use the classic method, and tol_mlsvd is set to the default 1e-16 in the case the
         # user requested -1 or 0.
@@ -388,7 +529,6 @@ def tricpd(T, R, options):
             else:
                 options.tol_mlsvd = 1e-16
     else:
-        Tsize = norm(T)
         dims = T.shape  
     
     # COMPRESSION STAGE
@@ -399,9 +539,9 @@ def tricpd(T, R, options):
     
     # Compute compressed version of T with the MLSVD. We have that T = (U_1, ..., U_L)*S.
     if display > 2 or display < -1:
-        S, U, T1, sigmas, best_error = cmpr.mlsvd(T, Tsize, R, options)
+        S, U, T1, sigmas, best_error = T_handle.mlsvd(R, options)
     else:
-        S, U, T1, sigmas = cmpr.mlsvd(T, Tsize, R, options)
+        S, U, T1, sigmas = T_handle.mlsvd(R, options)
     dims_cmpr = S.shape
 
     # When the tensor is symmetric we want S to have equal dimensions. 
@@ -463,8 +603,8 @@ def tricpd(T, R, options):
     
     # REFINEMENT STAGE
 
-    # If T is sparse, no refinement is made.
-    if type(T) == list:
+    # If T is sparse or out-of-core, no refinement is made.
+    if type(T) == list or aux.is_ooc(T):
         refine = False
     
     if refine:   
@@ -500,7 +640,7 @@ def tricpd(T, R, options):
     # FINAL WORKS
 
     # Compute error.
-    if type(T1) == ndarray:
+    if isinstance(T1, ndarray) and not aux.is_ooc(T1):
         T1_approx = empty(T1.shape)
         T1_approx = cnv.cpd2unfold1(T1_approx, factors)
 
@@ -518,9 +658,11 @@ def tricpd(T, R, options):
     else:
         # Go back to the original dimension ordering.
         factors = aux.unsort_dims(factors, ordering)
+        if type(T) == list:
+            T = T_orig
 
         # Save and display final informations.
-        output = aux.output_info(T_orig, Tsize, factors,
+        output = aux.output_info(T, Tsize, factors,
                                  step_sizes_main, step_sizes_refine,
                                  errors_main, errors_refine,
                                  improv_main, improv_refine,
@@ -635,8 +777,7 @@ def bicpd(T, R, fixed_factor, options):
                 S_init = cnv.cpd2tens([X, Y[0], Z])
             elif fixed_factor[1] == 2:
                 S_init = cnv.cpd2tens([X, Y, Z[0]])
-            S1_init = cnv.unfold(S_init, 1)
-            init_error = mlinalg.compute_error(T, Tsize, S1_init, [U1, U2, U3], (R1, R2, R3))
+            init_error = mlinalg.compressed_error(Tsize, S, S_init, [U[l].shape[0] for l in range(3)])
             print('    Initial guess relative error = {:5e}'.format(init_error))
     
     # DAMPED GAUSS-NEWTON STAGE 
@@ -731,6 +872,10 @@ def rank(T, options=False, plot=True, trials=3):
         The error |T - T_approx| computed for each rank.    
     """
     
+    # The MLSVD's of T are kept in a Tensor handle and reused between the calls of cpd.
+    if type(T) != Tensor:
+        T = Tensor(T)
+
     # Set options
     dims = array(T.shape)
     L = len(dims)
@@ -797,6 +942,8 @@ def rank(T, options=False, plot=True, trials=3):
     print('|T - T_approx|/|T| =', final_error)
     
     if plot:
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=[14, 4])
         plt.plot(range(1, r+1), error_per_rank, color='blue')
         plt.plot(range(1, r+1), error_per_rank, 's', color='blue')
@@ -827,7 +974,8 @@ def stats(T, R, options=False, num_samples=100):
 
     Inputs
     ------
-    T: float array
+    T: float array or Tensor
+        If a Tensor handle is given, its cache is not used, so the time of each trial includes the compression of T.
     R: int
         The desired rank of the approximating tensor.
     options: class or bool
@@ -836,8 +984,13 @@ def stats(T, R, options=False, num_samples=100):
         Total of CPD's we want to compute to make statistics. Default is 100.
     """
     
+    # The times must include the compression, so the cache of a Tensor handle is not used: each call of cpd receives 
+    # the tensor itself and computes its MLSVD again.
+    if type(T) == Tensor:
+        T = T.tensor
+
     # Compute dimensions and norm of T.
-    dims = T.shape
+    dims = T_dims(T)
     L = len(dims)
 
     # Set options
@@ -870,6 +1023,8 @@ def stats(T, R, options=False, num_samples=100):
      
     # PLOT HISTOGRAMS
 
+    import matplotlib.pyplot as plt
+
     [array, bins, patches] = plt.hist(times, 50)
     plt.xlabel('Seconds')
     plt.ylabel('Quantity')
@@ -891,10 +1046,77 @@ def stats(T, R, options=False, num_samples=100):
     return times, steps, errors
 
 
-def cpdtt(T, R):
+def tucker(T, ranks, options=False):
+    """
+    Computes a Tucker decomposition T ~ (U_1, ..., U_L)*S of T with multilinear rank given by ranks. The decomposition
+    starts with the truncated MLSVD of T, which is refined by HOOI (higher-order orthogonal iteration) sweeps. The MLSVD
+    alone doesn't give the best low multilinear rank approximation, and the HOOI sweeps decrease the error further.
+    The same refinement is used in the compression stage of the cpd function when options.hooi_maxiter > 0. The 
+    output can also be given to cpd directly, with options.tucker = [S, U], in which case the compression stage of cpd
+    uses it in the place of the MLSVD.
+
+    Inputs
+    ------
+    T: float array, list or Tensor
+        Objective tensor in coordinates, sparse (in the form [data, idxs, dims]) or out-of-core (np.memmap or HDF5 
+        dataset).
+    ranks: list of int
+        The desired multilinear rank, with ranks[l] <= T.shape[l].
+    options: class with parameters
+        The relevant parameters are mlsvd_method, max_bytes and hooi_maxiter, as described in the cpd function. Here 
+        the default of hooi_maxiter is 10. If display > 0, the relative error of the decomposition is printed.
+
+    Outputs
+    -------
+    S: float array
+        Core tensor, with shape ranks.
+    U: list of float 2-D arrays
+        Matrices with orthonormal columns, where U[l] has shape (T.shape[l], ranks[l]).
+    rel_error: float
+        Relative error |T - (U_1, ..., U_L)*S| / |T|.
+    """
+
+    if type(T) == Tensor:
+        T_handle = T
+    else:
+        T_handle = Tensor(T)
+    T = T_handle.tensor
+    L = len(ranks)
+
+    # Set options. The MLSVD is computed without truncation by energy, so it has exactly the requested ranks.
+    if 'hooi_maxiter' not in dir(options):
+        hooi_maxiter = 10
+    else:
+        hooi_maxiter = options.hooi_maxiter
+    options = aux.make_options(options, L)
+    options.hooi_maxiter = hooi_maxiter
+    options.trunc_dims = list(ranks)
+    options.tol_mlsvd = 0
+    display = options.display
+    options.display = 0
+
+    Tsize = T_handle.norm(options.max_bytes)
+    S, U, T1, sigmas = cmpr.mlsvd(T, Tsize, max(ranks), options)
+
+    # Since the columns of the U_l are orthonormal, the error is given by the norm of the core.
+    rel_error = np.sqrt(max(Tsize**2 - norm(S)**2, 0)) / Tsize
+    if display > 0:
+        print('Tucker decomposition with multilinear rank', tuple(S.shape))
+        print('    Relative error =', rel_error)
+
+    return S, U, rel_error
+
+
+def cpdtt(T, R, mixed_precision=False, max_bytes=2**27, tol=1e-16):
     """
     Function to compute the tensor train cores of T with specific format to obtain the CPD of T. This tensor train
-    follows the format dims[0] x R -> R x dims[1] x R -> ... -> R x dims[L-2] x R -> R x dims[L-1].
+    follows the format dims[0] x R -> R x dims[1] x R -> ... -> R x dims[L-2] x R -> R x dims[L-1], where each R is
+    replaced by the numerical rank at that position when it is smaller than R. The numerical ranks are obtained by
+    truncating the singular values with the energy criterion of the MLSVD with tolerance tol, and they are also bounded
+    by the dimensions (e.g., dims[0] < R). If mixed_precision is True, the range of each SVD is computed in float32 and
+    the projection onto it in float64. If T is out-of-core (np.memmap or HDF5 dataset), the cores are computed by
+    streaming T in slabs of at most max_bytes bytes, and the intermediate tensors are kept out-of-core while they are
+    larger than max_bytes (see Auxiliar.ooc_tt_core).
     """
 
     # Compute dimensions and norm of T.
@@ -904,15 +1126,23 @@ def cpdtt(T, R):
     # List of cores.
     G = []
     
-    # Compute remaining cores, except for the last one.
-    r1, r2 = 1, R
+    # Compute remaining cores, except for the last one. The ranks of the tensor train are bounded by the dimensions of
+    # the reshaped V, so they are smaller than R near the ends of the train when R > min(dims). Singular values at 
+    # the noise level are not kept, so the ranks are also smaller than R when R is larger than the rank of T.
+    r1 = 1
     V = T
     for l in range(0, L-1):
-        V, g = aux.tt_core(V, dims, r1, r2, l)
-        r1, r2 = R, R
+        r2 = min(R, r1*dims[l], prod(dims[l+1:]))
+        if not aux.is_ooc(V):
+            V, g = aux.tt_core(V, dims, r1, r2, l, mixed_precision, tol=tol)
+        else:
+            V, g = aux.ooc_tt_core(V, dims, r1, r2, l, max_bytes, tol)
+        r1 = g.shape[-1]
         G.append(g)
         
     # Last core.
+    if aux.is_ooc(V):
+        V = array(V)
     G.append(V)
     
     return G
@@ -931,10 +1161,11 @@ def foxit(T, R, options=False, bestof=1):
     """
 
     best_error = inf
-    if type(T) == list:
-        data, idxs, dims = T
-    else:
-        dims = T.shape
+    # The MLSVD's of T are kept in a Tensor handle and reused between the calls of cpd.
+    if type(T) != Tensor:
+        T = Tensor(T)
+
+    dims = T.shape
     L = len(dims)
     options = aux.make_options(options, L)
 
@@ -979,6 +1210,8 @@ def foxit(T, R, options=False, bestof=1):
         print('        method: hybrid strategy')
     print()
 
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=[9, 6])
     if options.refine:
 
@@ -1035,3 +1268,173 @@ def foxit(T, R, options=False, bestof=1):
         plt.show()
 
     return best_factors, best_outputs
+
+
+def warmup(orders=(3,), dtypes=(np.float64,)):
+    """
+    Compiles the Numba kernels used by the cpd function for tensors of the given orders and data types. Since all
+    kernels are compiled with cache=True, the compiled code is saved on disk and reused by the next processes, so it is
+    enough to call this function once after installing or updating Tensor Fox. Short-lived processes (batch workers,
+    the Matlab interface cpd_tfx.py, etc.) can also call it at startup to avoid compilation latency in the first call
+    of cpd.
+
+    Inputs
+    ------
+    orders: list or tuple of ints
+        Orders of the tensors to consider. Default is (3,).
+    dtypes: list or tuple of data types
+        Data types of the tensors to consider. Default is (np.float64,).
+    """
+
+    for L in orders:
+        # Small exact rank 2 tensor. The dimensions are reduced for high orders to keep the tensor small.
+        if L > 8:
+            dims = [3 for l in range(L)]
+        else:
+            dims = [4 for l in range(L)]
+        factors = [np.random.randn(dims[l], 2) for l in range(L)]
+        T_orig = cnv.cpd2tens(factors)
+
+        methods = ['dGN', 'als']
+        if L > 3:
+            methods.append('ttcpd')
+
+        for dtype in dtypes:
+            T = array(T_orig, dtype=dtype)
+            for l in range(L):
+                Tl = cnv.unfold(T, l+1)
+                T = cnv.foldback(T, Tl, l+1)
+                cnv.unfold_C(T, l+1)
+
+            for method in methods:
+                options = aux.make_options(False, L)
+                options.method = method
+                options.maxiter = 5
+                cpd(T, 2, options)
+                if method != 'ttcpd':
+                    options.low_memory = True
+                    cpd(T, 2, options)
+
+    return
+
+
+class Tensor:
+    """
+    Handle for a tensor T (dense, sparse in the form [data, idxs, dims] or out-of-core) which lazily computes and caches
+    the quantities derived from T used by the cpd function: the norm of T, the sorted dimensions, the unfoldings and the
+    MLSVD's, the latter keyed by the truncation settings. The handle can be passed to cpd, rank, stats and foxit in the
+    place of T, so repeated calls with the same tensor don't recompute these quantities. The arrays kept in cache use
+    at most max_bytes bytes, and the least recently used entries are removed when this limit is exceeded.
+
+    Example
+    -------
+    T_handle = tfx.Tensor(T)
+    for R in range(1, 10):
+        factors, output = tfx.cpd(T_handle, R, options)
+    """
+
+    def __init__(self, T, max_bytes=2**30):
+        self.tensor = T
+        if type(T) == list:
+            self.shape = tuple(T[2])
+        else:
+            self.shape = T.shape
+        self.max_bytes = max_bytes
+        self.cache = OrderedDict()
+        self.cache_bytes = 0
+
+    def cached(self, key, compute):
+        """
+        Returns the value associated to key, computing it with the function compute if it is not in the cache.
+        """
+
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key][0]
+
+        value = compute()
+        num_bytes = owned_bytes(value)
+        if num_bytes <= self.max_bytes:
+            self.cache[key] = (value, num_bytes)
+            self.cache_bytes += num_bytes
+            # Remove the least recently used entries until the cache fits in the memory bound.
+            while self.cache_bytes > self.max_bytes:
+                old_key, (old_value, old_bytes) = self.cache.popitem(last=False)
+                self.cache_bytes -= old_bytes
+
+        return value
+
+    def norm(self, max_bytes=2**27):
+        """
+        Frobenius norm of T. The parameter max_bytes is the block size used when T is out-of-core.
+        """
+
+        T = self.tensor
+        if type(T) == list:
+            return self.cached('norm', lambda: norm(T[0]))
+        elif aux.is_ooc(T):
+            return self.cached('norm', lambda: aux.ooc_norm(T, max_bytes))
+        return self.cached('norm', lambda: norm(T))
+
+    def sort_dims(self):
+        """
+        Returns T with its dimensions in decreasing order and the corresponding ordering, as aux.sort_dims. In the sparse
+        case the sorting is made over a copy of T, so the original tensor is not changed.
+        """
+
+        T = self.tensor
+        if type(T) == list:
+            return self.cached('sort_dims', lambda: aux.sort_dims(deepcopy(T)))
+        return self.cached('sort_dims', lambda: aux.sort_dims(T))
+
+    def unfold(self, mode):
+        """
+        Unfolding of T (dense) at the given mode, with 1 <= mode <= L.
+        """
+
+        return self.cached(('unfold', mode), lambda: cnv.unfold(self.tensor, mode))
+
+    def mlsvd(self, R, options):
+        """
+        MLSVD of the sorted tensor, as computed in the cpd function with cmpr.mlsvd. The result depends on the rank only
+        through the truncation min(R, dims[l]) of each mode, so several ranks may share the same MLSVD.
+        """
+
+        T, ordering = self.sort_dims()
+        Tsize = self.norm(options.max_bytes)
+        return_error = options.display > 2 or options.display < -1
+
+        # A Tucker decomposition given by the user replaces the MLSVD.
+        if type(options.tucker) == list:
+            S, U, T1, sigmas, error = cmpr.tucker_compression(T, Tsize, options.tucker[0], options.tucker[1], ordering)
+            if return_error:
+                return S, U, T1, sigmas, error
+            return S, U, T1, sigmas
+
+        key = ('mlsvd', tuple(min(R, d) for d in T_dims(T)), str(options.tol_mlsvd), options.mlsvd_method,
+               str(options.trunc_dims), options.hooi_maxiter, options.mixed_precision, options.gpu, return_error)
+
+        return self.cached(key, lambda: cmpr.mlsvd(T, Tsize, R, options))
+
+
+def T_dims(T):
+    """
+    Dimensions of a tensor given in coordinates or in sparse format.
+    """
+
+    if type(T) == list:
+        return T[2]
+    return T.shape
+
+
+def owned_bytes(value):
+    """
+    Number of bytes of the arrays in value (an array or a tuple of values) which own their memory. Views of other arrays
+    are not counted.
+    """
+
+    if type(value) == tuple or type(value) == list:
+        return sum(owned_bytes(v) for v in value)
+    if isinstance(value, ndarray) and value.base is None:
+        return value.nbytes
+    return 0
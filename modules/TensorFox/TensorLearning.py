@@ -257,7 +257,7 @@ def dot_products(x, W):
     return dot_prods
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def h(W, dot_prods):
     """
     Function to compute the hypothesis function h(x). This is defined by
@@ -302,7 +302,7 @@ def h(W, dot_prods):
     return hx, dhx
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def f(z):
     """
     Non-linear (activation) function f at a point z(we are using the sigmoid function here).
@@ -320,7 +320,7 @@ def f(z):
     return fz
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def df(z):
     """
     Derivative of the non-linear (activation) function f at a point z.
@@ -338,7 +338,7 @@ def df(z):
     return dfz
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def grad(x, y, W, dot_prods, Lambda):
     """
     Let J(W) be the cost function of the problem, and grad(J) be the gradient of J. Then this function constructs
@@ -374,7 +374,7 @@ def grad(x, y, W, dot_prods, Lambda):
     return grad_J
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def compute_grad(x, y, W, dot_prods, hx, dhx, Lambda, L, k, l, i, r):
     """
     Auxiliar function to make inner computations of function grad.
@@ -393,7 +393,7 @@ def compute_grad(x, y, W, dot_prods, hx, dhx, Lambda, L, k, l, i, r):
     return term1 + term2*term3*term4
 
 
-@njit(nogil=True, parallel=True)
+@njit(nogil=True, parallel=True, cache=True)
 def update(alpha, W, grad_J):
     """
     Compute the update stage W = W - alpha*grad_J for the weights in the gradient descent algorithm.
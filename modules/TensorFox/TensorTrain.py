@@ -0,0 +1,214 @@
+"""
+ Tensor Train Module
+ ===================
+ This module is responsible for the tensor train (TT) format of tensors. A tensor T with shape dims[0] x ... x
+ dims[L-1] is represented by a list of cores G = [G_1, ..., G_L], where G_l has shape r_{l-1} x dims[l-1] x r_l and
+ r_0 = r_L = 1, such that T[i_1, ..., i_L] = G_1[:, i_1, :] * ... * G_L[:, i_L, :]. Only the cores are stored, so the
+ memory used is proportional to L * dims * r^2 instead of prod(dims). The function cpdtt of the main module computes a
+ tensor train with a special format used to obtain the CPD, whereas the functions of this module work with general
+ tensor trains, with adaptive ranks.
+
+ References
+ ==========
+
+ - I. V. Oseledets, Tensor-Train Decomposition, SIAM J. Sci. Comput., 33(5), 2295-2317 (2011).
+"""
+
+# Python modules
+import numpy as np
+from numpy import zeros, empty, arange, sqrt, float64
+from numpy.linalg import norm, svd, qr
+
+# Tensor Fox modules
+import TensorFox.Auxiliar as aux
+
+
+def tt_truncation(sigmas, delta, max_rank=None):
+    """
+    Given the singular values sigmas (in decreasing order) of some unfolding, this function computes the smallest rank
+    r such that the discarded singular values satisfy sqrt(sigmas[r]^2 + sigmas[r+1]^2 + ...) <= delta. The rank is
+    also bounded by max_rank, when given. At least one singular value is always kept.
+    """
+
+    # tail[r] is the norm of the singular values discarded when the rank is r.
+    tail = sqrt(np.cumsum(sigmas[::-1]**2)[::-1])
+    r = max(1, int(np.sum(tail > delta)))
+    if max_rank is not None:
+        r = min(r, max_rank)
+
+    return r
+
+
+def tt_svd(T, tol=1e-12, ranks=None):
+    """
+    Computes the tensor train of T with the TT-SVD algorithm, that is, with L-1 sequential truncated SVD's. The ranks
+    are chosen adaptively so that the relative error of the tensor train is at most tol. When ranks is given, the rank
+    r_l is also bounded by ranks[l-1], in which case the error can be bigger than tol.
+
+    Inputs
+    ------
+    T: float array
+    tol: float
+        Relative error tolerance of the tensor train. Each SVD discards at most tol*|T|/sqrt(L-1) of the norm of the
+        unfolding. Default is 1e-12.
+    ranks: list of ints or None
+        Maximum ranks r_1, ..., r_{L-1} of the tensor train. Default is None (no bound).
+
+    Outputs
+    -------
+    G: list of float 3-D arrays
+        G[l] is the (l+1)-th core of the tensor train, with shape r_l x dims[l] x r_{l+1}.
+    """
+
+    dims = T.shape
+    L = len(dims)
+    delta = tol * norm(T) / sqrt(max(L-1, 1))
+
+    G = []
+    r1 = 1
+    V = T
+    for l in range(L-1):
+        V = V.reshape(r1*dims[l], -1)
+        U, sigmas, Vt = svd(V, full_matrices=False)
+        if ranks is None:
+            r2 = tt_truncation(sigmas, delta)
+        else:
+            r2 = tt_truncation(sigmas, delta, ranks[l])
+        G.append(U[:, :r2].reshape(r1, dims[l], r2))
+        V = sigmas[:r2, None] * Vt[:r2, :]
+        r1 = r2
+    G.append(V.reshape(r1, dims[L-1], 1))
+
+    return G
+
+
+def tt_orthogonalize(G):
+    """
+    Right-to-left orthogonalization of the tensor train G. The cores G[1], ..., G[L-1] of the new tensor train are
+    such that their reshapes r_{l-1} x (dims[l-1]*r_l) have orthonormal rows, so all the norm of the tensor is in the
+    first core. The tensor represented is the same, and G is not modified.
+    """
+
+    L = len(G)
+    G = [g.copy() for g in G]
+
+    for l in range(L-1, 0, -1):
+        r1, d, r2 = G[l].shape
+        Q, R = qr(G[l].reshape(r1, d*r2).T)
+        G[l] = Q.T.reshape(-1, d, r2)
+        G[l-1] = np.tensordot(G[l-1], R.T, axes=(2, 0))
+
+    return G
+
+
+def tt_round(G, tol=1e-12, ranks=None):
+    """
+    Rounding of the tensor train G, that is, the ranks of G are reduced so that the relative error of the new tensor
+    train is at most tol (with respect to the norm of the tensor represented by G). The tensor train is first
+    orthogonalized from right to left, then truncated SVD's are computed from left to right. When ranks is given, the
+    rank r_l is also bounded by ranks[l-1]. This is useful after operations which increase the ranks, such as cp2tt.
+    G is not modified.
+    """
+
+    L = len(G)
+    G = tt_orthogonalize(G)
+    delta = tol * norm(G[0]) / sqrt(max(L-1, 1))
+
+    for l in range(L-1):
+        r1, d, r2 = G[l].shape
+        U, sigmas, Vt = svd(G[l].reshape(r1*d, r2), full_matrices=False)
+        if ranks is None:
+            r = tt_truncation(sigmas, delta)
+        else:
+            r = tt_truncation(sigmas, delta, ranks[l])
+        G[l] = U[:, :r].reshape(r1, d, r)
+        G[l+1] = np.tensordot(sigmas[:r, None] * Vt[:r, :], G[l+1], axes=(1, 0))
+
+    return G
+
+
+def tt_ranks(G):
+    """
+    Returns the list of ranks [r_1, ..., r_{L-1}] of the tensor train G.
+    """
+
+    return [g.shape[2] for g in G[:-1]]
+
+
+def tt_inner(G, H):
+    """
+    Computes the inner product <T, S> between the tensors T and S represented by the tensor trains G and H, which must
+    have the same dimensions. No tensor with the size of T is formed: the product is obtained by contracting the cores
+    from left to right, where after the l-th step W has shape r_l(G) x r_l(H).
+    """
+
+    W = np.ones((1, 1), dtype=float64)
+    for g, h in zip(G, H):
+        W = np.einsum('ab,aic,bid->cd', W, g, h, optimize=True)
+
+    return W[0, 0]
+
+
+def tt_norm(G):
+    """
+    Computes the Frobenius norm of the tensor represented by the tensor train G.
+    """
+
+    return sqrt(max(tt_inner(G, G), 0))
+
+
+def tt2dense(G, out=None, max_bytes=2**27):
+    """
+    Computes the dense tensor represented by the tensor train G. The tensor is formed in slabs along the first mode,
+    and the intermediate contractions of each slab have at most (about) max_bytes bytes. If out is given (e.g., a
+    np.memmap with the right shape), the tensor is written on it slab by slab, so the dense tensor never needs to fit
+    in memory.
+
+    Inputs
+    ------
+    G: list of float 3-D arrays
+    out: float array or None
+        Array where the tensor is written. Default is None, in which case a new array is created.
+    max_bytes: int
+        Memory bound for the intermediate arrays of each slab. Default is 2**27 (128 MB).
+
+    Outputs
+    -------
+    out: float array
+        Dense tensor represented by G.
+    """
+
+    dims = tuple(g.shape[1] for g in G)
+    L = len(dims)
+    if out is None:
+        out = empty(dims, dtype=float64)
+
+    # The intermediate arrays of a slab are larger than the slab by a factor of at most the maximum rank.
+    max_rank = max([1] + tt_ranks(G))
+    for idx in aux.ooc_slabs(dims, 0, max(max_bytes // max_rank, 1)):
+        A = G[0][0, idx[0], :]
+        for l in range(1, L):
+            A = np.tensordot(A, G[l], axes=(-1, 0))
+        out[idx] = A[..., 0]
+
+    return out
+
+
+def cp2tt(factors):
+    """
+    Converts the CPD given by the factor matrices [W^(1), ..., W^(L)] to a tensor train with all ranks equal to R. The
+    first and last cores are W^(1) and W^(L)^T, and the middle cores are diagonal in the rank indexes, i.e.,
+    G[l][r, :, r] = W^(l+1)[:, r]. The ranks can be reduced afterwards with tt_round.
+    """
+
+    L = len(factors)
+    R = factors[0].shape[1]
+
+    G = [factors[0].reshape(1, -1, R).copy()]
+    for l in range(1, L-1):
+        g = zeros((R, factors[l].shape[0], R), dtype=float64)
+        g[arange(R), :, arange(R)] = factors[l].T
+        G.append(g)
+    G.append(factors[L-1].T.reshape(R, -1, 1).copy())
+
+    return G
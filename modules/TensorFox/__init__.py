@@ -1,2 +1,10 @@
 # __init__.py
 from .TensorFox import *
+
+
+def __getattr__(name):
+    # The Display module depends on matplotlib, pandas and IPython, so it is only imported when requested.
+    if name == 'disp':
+        import TensorFox.Display as disp
+        return disp
+    raise AttributeError("module 'TensorFox' has no attribute '" + name + "'")
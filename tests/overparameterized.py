@@ -0,0 +1,42 @@
+import numpy as np
+import TensorFox as tfx
+
+
+def create(dims, r):
+    """
+    This function generates a random tensor with shape dims and rank r.
+    """
+
+    T = tfx.aux.gen_rand_tensor(dims, r)[0]
+
+    return T
+
+
+def run(seeds=5):
+    """
+    Regression check of the tensor train CPD when the rank R is larger than the rank r of the tensor. Each case is
+    given by (dims, r, R). The maximum relative error over the seeds must be small, the factors must have R columns
+    and their normalization must be finite.
+    """
+
+    class options:
+        pass
+
+    cases = [((12, 4, 4, 4, 4), 3, 6),
+             ((6, 6, 6, 6), 3, 8),
+             ((10, 10, 10, 10), 3, 4),
+             ((3, 8, 8, 8, 3), 5, 5)]
+
+    for dims, r, R in cases:
+        errors = []
+        for seed in range(seeds):
+            np.random.seed(seed)
+            T = create(dims, r)
+            options.random_state = seed
+            factors, output = tfx.cpd(T, R, options)
+            assert [W.shape for W in factors] == [(d, R) for d in dims]
+            Lambda, factors = tfx.cnv.normalize(factors)
+            assert np.all(np.isfinite(Lambda)) and all(np.all(np.isfinite(W)) for W in factors)
+            errors.append(output.rel_error)
+        print(dims, 'r =', r, 'R =', R, 'max error =', max(errors))
+        assert max(errors) < 1e-6